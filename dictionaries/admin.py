@@ -1,16 +1,82 @@
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
+from django.contrib.admin.views.main import (
+    IS_POPUP_VAR,
+    TO_FIELD_VAR,
+    ChangeList
+)
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import QueryDict
+from django.utils import timezone
 
+from .choices import CachedModelChoiceField
+from .mark_summary import (
+    get_summary_keys,
+    refresh_mark_summaries,
+    refresh_summary_keys,
+    refresh_term_summaries
+)
 from .models import (
     Schedule,
     ScheduleTemplate,
     StudentMark,
+    StudentMarkSummary,
     StudyGroup,
     Subject,
     Term,
 )
+from .pagination import EstimatedCountPaginator
+
+
+# Query parameter of a date bounded changelist listing all dates
+ALL_DATES_VAR = 'all_dates'
+
+
+class DateBoundedChangeList(ChangeList):
+    """
+    ChangeList adding ALL_DATES_VAR to the links without a date of the date
+    hierarchy, such as "All dates", so they are not limited to the current
+    month again.
+    """
+
+    def get_query_string(self, new_params=None, remove=None):
+        query_string = super().get_query_string(new_params, remove)
+        params = QueryDict(query_string[1:], mutable=True)
+        prefix = f'{self.date_hierarchy}__'
+        if not any(key.startswith(prefix) for key in params):
+            params[ALL_DATES_VAR] = '1'
+            return f'?{params.urlencode()}'
+        return query_string
+
+
+class DateBoundedAdminMixin:
+    """
+    Admin changelist of a large table limited to the current month of the
+    date hierarchy until a date, a filter, a search or an ordering is chosen.
+    The links to all dates carry ALL_DATES_VAR to lift the limit.
+
+    The rows are counted with EstimatedCountPaginator and the count of the
+    whole table is not shown, so opening the changelist reads one month of
+    rows instead of the table.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return DateBoundedChangeList
+
+    def changelist_view(self, request, extra_context=None):
+        request.GET = request.GET.copy()
+        if request.GET.pop(ALL_DATES_VAR, None) is None and not (
+            # The lookup popups of the raw ID fields are limited too
+            set(request.GET) - {IS_POPUP_VAR, TO_FIELD_VAR}
+        ):
+            today = timezone.localdate()
+            request.GET[f'{self.date_hierarchy}__year'] = str(today.year)
+            request.GET[f'{self.date_hierarchy}__month'] = str(today.month)
+        return super().changelist_view(request, extra_context)
 
 
 @admin.register(StudyGroup)
@@ -51,6 +117,23 @@ class TermAdmin(admin.ModelAdmin):
     # Add a filter for the active field
     list_filter = ('active',)
 
+    def save_model(self, request, obj, form, change):
+        """
+        Saves the term and, when its dates change, rebuilds the summary rows
+        of the terms overlapping its previous and new dates.
+        """
+        date_ranges = [(obj.date_from, obj.date_to)]
+        if change:
+            if not {'date_from', 'date_to'} & set(form.changed_data):
+                super().save_model(request, obj, form, change)
+                return
+            date_ranges.append(
+                (form.initial['date_from'], form.initial['date_to'])
+            )
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            refresh_term_summaries(date_ranges)
+
 
 @admin.register(Subject)
 class SubjectAdmin(admin.ModelAdmin):
@@ -101,11 +184,12 @@ class ScheduleTemplateAdmin(admin.ModelAdmin):
             kwargs["queryset"] = StudyGroup.active_objects()
         elif db_field.name == "subject":
             kwargs["queryset"] = Subject.active_objects()
+        kwargs["form_class"] = CachedModelChoiceField
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
 @admin.register(Schedule)
-class ScheduleAdmin(admin.ModelAdmin):
+class ScheduleAdmin(DateBoundedAdminMixin, admin.ModelAdmin):
     """
     Admin interface for managing Schedule instances.
 
@@ -113,6 +197,9 @@ class ScheduleAdmin(admin.ModelAdmin):
         list_display (tuple): Fields to display in the list view of
         Schedule instances.
         list_filter (tuple): Fields that can be used to filter the list view.
+        list_select_related (tuple): Relations loaded with the lessons.
+        date_hierarchy (str): The field of the date drill-down.
+        search_fields (tuple): Fields searched in the list view.
     """
 
     # Display the term, study_group, weekday, order_number and subject
@@ -127,16 +214,64 @@ class ScheduleAdmin(admin.ModelAdmin):
     # Add a filter for the weekday field
     list_filter = ('date', 'study_group')
 
+    list_select_related = ('study_group', 'subject')
+    date_hierarchy = 'date'
+    search_fields = ('study_group__name', 'subject__name')
+
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == "study_group":
             kwargs["queryset"] = StudyGroup.active_objects()
         elif db_field.name == "subject":
             kwargs["queryset"] = Subject.active_objects()
+        kwargs["form_class"] = CachedModelChoiceField
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
+    def save_model(self, request, obj, form, change):
+        """
+        Saves the lesson and, when its subject or date change, refreshes the
+        summary rows of its marks before and after the change.
+        """
+        if not change or not {'subject', 'date'} & set(form.changed_data):
+            super().save_model(request, obj, form, change)
+            return
+        marks = list(
+            StudentMark.objects.filter(
+                schedule=obj.pk
+            ).values_list('student_id', 'schedule_id')
+        )
+        with transaction.atomic():
+            previous_keys = get_summary_keys(marks)
+            super().save_model(request, obj, form, change)
+            refresh_mark_summaries(marks, previous_keys)
+
+    def delete_model(self, request, obj):
+        """ Deletes the lesson and refreshes the summary rows of its marks. """
+        with transaction.atomic():
+            previous_keys = get_summary_keys(
+                StudentMark.objects.filter(
+                    schedule=obj
+                ).values_list('student_id', 'schedule_id')
+            )
+            super().delete_model(request, obj)
+            refresh_summary_keys(previous_keys)
+
+    def delete_queryset(self, request, queryset):
+        """
+        Deletes the selected lessons and refreshes the summary rows of their
+        marks.
+        """
+        with transaction.atomic():
+            previous_keys = get_summary_keys(
+                StudentMark.objects.filter(
+                    schedule__in=queryset
+                ).values_list('student_id', 'schedule_id')
+            )
+            super().delete_queryset(request, queryset)
+            refresh_summary_keys(previous_keys)
+
 
 @admin.register(StudentMark)
-class StudentMarkAdmin(admin.ModelAdmin):
+class StudentMarkAdmin(DateBoundedAdminMixin, admin.ModelAdmin):
     """
     Admin interface for managing StudentMark instances.
 
@@ -144,6 +279,12 @@ class StudentMarkAdmin(admin.ModelAdmin):
         list_display (tuple): Fields to display in the list view of
         StudentMark instances.
         list_filter (tuple): Fields that can be used to filter the list view.
+        list_select_related (tuple): Relations loaded with the marks.
+        date_hierarchy (str): The field of the date drill-down.
+        search_fields (tuple): Fields of the student searched in the list
+        view.
+        raw_id_fields (tuple): Foreign keys entered by ID.
+        autocomplete_fields (tuple): Foreign keys chosen by a search.
     """
     list_display = (
         'schedule',
@@ -151,9 +292,79 @@ class StudentMarkAdmin(admin.ModelAdmin):
         'mark',
     )
 
-    list_filter = ('student',)
+    # A filter by student would list every user in the sidebar
+    list_filter = ('schedule__study_group',)
+    search_fields = ('student__username', 'student__last_name')
+
+    list_select_related = (
+        'schedule__study_group',
+        'schedule__subject',
+        'student',
+    )
+    date_hierarchy = 'schedule__date'
+    raw_id_fields = ('schedule',)
+    autocomplete_fields = ('student',)
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == "student":
             kwargs["queryset"] = User.objects.filter(is_active=True)
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def save_model(self, request, obj, form, change):
+        """
+        Saves the student mark and refreshes the summary rows of the previous
+        and the new student and schedule.
+        """
+        marks = [(obj.student_id, obj.schedule_id)]
+        if change:
+            marks.append(
+                (form.initial.get('student'), form.initial.get('schedule'))
+            )
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            refresh_mark_summaries(marks)
+
+    def delete_model(self, request, obj):
+        """ Deletes the student mark and refreshes its summary row. """
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            refresh_mark_summaries([(obj.student_id, obj.schedule_id)])
+
+    def delete_queryset(self, request, queryset):
+        """ Deletes the selected marks and refreshes their summary rows. """
+        with transaction.atomic():
+            marks = list(queryset.values_list('student_id', 'schedule_id'))
+            super().delete_queryset(request, queryset)
+            refresh_mark_summaries(marks)
+
+
+@admin.register(StudentMarkSummary)
+class StudentMarkSummaryAdmin(admin.ModelAdmin):
+    """
+    Read-only admin interface for StudentMarkSummary instances.
+
+    The rows are maintained from student marks and rebuilt with the
+    `rebuild_mark_summary` management command.
+
+    Attributes:
+        list_display (tuple): Fields to display in the list view of
+        StudentMarkSummary instances.
+        list_filter (tuple): Fields that can be used to filter the list view.
+    """
+    list_display = (
+        'term',
+        'student',
+        'subject',
+        'mark_count',
+        'average',
+        'mark_min',
+        'mark_max',
+    )
+
+    list_filter = ('term', 'subject')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
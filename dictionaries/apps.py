@@ -1,6 +1,57 @@
 from django.apps import AppConfig
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete
+)
 
 
 class TermsAndStudyGroupsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dictionaries"
+
+    def ready(self):
+        from django.contrib.auth.models import User
+
+        from . import choices, homework_search, schedule_cache, term_index
+        from .models import (
+            Schedule,
+            ScheduleTemplate,
+            StudentMark,
+            StudyGroup,
+            Subject,
+            Term
+        )
+
+        post_init.connect(
+            schedule_cache.remember_schedule_week, sender=Schedule
+        )
+        post_save.connect(schedule_cache.invalidate_schedule, sender=Schedule)
+        post_delete.connect(
+            schedule_cache.invalidate_schedule, sender=Schedule
+        )
+        post_save.connect(
+            schedule_cache.invalidate_student_mark, sender=StudentMark
+        )
+        post_delete.connect(
+            schedule_cache.invalidate_student_mark, sender=StudentMark
+        )
+        pre_delete.connect(schedule_cache.invalidate_user_marks, sender=User)
+        post_init.connect(
+            schedule_cache.remember_template_cell, sender=ScheduleTemplate
+        )
+        post_save.connect(
+            schedule_cache.invalidate_schedule_template,
+            sender=ScheduleTemplate
+        )
+        post_delete.connect(
+            schedule_cache.invalidate_schedule_template,
+            sender=ScheduleTemplate
+        )
+        post_save.connect(homework_search.index_schedule, sender=Schedule)
+        post_save.connect(term_index.invalidate_terms, sender=Term)
+        post_delete.connect(term_index.invalidate_terms, sender=Term)
+        for model in (Term, StudyGroup, Subject):
+            post_save.connect(choices.invalidate_choices, sender=model)
+            post_delete.connect(choices.invalidate_choices, sender=model)
@@ -0,0 +1,107 @@
+import time
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.forms.models import ModelChoiceIterator
+
+from .schedule_cache import bump_versions_on_commit, get_timeout, get_version
+
+# The rows of the choice lists keyed by the model and the query, with the
+# version of the model they were loaded under and the time they expire at
+_choices = {}
+
+
+def get_choices_version_key(model):
+    """ Returns the cache key of the version counter of a model's choices. """
+    return f"choices:version:{model._meta.label_lower}"
+
+
+def get_cached_rows(queryset):
+    """
+    Returns the rows of a queryset of a reference dictionary, loading them
+    only after a row of the model changed.
+
+    Rows loaded inside a transaction are not kept, as they could include
+    changes that are rolled back. Kept rows are reloaded after the schedule
+    cache timeout even if the version did not change.
+
+    Args:
+        queryset (QuerySet): A queryset of Term, StudyGroup or Subject.
+
+    Returns:
+        list: The model instances in the order of the queryset.
+    """
+    version = get_version(get_choices_version_key(queryset.model))
+    key = (queryset.model._meta.label_lower, queryset.db, str(queryset.query))
+    cached = _choices.get(key)
+    if cached and cached[0] == version and (
+        cached[1] is None or cached[1] > time.monotonic()
+    ):
+        return cached[2]
+    rows = list(queryset)
+    if not connections[queryset.db].in_atomic_block:
+        timeout = get_timeout()
+        expires = None if timeout is None else time.monotonic() + timeout
+        _choices[key] = (version, expires, rows)
+    return rows
+
+
+def invalidate_choices(sender, **kwargs):
+    """ Drops the choices of a model in this process and bumps the version. """
+    label = sender._meta.label_lower
+    for key in [key for key in _choices if key[0] == label]:
+        _choices.pop(key, None)
+    bump_versions_on_commit({get_choices_version_key(sender)})
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """ Iterates over the cached rows instead of running the queryset. """
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in get_cached_rows(self.queryset):
+            yield self.choice(obj)
+
+    def __len__(self):
+        return len(get_cached_rows(self.queryset)) + (
+            1 if self.field.empty_label is not None else 0
+        )
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(
+            get_cached_rows(self.queryset)
+        )
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField rendering and validating the choices from the cached
+    rows of a reference dictionary, so steady-state forms run no queries.
+
+    The rows are invalidated by the save and delete signals of Term,
+    StudyGroup and Subject only, so the field is meant for these models.
+    """
+    iterator = CachedModelChoiceIterator
+
+    def to_python(self, value):
+        """
+        Returns the row of the chosen value.
+
+        Raises:
+            ValidationError: If the value is not one of the rows.
+        """
+        if value in self.empty_values:
+            return None
+        key = self.to_field_name or 'pk'
+        if isinstance(value, self.queryset.model):
+            value = getattr(value, key)
+        for obj in get_cached_rows(self.queryset):
+            if str(getattr(obj, key)) == str(value):
+                return obj
+        raise ValidationError(
+            self.error_messages['invalid_choice'],
+            code='invalid_choice',
+            params={'value': value},
+        )
@@ -0,0 +1,287 @@
+import csv
+import re
+import zipfile
+from itertools import chain
+from xml.sax.saxutils import escape
+
+from .models import Schedule, StudentMark
+
+DEFAULT_CHUNK_SIZE = 2000
+
+CSV_CONTENT_TYPE = 'text/csv'
+XLSX_CONTENT_TYPE = (
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+)
+
+SCHEDULE_HEADER = (
+    'Date', 'Study group', 'Order number', 'Subject', 'Homework'
+)
+STUDENT_MARK_HEADER = (
+    'Date', 'Study group', 'Order number', 'Subject', 'Student', 'Username',
+    'Mark'
+)
+
+# First characters of a text cell that spreadsheets read as a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# Characters that are not allowed in XML documents
+INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+XLSX_PARTS = (
+    (
+        '[Content_Types].xml',
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'content-types">'
+        '<Default Extension="rels" ContentType="application/'
+        'vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    (
+        '_rels/.rels',
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+        '2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    (
+        'xl/_rels/workbook.xml.rels',
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+        '2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/'
+    'main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/'
+    'main"><sheetData>'
+)
+XLSX_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def get_schedule_rows(
+    date_from, date_to, study_group=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """
+    Yields the lessons of the date range as export rows.
+
+    Args:
+        date_from (date): The first date to export.
+        date_to (date): The last date to export.
+        study_group (StudyGroup, optional): Limits the lessons to the study
+        group.
+        chunk_size (int): The number of rows fetched from the database at
+        once.
+
+    Yields:
+        tuple: A row matching `SCHEDULE_HEADER`.
+    """
+    schedules = Schedule.objects.filter(date__range=(date_from, date_to))
+    if study_group:
+        schedules = schedules.filter(study_group=study_group)
+    schedules = schedules.select_related(
+        'study_group', 'subject'
+    ).order_by('date', 'study_group__name', 'order_number')
+
+    for schedule in schedules.iterator(chunk_size=chunk_size):
+        yield (
+            schedule.date,
+            schedule.study_group.name,
+            schedule.order_number,
+            schedule.subject.name,
+            schedule.homework,
+        )
+
+
+def get_student_mark_rows(
+    date_from, date_to, study_group=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """
+    Yields the student marks of the date range as export rows.
+
+    Args:
+        date_from (date): The first date to export.
+        date_to (date): The last date to export.
+        study_group (StudyGroup, optional): Limits the marks to the study
+        group.
+        chunk_size (int): The number of rows fetched from the database at
+        once.
+
+    Yields:
+        tuple: A row matching `STUDENT_MARK_HEADER`.
+    """
+    student_marks = StudentMark.objects.filter(
+        schedule__date__range=(date_from, date_to)
+    )
+    if study_group:
+        student_marks = student_marks.filter(schedule__study_group=study_group)
+    student_marks = student_marks.select_related(
+        'schedule__study_group', 'schedule__subject', 'student'
+    ).order_by(
+        'schedule__date',
+        'schedule__study_group__name',
+        'schedule__order_number',
+        'student__last_name',
+        'student__first_name'
+    )
+
+    for student_mark in student_marks.iterator(chunk_size=chunk_size):
+        schedule = student_mark.schedule
+        yield (
+            schedule.date,
+            schedule.study_group.name,
+            schedule.order_number,
+            schedule.subject.name,
+            student_mark.student.get_full_name(),
+            student_mark.student.username,
+            student_mark.mark,
+        )
+
+
+# Export datasets: name -> (header, row generator)
+EXPORTS = {
+    'schedules': (SCHEDULE_HEADER, get_schedule_rows),
+    'student_marks': (STUDENT_MARK_HEADER, get_student_mark_rows),
+}
+
+
+class StreamBuffer:
+    """
+    A write-only file object that keeps the written data until it is
+    collected, so writers can be turned into generators.
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        """ Stores the written data and returns its length. """
+        self.chunks.append(data)
+        return len(data)
+
+    def flush(self):
+        """ Does nothing; the data is collected with `pop`. """
+
+    def pop(self):
+        """ Returns the data written since the last call. """
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+class Echo:
+    """ A pseudo-buffer for csv.writer that returns each written line. """
+    def write(self, value):
+        """ Returns the written value. """
+        return value
+
+
+def get_csv_cell(value):
+    """
+    Returns a CSV cell, prefixing text that a spreadsheet would run as a
+    formula with an apostrophe.
+
+    Args:
+        value: A number or a value written as text.
+
+    Returns:
+        The value to write.
+    """
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def stream_csv(header, rows):
+    """
+    Streams the rows as CSV lines.
+
+    Args:
+        header (tuple): The column names.
+        rows (iterable): The rows to export.
+
+    Yields:
+        str: One CSV line per row.
+    """
+    writer = csv.writer(Echo())
+    for row in chain([header], rows):
+        yield writer.writerow([get_csv_cell(value) for value in row])
+
+
+def get_xlsx_cell(value):
+    """
+    Returns the SpreadsheetML markup of a cell.
+
+    Args:
+        value: A number or a value written as text.
+
+    Returns:
+        str: The cell markup.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c><v>{value}</v></c>'
+    text = escape(INVALID_XML_CHARS.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def stream_xlsx(header, rows, sheet_name='Export'):
+    """
+    Streams the rows as an XLSX workbook with a single worksheet.
+
+    The workbook is written into a zip archive in streaming mode, so only the
+    current row is kept in memory.
+
+    Args:
+        header (tuple): The column names.
+        rows (iterable): The rows to export.
+        sheet_name (str): The name of the worksheet.
+
+    Yields:
+        bytes: Parts of the XLSX file.
+    """
+    buffer = StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_PARTS:
+            archive.writestr(name, content)
+        archive.writestr(
+            'xl/workbook.xml', XLSX_WORKBOOK.format(name=escape(sheet_name))
+        )
+        with archive.open(
+            'xl/worksheets/sheet1.xml', 'w', force_zip64=True
+        ) as sheet:
+            sheet.write(XLSX_SHEET_HEAD.encode())
+            for row in chain([header], rows):
+                cells = ''.join(get_xlsx_cell(value) for value in row)
+                sheet.write(f'<row>{cells}</row>'.encode())
+                data = buffer.pop()
+                if data:
+                    yield data
+            sheet.write(XLSX_SHEET_TAIL.encode())
+    yield buffer.pop()
+
+
+# File formats: name -> (streaming function, content type)
+FILE_FORMATS = {
+    'csv': (stream_csv, CSV_CONTENT_TYPE),
+    'xlsx': (stream_xlsx, XLSX_CONTENT_TYPE),
+}
@@ -2,6 +2,7 @@ from datetime import timedelta, datetime
 
 from django import forms
 
+from .choices import CachedModelChoiceField
 from .models import (
     Term,
     StudyGroup,
@@ -22,12 +23,12 @@ class ScheduleTemplateFilterForm(forms.Form):
         - study_group: A ModelChoiceField that allows the user to select
         a study group from the active study groups available in the database.
     """
-    term = forms.ModelChoiceField(
+    term = CachedModelChoiceField(
         queryset=Term.active_objects(),
         required=True,
         label="Term"
     )
-    study_group = forms.ModelChoiceField(
+    study_group = CachedModelChoiceField(
         queryset=StudyGroup.active_objects(),
         required=True,
         label="Study Group"
@@ -70,6 +71,11 @@ class ScheduleTemplateForm(forms.ModelForm):
             'study_group_name',
             'weekday_name'
         ]
+        field_classes = {
+            'term': CachedModelChoiceField,
+            'study_group': CachedModelChoiceField,
+            'subject': CachedModelChoiceField,
+        }
 
     def __init__(self, *args, **kwargs):
         """
@@ -85,13 +91,15 @@ class ScheduleTemplateForm(forms.ModelForm):
             weekday_value = self.instance.weekday
 
         if 'term' in self.initial:
-            self.fields['term_name'].initial = Term.objects.get(
-                pk=self.initial['term']
+            self.fields['term_name'].initial = self.fields['term'].to_python(
+                self.initial['term']
             )
 
         if 'study_group' in self.initial:
-            self.fields['study_group_name'].initial = StudyGroup.objects.get(
-                pk=self.initial['study_group']
+            self.fields['study_group_name'].initial = (
+                self.fields['study_group'].to_python(
+                    self.initial['study_group']
+                )
             )
 
         if 'weekday' in self.initial:
@@ -120,7 +128,7 @@ class ScheduleFilterForm(forms.Form):
         required=True,
         label="Week Date"
     )
-    study_group = forms.ModelChoiceField(
+    study_group = CachedModelChoiceField(
         queryset=StudyGroup.active_objects(),
         required=True,
         label="Study Group"
@@ -182,6 +190,288 @@ class ScheduleFilterForm(forms.Form):
             }
 
 
+def clean_date_range(cleaned_data):
+    """
+    Fills the empty dates of a form from the selected term and validates the
+    range.
+
+    Args:
+        cleaned_data (dict): The cleaned data with the 'term', 'date_from'
+        and 'date_to' keys.
+
+    Returns:
+        dict: The cleaned data with both dates.
+
+    Raises:
+        ValidationError: If the date range is not specified or date_from
+        is later than date_to.
+    """
+    term = cleaned_data.get('term')
+    if term:
+        cleaned_data['date_from'] = (
+            cleaned_data.get('date_from') or term.date_from
+        )
+        cleaned_data['date_to'] = (
+            cleaned_data.get('date_to') or term.date_to
+        )
+
+    date_from = cleaned_data.get('date_from')
+    date_to = cleaned_data.get('date_to')
+    if not date_from or not date_to:
+        raise forms.ValidationError(
+            "Select a term or specify the date range."
+        )
+    if date_from > date_to:
+        raise forms.ValidationError(
+            "The start date must not be later than the end date."
+        )
+    return cleaned_data
+
+
+class ScheduleMaterializeForm(forms.Form):
+    """
+    A form to materialize the schedule from templates for a date range.
+
+    Fields:
+        - term: An optional ModelChoiceField. When it is selected, the empty
+        dates are taken from the term.
+        - date_from, date_to (DateField): The date range to materialize.
+        - study_groups: An optional ModelMultipleChoiceField. All active study
+        groups are materialized when it is empty.
+        - overwrite (BooleanField): Overwrite subjects of existing lessons
+        instead of skipping them.
+    """
+    term = CachedModelChoiceField(
+        queryset=Term.active_objects(),
+        required=False,
+        label="Term"
+    )
+    date_from = forms.DateField(
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        required=False,
+        label="Date from"
+    )
+    date_to = forms.DateField(
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        required=False,
+        label="Date to"
+    )
+    study_groups = forms.ModelMultipleChoiceField(
+        queryset=StudyGroup.active_objects(),
+        required=False,
+        label="Study Groups"
+    )
+    overwrite = forms.BooleanField(
+        required=False,
+        label="Overwrite existing lessons"
+    )
+
+    def clean(self):
+        """
+        Fills the empty dates from the selected term and validates the range.
+
+        Raises:
+            ValidationError: If the date range is not specified or date_from
+            is later than date_to.
+        """
+        return clean_date_range(super().clean())
+
+
+class ExportForm(forms.Form):
+    """
+    A form to select the data, the file format and the filters of an export.
+
+    Fields:
+        - dataset (ChoiceField): Schedules or student marks.
+        - file_format (ChoiceField): CSV or XLSX.
+        - term: An optional ModelChoiceField. When it is selected, the empty
+        dates are taken from the term.
+        - date_from, date_to (DateField): The date range to export.
+        - study_group: An optional ModelChoiceField. All study groups are
+        exported when it is empty.
+    """
+    dataset = forms.ChoiceField(
+        choices=[
+            ('schedules', 'Schedules'),
+            ('student_marks', 'Student marks'),
+        ],
+        label="Data"
+    )
+    file_format = forms.ChoiceField(
+        choices=[('csv', 'CSV'), ('xlsx', 'XLSX')],
+        label="File format"
+    )
+    term = CachedModelChoiceField(
+        queryset=Term.objects.all(),
+        required=False,
+        label="Term"
+    )
+    date_from = forms.DateField(
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        required=False,
+        label="Date from"
+    )
+    date_to = forms.DateField(
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        required=False,
+        label="Date to"
+    )
+    study_group = CachedModelChoiceField(
+        queryset=StudyGroup.objects.all(),
+        required=False,
+        label="Study Group"
+    )
+
+    def clean(self):
+        """ Fills the empty dates from the term and validates the range. """
+        return clean_date_range(super().clean())
+
+
+class ImportForm(forms.Form):
+    """
+    A form to upload a CSV file of schedule templates or student marks.
+
+    Fields:
+        - dataset (ChoiceField): Schedule templates or student marks.
+        - file (FileField): The CSV file with a header row.
+    """
+    dataset = forms.ChoiceField(
+        choices=[
+            ('schedule_templates', 'Schedule templates'),
+            ('student_marks', 'Student marks'),
+        ],
+        label="Data"
+    )
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'accept': '.csv'}),
+        label="CSV file"
+    )
+
+
+class GradebookFilterForm(forms.Form):
+    """
+    A form to filter the gradebook by term, study group and subject.
+
+    Fields:
+        - term: A ModelChoiceField with the active terms.
+        - study_group: A ModelChoiceField with the active study groups.
+        - subject: An optional ModelChoiceField with the active subjects.
+    """
+    term = CachedModelChoiceField(
+        queryset=Term.active_objects(),
+        required=True,
+        label="Term"
+    )
+    study_group = CachedModelChoiceField(
+        queryset=StudyGroup.active_objects(),
+        required=True,
+        label="Study Group"
+    )
+    subject = CachedModelChoiceField(
+        queryset=Subject.active_objects(),
+        required=False,
+        label="Subject"
+    )
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the GradebookFilterForm with optional customization for
+        students.
+
+        Args:
+            is_student (bool, optional): Indicates if the form is being used by
+            a student. When True, the 'study_group' field is pre-filled with
+            the student's study group and made read-only.
+            user_study_group (StudyGroup, optional): The study group assigned
+            to the student user, if applicable.
+        """
+        is_student = kwargs.pop('is_student', False)
+        user_study_group = kwargs.pop('user_study_group', '')
+        super().__init__(*args, **kwargs)
+        if is_student:
+            self.fields['study_group'].initial = user_study_group
+            self.fields['study_group'].disabled = True
+
+
+class HomeworkSearchForm(forms.Form):
+    """
+    A form to search the lessons of a study group by homework and subject.
+
+    Fields:
+        - q (CharField): The searched words.
+        - study_group: A ModelChoiceField with the active study groups.
+        - term: An optional ModelChoiceField. When it is selected, the empty
+        dates are taken from the term.
+        - date_from, date_to (DateField): The optional date range. The whole
+        history is searched when no term or dates are selected.
+    """
+    q = forms.CharField(max_length=100, required=True, label="Search")
+    study_group = CachedModelChoiceField(
+        queryset=StudyGroup.active_objects(),
+        required=True,
+        label="Study Group"
+    )
+    term = CachedModelChoiceField(
+        queryset=Term.objects.all(),
+        required=False,
+        label="Term"
+    )
+    date_from = forms.DateField(
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        required=False,
+        label="Date from"
+    )
+    date_to = forms.DateField(
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        required=False,
+        label="Date to"
+    )
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the HomeworkSearchForm with optional customization for
+        students.
+
+        Args:
+            is_student (bool, optional): Indicates if the form is being used by
+            a student. When True, the 'study_group' field is pre-filled with
+            the student's study group and made read-only.
+            user_study_group (StudyGroup, optional): The study group assigned
+            to the student user, if applicable.
+        """
+        is_student = kwargs.pop('is_student', False)
+        user_study_group = kwargs.pop('user_study_group', '')
+        super().__init__(*args, **kwargs)
+        if is_student:
+            self.fields['study_group'].initial = user_study_group
+            self.fields['study_group'].disabled = True
+
+    def clean(self):
+        """
+        Fills the empty dates from the selected term and validates the range.
+
+        Raises:
+            ValidationError: If date_from is later than date_to.
+        """
+        cleaned_data = super().clean()
+        term = cleaned_data.get('term')
+        if term:
+            cleaned_data['date_from'] = (
+                cleaned_data.get('date_from') or term.date_from
+            )
+            cleaned_data['date_to'] = (
+                cleaned_data.get('date_to') or term.date_to
+            )
+
+        date_from = cleaned_data.get('date_from')
+        date_to = cleaned_data.get('date_to')
+        if date_from and date_to and date_from > date_to:
+            raise forms.ValidationError(
+                "The start date must not be later than the end date."
+            )
+        return cleaned_data
+
+
 class ScheduleForm(forms.ModelForm):
     """
     A form for editing Schedule instances with restricted field access.
@@ -224,6 +514,10 @@ class ScheduleForm(forms.ModelForm):
             'weekday_value',
             'date_str'
         ]
+        field_classes = {
+            'study_group': CachedModelChoiceField,
+            'subject': CachedModelChoiceField,
+        }
 
     def __init__(self, *args, **kwargs):
         """
@@ -243,7 +537,9 @@ class ScheduleForm(forms.ModelForm):
 
         if 'study_group' in self.initial and self.initial['study_group']:
             self.fields['study_group_name'].initial = (
-                StudyGroup.objects.get(pk=self.initial['study_group'])
+                self.fields['study_group'].to_python(
+                    self.initial['study_group']
+                )
             )
         if 'date' in self.initial and self.initial['date']:
             date_obj = (
@@ -262,6 +558,75 @@ class ScheduleForm(forms.ModelForm):
 
 
 class StudentMarkForm(forms.ModelForm):
+    """
+    A form to add or edit the mark of a student.
+
+    The student choices can be limited to the students of the lesson's
+    study group, so the choices grow with the group and not with the user
+    table.
+    """
     class Meta:
         model = StudentMark
         fields = ['student', 'mark']
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the StudentMarkForm.
+
+        Args:
+            students (iterable, optional): User instances allowed as the
+            student. All users are allowed when it is not given.
+        """
+        students = kwargs.pop('students', None)
+        super().__init__(*args, **kwargs)
+        if students is not None:
+            field = self.fields['student']
+            field.queryset = field.queryset.filter(
+                pk__in=[student.pk for student in students]
+            )
+
+
+class BulkStudentMarkForm(forms.Form):
+    """
+    A form to enter the marks of all students of a lesson at once.
+
+    One optional mark field named 'mark_<student id>' is added per student.
+    Empty fields leave the student's mark unchanged.
+    """
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the BulkStudentMarkForm with a mark field per student.
+
+        Args:
+            students (iterable): User instances of the study group.
+            student_marks (dict, optional): The current marks keyed by the
+            student ID, used as initial values.
+        """
+        students = kwargs.pop('students', [])
+        student_marks = kwargs.pop('student_marks', {})
+        super().__init__(*args, **kwargs)
+        self.students = {}
+        for student in students:
+            name = f"mark_{student.pk}"
+            self.students[name] = student
+            self.fields[name] = forms.IntegerField(
+                label=student.get_full_name() or student.username,
+                required=False,
+                min_value=0,
+                max_value=100,
+                initial=student_marks.get(student.pk),
+                widget=forms.NumberInput(attrs={'class': 'form-control'})
+            )
+
+    def get_marks(self):
+        """
+        Returns the entered marks.
+
+        Returns:
+            list: A list of (student, mark) tuples for the filled fields.
+        """
+        return [
+            (self.students[name], mark)
+            for name, mark in self.cleaned_data.items()
+            if mark is not None
+        ]
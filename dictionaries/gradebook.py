@@ -0,0 +1,109 @@
+from django.db.models import Count, Q
+
+from .models import StudentMark, StudentMarkSummary
+
+# Mark ranges shown in the distribution of a gradebook row (inclusive).
+MARK_BANDS = (
+    (0, 59),
+    (60, 69),
+    (70, 79),
+    (80, 89),
+    (90, 100),
+)
+
+
+def get_band_name(band):
+    """ Returns the name of the aggregate holding the count of a band. """
+    return f"band_{band[0]}_{band[1]}"
+
+
+def get_gradebook(term, study_group=None, subject=None, student=None):
+    """
+    Summarizes student marks of a term per student and subject.
+
+    The average, count, lowest and highest mark are read from
+    StudentMarkSummary, which is kept up to date when marks, lessons and
+    terms change. Only the distribution of marks over `MARK_BANDS` is
+    counted from StudentMark, with one GROUP BY query that also selects the
+    rows matching the filters. The figures cover all marks of the student
+    in the subject within the term.
+
+    Args:
+        term (Term): The term whose dates limit the schedule.
+        study_group (StudyGroup, optional): Limits marks to the study group.
+        subject (Subject, optional): Limits marks to the subject.
+        student (User, optional): Limits marks to the student.
+
+    Returns:
+        list: A list of dictionaries, one per student and subject, with the
+        keys 'student_name', 'subject', 'average', 'count', 'min', 'max' and
+        'distribution' (a list of (label, count) tuples).
+    """
+    filters = {
+        'schedule__date__range': (term.date_from, term.date_to),
+    }
+    if study_group:
+        filters['schedule__study_group'] = study_group
+    if subject:
+        filters['schedule__subject'] = subject
+    if student:
+        filters['student'] = student
+
+    bands = {
+        get_band_name(band): Count(
+            'id', filter=Q(mark__gte=band[0], mark__lte=band[1])
+        )
+        for band in MARK_BANDS
+    }
+    distributions = {
+        (row['student'], row['schedule__subject']): [
+            (f"{band[0]}-{band[1]}", row[get_band_name(band)])
+            for band in MARK_BANDS
+        ]
+        for row in StudentMark.objects.filter(**filters).values(
+            'student', 'schedule__subject'
+        ).annotate(**bands).order_by()
+    }
+    if not distributions:
+        return []
+
+    summaries = StudentMarkSummary.objects.filter(
+        term=term,
+        student__in={student_id for student_id, _ in distributions},
+        subject__in={subject_id for _, subject_id in distributions},
+    ).values(
+        'student',
+        'student__first_name',
+        'student__last_name',
+        'student__username',
+        'subject',
+        'subject__name',
+        'mark_sum',
+        'mark_count',
+        'mark_min',
+        'mark_max',
+    ).order_by(
+        'student__last_name',
+        'student__first_name',
+        'student',
+        'subject__name'
+    )
+
+    return [
+        {
+            'student': row['student'],
+            'student_name': (
+                f"{row['student__first_name']} "
+                f"{row['student__last_name']}".strip()
+                or row['student__username']
+            ),
+            'subject': row['subject__name'],
+            'average': round(row['mark_sum'] / row['mark_count'], 1),
+            'count': row['mark_count'],
+            'min': row['mark_min'],
+            'max': row['mark_max'],
+            'distribution': distributions[(row['student'], row['subject'])],
+        }
+        for row in summaries
+        if (row['student'], row['subject']) in distributions
+    ]
@@ -0,0 +1,151 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connections
+from django.db.models import Q
+
+from .models import Schedule, ScheduleSearchToken, Subject
+
+WORD = re.compile(r'[^\W_]+')
+MAX_TOKEN_LENGTH = 64
+# The text search configuration without stemming or stop words, so partial
+# words and names are found like in the token index
+SEARCH_CONFIG = 'simple'
+# Upper bound of the tokens starting with a prefix
+MAX_CHAR = '\U0010ffff'
+
+
+def tokenize(text):
+    """
+    Splits a text into lowercased words.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        list: The unique words in the order of their first occurrence.
+    """
+    return list(dict.fromkeys(
+        word.casefold()[:MAX_TOKEN_LENGTH] for word in WORD.findall(text or '')
+    ))
+
+
+def uses_full_text_search(using='default'):
+    """
+    Returns whether the database searches homework with its full-text
+    search instead of the token index.
+
+    Args:
+        using (str): The database alias.
+
+    Returns:
+        bool: True for PostgreSQL.
+    """
+    return connections[using].vendor == 'postgresql'
+
+
+def get_homework_vector():
+    """
+    Returns the full-text search document of the homework. The expression
+    matches the GIN index created by migration 0011, so PostgreSQL uses the
+    index for the searches.
+    """
+    return SearchVector('homework', config=SEARCH_CONFIG)
+
+
+def index_homework(schedules, using='default'):
+    """
+    Replaces the search tokens of lessons with the words of their homework.
+
+    Args:
+        schedules (iterable): The Schedule instances.
+        using (str): The database alias.
+    """
+    schedules = list(schedules)
+    tokens = ScheduleSearchToken.objects.using(using)
+    tokens.filter(
+        schedule__in=[schedule.pk for schedule in schedules]
+    ).delete()
+    tokens.bulk_create([
+        ScheduleSearchToken(schedule_id=schedule.pk, token=token)
+        for schedule in schedules
+        for token in tokenize(schedule.homework)
+    ])
+
+
+def index_schedule(sender, instance, using, update_fields=None, **kwargs):
+    """ Updates the search tokens of a saved lesson. """
+    if uses_full_text_search(using):
+        return
+    if update_fields is not None and 'homework' not in update_fields:
+        return
+    index_homework([instance], using)
+
+
+def get_subject_ids(subjects, word):
+    """
+    Returns the subjects with a word of the name starting with a prefix.
+
+    Args:
+        subjects (list): (subject ID, name tokens) tuples.
+        word (str): The lowercased prefix.
+
+    Returns:
+        list: The IDs of the matching subjects.
+    """
+    return [
+        pk for pk, tokens in subjects
+        if any(token.startswith(word) for token in tokens)
+    ]
+
+
+def search_schedules(query, study_group, date_from=None, date_to=None):
+    """
+    Finds the lessons of a study group by the homework and the subject name.
+
+    Every word of the query must start a word of the homework or of the
+    subject name. PostgreSQL matches the homework with full-text search over
+    the GIN index of the homework documents, other databases with the token
+    index table.
+
+    Args:
+        query (str): The searched words.
+        study_group (StudyGroup): The study group of the lessons.
+        date_from (date, optional): The first date of the lessons.
+        date_to (date, optional): The last date of the lessons.
+
+    Returns:
+        QuerySet: The matching lessons with their subjects, newest first.
+    """
+    schedules = Schedule.objects.filter(study_group=study_group)
+    if date_from:
+        schedules = schedules.filter(date__gte=date_from)
+    if date_to:
+        schedules = schedules.filter(date__lte=date_to)
+
+    words = tokenize(query)
+    if not words:
+        return schedules.none()
+
+    subjects = [
+        (pk, tokenize(name))
+        for pk, name in Subject.objects.values_list('pk', 'name')
+    ]
+    full_text = uses_full_text_search(schedules.db)
+    if full_text:
+        schedules = schedules.annotate(homework_vector=get_homework_vector())
+    for word in words:
+        if full_text:
+            homework = Q(homework_vector=SearchQuery(
+                f"{word}:*", search_type='raw', config=SEARCH_CONFIG
+            ))
+        else:
+            homework = Q(pk__in=ScheduleSearchToken.objects.filter(
+                token__gte=word, token__lt=word + MAX_CHAR
+            ).values('schedule'))
+        schedules = schedules.filter(
+            homework | Q(subject__in=get_subject_ids(subjects, word))
+        )
+    return schedules.select_related('subject').order_by(
+        '-date', 'order_number'
+    )
@@ -0,0 +1,420 @@
+import csv
+import time
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from users.roles import STUDENT_GROUP
+
+from .mark_summary import refresh_mark_summaries
+from .schedule_cache import invalidate_templates, invalidate_weeks
+from .models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term,
+    WeekdayChoices
+)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class ImportResult:
+    """
+    Summary of a CSV import.
+
+    Attributes:
+        imported (int): Number of rows written to the database.
+        errors (list): (line number, message) tuples of the rejected rows.
+        elapsed (float): Duration of the import in seconds.
+    """
+    def __init__(self):
+        self.imported = 0
+        self.errors = []
+        self.elapsed = 0.0
+
+    def __str__(self):
+        """
+        Returns the string representation of the result.
+
+        Returns:
+            str: A formatted string with the numbers of imported and rejected
+            rows and the duration.
+        """
+        return (
+            f"Imported {self.imported} rows, rejected {len(self.errors)} rows "
+            f"in {self.elapsed:.2f}s."
+        )
+
+
+def get_name_lookup(queryset, field='name'):
+    """
+    Loads a case-insensitive name to ID dictionary with one query.
+
+    Args:
+        queryset (QuerySet): The objects to index.
+        field (str): The name field.
+
+    Returns:
+        dict: A dictionary mapping the folded name to the ID.
+    """
+    return {
+        name.casefold(): pk for name, pk in queryset.values_list(field, 'pk')
+    }
+
+
+def parse_int(value, name, min_value, max_value):
+    """
+    Parses an integer column within its limits.
+
+    Args:
+        value (str): The raw value.
+        name (str): The column name used in the error message.
+        min_value (int): The lowest allowed value.
+        max_value (int): The highest allowed value.
+
+    Returns:
+        int: The parsed value.
+
+    Raises:
+        ValueError: If the value is not an integer within the limits.
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number.")
+    if not min_value <= number <= max_value:
+        raise ValueError(
+            f"{name} must be between {min_value} and {max_value}."
+        )
+    return number
+
+
+def lookup(values, value, name):
+    """
+    Resolves a name through a lookup dictionary.
+
+    Args:
+        values (dict): The lookup dictionary with folded keys.
+        value (str): The raw value.
+        name (str): The column name used in the error message.
+
+    Returns:
+        The value found in the dictionary.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    try:
+        return values[(value or '').strip().casefold()]
+    except KeyError:
+        raise ValueError(f"Unknown {name} '{value}'.")
+
+
+class BaseImporter:
+    """
+    Base class of the CSV importers.
+
+    Rows are validated against lookup dictionaries loaded once per import,
+    collected into batches and upserted with chunked `bulk_create` calls
+    inside one transaction. Invalid rows are reported and skipped without
+    aborting the import.
+
+    Attributes:
+        model (Model): The imported model.
+        columns (tuple): The required CSV columns.
+        unique_fields (list): The fields of the unique constraint used to
+        update existing rows.
+        update_fields (list): The fields updated on existing rows.
+    """
+    model = None
+    columns = ()
+    unique_fields = []
+    update_fields = []
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    def load_lookups(self):
+        """ Loads the lookup dictionaries used to resolve names. """
+
+    def prepare_batch(self, rows):
+        """
+        Loads data needed to parse a batch of rows.
+
+        Args:
+            rows (list): (line number, row) tuples of the batch.
+        """
+
+    def finish(self):
+        """ Completes the import after the last batch is written. """
+
+    def parse_row(self, row):
+        """
+        Converts a CSV row into a model instance.
+
+        Args:
+            row (dict): The CSV row.
+
+        Returns:
+            Model: The unsaved instance.
+
+        Raises:
+            ValueError: If the row is invalid.
+        """
+        raise NotImplementedError
+
+    def save_batch(self, instances):
+        """
+        Upserts the instances of a batch with one query.
+
+        Args:
+            instances (list): The valid instances of the batch.
+        """
+        self.model.objects.bulk_create(
+            instances,
+            update_conflicts=True,
+            unique_fields=self.unique_fields,
+            update_fields=self.update_fields
+        )
+
+    def get_key(self, instance):
+        """ Returns the values of the unique fields of an instance. """
+        return tuple(
+            getattr(instance, self.model._meta.get_field(field).attname)
+            for field in self.unique_fields
+        )
+
+    def import_batch(self, rows, result, seen):
+        """
+        Validates a batch of rows and writes the valid ones.
+
+        Args:
+            rows (list): (line number, row) tuples of the batch.
+            result (ImportResult): The result to update.
+            seen (set): Unique keys imported so far, used to reject
+            duplicates within the file.
+        """
+        self.prepare_batch(rows)
+        instances = []
+        for line, row in rows:
+            try:
+                instance = self.parse_row(row)
+            except ValueError as error:
+                result.errors.append((line, str(error)))
+                continue
+            key = self.get_key(instance)
+            if key in seen:
+                result.errors.append((line, "Duplicate row in the file."))
+                continue
+            seen.add(key)
+            instances.append(instance)
+        if instances:
+            self.save_batch(instances)
+            result.imported += len(instances)
+
+    def run(self, lines):
+        """
+        Imports a CSV file.
+
+        Args:
+            lines (iterable): The lines of the CSV file with a header row.
+
+        Returns:
+            ImportResult: The numbers of imported and rejected rows.
+        """
+        result = ImportResult()
+        started = time.perf_counter()
+
+        reader = csv.DictReader(lines)
+        missing = [
+            column for column in self.columns
+            if column not in (reader.fieldnames or [])
+        ]
+        if missing:
+            result.errors.append(
+                (1, f"Missing columns: {', '.join(missing)}.")
+            )
+            return result
+
+        self.load_lookups()
+        seen = set()
+        with transaction.atomic():
+            batch = []
+            for row in reader:
+                batch.append((reader.line_num, row))
+                if len(batch) >= self.batch_size:
+                    self.import_batch(batch, result, seen)
+                    batch = []
+            self.import_batch(batch, result, seen)
+            self.finish()
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+class ScheduleTemplateImporter(BaseImporter):
+    """
+    Imports schedule templates from CSV rows with the columns term,
+    study_group, weekday (name or number), order_number and subject.
+
+    Existing templates of the same cell get the imported subject. Lessons
+    already generated from them are not changed.
+    """
+    model = ScheduleTemplate
+    columns = ('term', 'study_group', 'weekday', 'order_number', 'subject')
+    unique_fields = ['term', 'study_group', 'weekday', 'order_number']
+    update_fields = ['subject', 'updated_at']
+
+    def load_lookups(self):
+        """ Loads terms, study groups, subjects and weekdays. """
+        self.terms = get_name_lookup(Term.objects.all())
+        self.study_groups = get_name_lookup(StudyGroup.objects.all())
+        self.subjects = get_name_lookup(Subject.objects.all())
+        self.weekdays = {}
+        for value, label in WeekdayChoices.choices:
+            self.weekdays[label.casefold()] = value
+            self.weekdays[str(value)] = value
+        self.grids = set()
+
+    def save_batch(self, instances):
+        """ Upserts the templates and collects their cached grids. """
+        super().save_batch(instances)
+        self.grids.update(
+            (instance.term_id, instance.study_group_id)
+            for instance in instances
+        )
+
+    def finish(self):
+        """ Invalidates the cached grids of the imported templates. """
+        invalidate_templates(self.grids)
+
+    def parse_row(self, row):
+        """ Converts a CSV row into a ScheduleTemplate instance. """
+        return ScheduleTemplate(
+            term_id=lookup(self.terms, row['term'], 'term'),
+            study_group_id=lookup(
+                self.study_groups, row['study_group'], 'study group'
+            ),
+            weekday=lookup(self.weekdays, row['weekday'], 'weekday'),
+            order_number=parse_int(
+                row['order_number'], 'Order number', 1, 10
+            ),
+            subject_id=lookup(self.subjects, row['subject'], 'subject')
+        )
+
+
+class StudentMarkImporter(BaseImporter):
+    """
+    Imports student marks from CSV rows with the columns date (YYYY-MM-DD),
+    study_group, order_number, student (username) and mark.
+
+    Marks are attached to existing lessons and replace existing marks of the
+    same student. The students must belong to the study group.
+    """
+    model = StudentMark
+    columns = ('date', 'study_group', 'order_number', 'student', 'mark')
+    unique_fields = ['schedule', 'student']
+    update_fields = ['mark', 'updated_at']
+
+    def load_lookups(self):
+        """ Loads study groups and students with their study groups. """
+        self.study_groups = get_name_lookup(StudyGroup.objects.all())
+        self.students = {
+            username.casefold(): (pk, study_group_id)
+            for username, pk, study_group_id in User.objects.filter(
+                groups__name=STUDENT_GROUP
+            ).values_list('username', 'pk', 'userprofile__study_group')
+        }
+        self.schedules = {}
+        self.marks = set()
+        self.weeks = set()
+
+    def prepare_batch(self, rows):
+        """
+        Loads the lessons of the batch's dates and study groups with one
+        query.
+        """
+        dates = set()
+        study_group_ids = set()
+        for _, row in rows:
+            try:
+                day = date.fromisoformat(row['date'] or '')
+            except ValueError:
+                continue
+            study_group_id = self.study_groups.get(
+                (row['study_group'] or '').strip().casefold()
+            )
+            if study_group_id is not None:
+                dates.add(day)
+                study_group_ids.add(study_group_id)
+        self.schedules = {}
+        if dates:
+            self.schedules = {
+                (study_group_id, day, order_number): pk
+                for pk, study_group_id, day, order_number
+                in Schedule.objects.filter(
+                    date__in=dates, study_group__in=study_group_ids
+                ).order_by().values_list(
+                    'pk', 'study_group_id', 'date', 'order_number'
+                )
+            }
+        self.schedule_weeks = {
+            pk: (study_group_id, day)
+            for (study_group_id, day, _), pk in self.schedules.items()
+        }
+
+    def parse_row(self, row):
+        """ Converts a CSV row into a StudentMark instance. """
+        try:
+            day = date.fromisoformat(row['date'] or '')
+        except ValueError:
+            raise ValueError("Date must be in the YYYY-MM-DD format.")
+        study_group_id = lookup(
+            self.study_groups, row['study_group'], 'study group'
+        )
+        order_number = parse_int(row['order_number'], 'Order number', 1, 10)
+        student_id, student_group_id = lookup(
+            self.students, row['student'], 'student'
+        )
+        if student_group_id != study_group_id:
+            raise ValueError(
+                f"Student '{row['student']}' is not in the study group."
+            )
+        schedule_id = self.schedules.get((study_group_id, day, order_number))
+        if schedule_id is None:
+            raise ValueError("No lesson found for the date and order number.")
+        return StudentMark(
+            schedule_id=schedule_id,
+            student_id=student_id,
+            mark=parse_int(row['mark'], 'Mark', 0, 100)
+        )
+
+    def save_batch(self, instances):
+        """ Upserts the marks and collects them for the summary. """
+        super().save_batch(instances)
+        self.marks.update(
+            (instance.student_id, instance.schedule_id)
+            for instance in instances
+        )
+        self.weeks.update(
+            self.schedule_weeks[instance.schedule_id] for instance in instances
+        )
+
+    def finish(self):
+        """
+        Refreshes the summary rows and the cached weeks of the imported marks
+        once for the whole file.
+        """
+        refresh_mark_summaries(self.marks)
+        invalidate_weeks(self.weeks)
+
+
+# Importers by the imported data
+IMPORTERS = {
+    'schedule_templates': ScheduleTemplateImporter,
+    'student_marks': StudentMarkImporter,
+}
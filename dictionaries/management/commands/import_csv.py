@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from dictionaries.importer import DEFAULT_BATCH_SIZE, IMPORTERS
+
+
+class Command(BaseCommand):
+    """
+    Imports schedule templates or student marks from a CSV file.
+
+    Examples:
+        python manage.py import_csv schedule_templates templates.csv
+        python manage.py import_csv student_marks marks.csv --batch-size 5000
+    """
+    help = "Imports schedule templates or student marks from a CSV file."
+
+    def add_arguments(self, parser):
+        """ Adds the command line arguments. """
+        parser.add_argument(
+            'dataset', choices=sorted(IMPORTERS),
+            help="The imported data."
+        )
+        parser.add_argument('path', help="Path to the CSV file.")
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help="The number of rows validated and written per query."
+        )
+
+    def handle(self, *args, **options):
+        """ Runs the import and reports the result and the errors. """
+        importer = IMPORTERS[options['dataset']](
+            batch_size=options['batch_size']
+        )
+        try:
+            with open(options['path'], newline='', encoding='utf-8-sig') as f:
+                result = importer.run(f)
+        except OSError as error:
+            raise CommandError(f"Cannot read {options['path']}: {error}")
+
+        for line, message in result.errors:
+            self.stderr.write(f"Line {line}: {message}")
+        self.stdout.write(self.style.SUCCESS(str(result)))
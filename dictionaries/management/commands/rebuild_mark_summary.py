@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from dictionaries.mark_summary import (
+    DEFAULT_BATCH_SIZE,
+    rebuild_mark_summaries
+)
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the StudentMarkSummary table from StudentMark entries.
+
+    Example:
+        python manage.py rebuild_mark_summary --batch-size 5000
+    """
+    help = "Rebuilds the per-term student mark summary from scratch."
+
+    def add_arguments(self, parser):
+        """ Adds the command line arguments. """
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help="The number of rows written per query."
+        )
+
+    def handle(self, *args, **options):
+        """ Rebuilds the summary and reports the number of rows. """
+        started = time.perf_counter()
+        created = rebuild_mark_summaries(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created} summary rows in "
+            f"{time.perf_counter() - started:.2f}s."
+        ))
@@ -0,0 +1,212 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+
+from .models import Schedule, StudentMark, StudentMarkSummary, Term
+from .term_index import get_term_index
+
+DEFAULT_BATCH_SIZE = 1000
+SUMMARY_FIELDS = ['mark_sum', 'mark_count', 'mark_min', 'mark_max']
+
+
+def get_summary_keys(marks):
+    """
+    Resolves the summary rows affected by student marks.
+
+    Call it before a change that removes schedules or changes their subject,
+    so the previous rows are refreshed as well.
+
+    Args:
+        marks (iterable): (student_id, schedule_id) tuples.
+
+    Returns:
+        set: A set of (student_id, subject_id, term_id) tuples.
+    """
+    marks = set(marks)
+    if not marks:
+        return set()
+
+    schedules = {
+        pk: (subject_id, day)
+        for pk, subject_id, day in Schedule.objects.filter(
+            pk__in={schedule_id for _, schedule_id in marks}
+        ).order_by().values_list('pk', 'subject_id', 'date')
+    }
+    if not schedules:
+        return set()
+
+    terms = get_term_index().get_terms(day for _, day in schedules.values())
+
+    keys = set()
+    for student_id, schedule_id in marks:
+        if schedule_id not in schedules:
+            continue
+        subject_id, day = schedules[schedule_id]
+        term = terms[day]
+        if term:
+            keys.add((student_id, subject_id, term.pk))
+    return keys
+
+
+def refresh_summary_keys(keys):
+    """
+    Recalculates the summary rows from the student marks of each key.
+
+    Keys are grouped by subject and term and each group is aggregated with
+    one GROUP BY query limited to its students, so the cost depends on the
+    number of changed rows, not on the size of the StudentMark table.
+
+    Args:
+        keys (iterable): (student_id, subject_id, term_id) tuples.
+    """
+    groups = defaultdict(set)
+    for student_id, subject_id, term_id in keys:
+        groups[(subject_id, term_id)].add(student_id)
+    if not groups:
+        return
+
+    terms = Term.objects.in_bulk({term_id for _, term_id in groups})
+    with transaction.atomic():
+        for (subject_id, term_id), student_ids in groups.items():
+            term = terms.get(term_id)
+            if term is None:
+                continue
+            rows = StudentMark.objects.filter(
+                student__in=student_ids,
+                schedule__subject=subject_id,
+                schedule__date__range=(term.date_from, term.date_to)
+            ).values('student').annotate(
+                mark_sum=Sum('mark'),
+                mark_count=Count('id'),
+                mark_min=Min('mark'),
+                mark_max=Max('mark')
+            ).order_by()
+            summaries = [
+                StudentMarkSummary(
+                    student_id=row['student'],
+                    subject_id=subject_id,
+                    term_id=term_id,
+                    mark_sum=row['mark_sum'],
+                    mark_count=row['mark_count'],
+                    mark_min=row['mark_min'],
+                    mark_max=row['mark_max']
+                )
+                for row in rows
+            ]
+            StudentMarkSummary.objects.bulk_create(
+                summaries,
+                update_conflicts=True,
+                unique_fields=['student', 'subject', 'term'],
+                update_fields=SUMMARY_FIELDS
+            )
+            # Students without marks left lose their row
+            StudentMarkSummary.objects.filter(
+                student__in=student_ids - {
+                    summary.student_id for summary in summaries
+                },
+                subject=subject_id,
+                term=term_id
+            ).delete()
+
+
+def refresh_mark_summaries(marks, previous_keys=()):
+    """
+    Refreshes the summary rows affected by changed student marks.
+
+    Args:
+        marks (iterable): (student_id, schedule_id) tuples of the changed
+        marks.
+        previous_keys (iterable, optional): Keys resolved with
+        `get_summary_keys` before the change.
+    """
+    refresh_summary_keys(set(previous_keys) | get_summary_keys(marks))
+
+
+def create_term_summaries(term, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Creates the summary rows of a term from the student marks with one
+    GROUP BY query and chunked bulk inserts.
+
+    Args:
+        term (Term): The term whose rows are created, its previous rows must
+        be deleted.
+        batch_size (int): The number of rows written per query.
+
+    Returns:
+        int: The number of created summary rows.
+    """
+    created = 0
+    rows = StudentMark.objects.filter(
+        schedule__date__range=(term.date_from, term.date_to)
+    ).values('student', 'schedule__subject').annotate(
+        mark_sum=Sum('mark'),
+        mark_count=Count('id'),
+        mark_min=Min('mark'),
+        mark_max=Max('mark')
+    ).order_by()
+    batch = []
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.append(StudentMarkSummary(
+            student_id=row['student'],
+            subject_id=row['schedule__subject'],
+            term=term,
+            mark_sum=row['mark_sum'],
+            mark_count=row['mark_count'],
+            mark_min=row['mark_min'],
+            mark_max=row['mark_max']
+        ))
+        if len(batch) >= batch_size:
+            StudentMarkSummary.objects.bulk_create(batch)
+            created += len(batch)
+            batch = []
+    StudentMarkSummary.objects.bulk_create(batch)
+    return created + len(batch)
+
+
+def refresh_term_summaries(date_ranges, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Rebuilds the summary rows of the terms overlapping date ranges.
+
+    Call it after the dates of a term change, with its previous and new
+    dates, so the marks moved between terms are counted in their new term.
+
+    Args:
+        date_ranges (iterable): (date_from, date_to) tuples.
+        batch_size (int): The number of rows written per query.
+
+    Returns:
+        int: The number of created summary rows.
+    """
+    overlap = Q()
+    for date_from, date_to in date_ranges:
+        overlap |= Q(date_from__lte=date_to, date_to__gte=date_from)
+    if not overlap:
+        return 0
+
+    created = 0
+    with transaction.atomic():
+        terms = list(Term.objects.filter(overlap))
+        StudentMarkSummary.objects.filter(term__in=terms).delete()
+        for term in terms:
+            created += create_term_summaries(term, batch_size)
+    return created
+
+
+def rebuild_mark_summaries(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Rebuilds the whole summary table from the student marks with one
+    GROUP BY query per term and chunked bulk inserts.
+
+    Args:
+        batch_size (int): The number of rows written per query.
+
+    Returns:
+        int: The number of created summary rows.
+    """
+    created = 0
+    with transaction.atomic():
+        StudentMarkSummary.objects.all().delete()
+        for term in Term.objects.order_by('date_from'):
+            created += create_term_summaries(term, batch_size)
+    return created
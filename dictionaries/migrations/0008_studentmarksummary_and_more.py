@@ -0,0 +1,37 @@
+# Generated by Django 4.2.16 on 2026-10-18 02:32
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('dictionaries', '0007_studentmark_studentmark_unique_student_mark_row'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentMarkSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mark_sum', models.PositiveIntegerField(default=0)),
+                ('mark_count', models.PositiveIntegerField(default=0)),
+                ('mark_min', models.PositiveIntegerField(default=0)),
+                ('mark_max', models.PositiveIntegerField(default=0)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionaries.subject')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionaries.term')),
+            ],
+            options={
+                'ordering': ['term', 'student', 'subject'],
+                'indexes': [models.Index(fields=['term', 'subject'], name='summary_term_subject_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='studentmarksummary',
+            constraint=models.UniqueConstraint(fields=('student', 'subject', 'term'), name='unique_student_mark_summary_row'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.16 on 2026-10-18 03:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0009_schedule_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionaries.schedule')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='schedulesearchtoken',
+            constraint=models.UniqueConstraint(fields=('token', 'schedule'), name='unique_schedule_search_token_row'),
+        ),
+    ]
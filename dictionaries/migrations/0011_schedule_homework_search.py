@@ -0,0 +1,78 @@
+import re
+
+from django.db import migrations
+
+# Frozen copies of the tokenizer and the index of dictionaries.homework_search
+# at the time of this migration, so later changes of the module do not change
+# the migration
+WORD = re.compile(r'[^\W_]+')
+MAX_TOKEN_LENGTH = 64
+HOMEWORK_INDEX_NAME = 'schedule_homework_search_idx'
+# The expression of the index matches the search vector of the homework, so
+# PostgreSQL uses the index for the searches
+CREATE_INDEX_SQL = (
+    "CREATE INDEX %(name)s ON %(table)s USING gin "
+    "(to_tsvector('simple'::regconfig, COALESCE((%(column)s)::text, '')))"
+)
+DROP_INDEX_SQL = "DROP INDEX IF EXISTS %(name)s"
+
+
+def tokenize(text):
+    """ Splits a text into its unique lowercased words. """
+    return list(dict.fromkeys(
+        word.casefold()[:MAX_TOKEN_LENGTH] for word in WORD.findall(text or '')
+    ))
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Creates the GIN index of the homework on PostgreSQL and fills the token
+    index on other databases.
+    """
+    Schedule = apps.get_model('dictionaries', 'Schedule')
+    using = schema_editor.connection.alias
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_INDEX_SQL % {
+            'name': schema_editor.quote_name(HOMEWORK_INDEX_NAME),
+            'table': schema_editor.quote_name(Schedule._meta.db_table),
+            'column': schema_editor.quote_name(
+                Schedule._meta.get_field('homework').column
+            ),
+        })
+        return
+
+    ScheduleSearchToken = apps.get_model(
+        'dictionaries', 'ScheduleSearchToken'
+    )
+    schedules = Schedule.objects.using(using).exclude(
+        homework=''
+    ).values_list('pk', 'homework')
+    batch = []
+    for pk, homework in schedules.iterator(chunk_size=1000):
+        batch.extend(
+            ScheduleSearchToken(schedule_id=pk, token=token)
+            for token in tokenize(homework)
+        )
+        if len(batch) >= 1000:
+            ScheduleSearchToken.objects.using(using).bulk_create(batch)
+            batch = []
+    ScheduleSearchToken.objects.using(using).bulk_create(batch)
+
+
+def remove_search_index(apps, schema_editor):
+    """ Removes the GIN index of the homework on PostgreSQL. """
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_INDEX_SQL % {
+            'name': schema_editor.quote_name(HOMEWORK_INDEX_NAME),
+        })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0010_schedulesearchtoken'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, remove_search_index),
+    ]
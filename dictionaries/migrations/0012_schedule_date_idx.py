@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-18 03:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0011_schedule_homework_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['date'], name='schedule_date_idx'),
+        ),
+    ]
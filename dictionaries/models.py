@@ -90,12 +90,15 @@ class Term(models.Model):
                 "The start date must be earlier than the end date."
             )
 
-        # Check for overlapping periods
+        # Check for overlapping periods of the other active terms, the
+        # boundary days of the term may be shared. The database is queried
+        # rather than the term index, which could miss a term just saved by
+        # another process.
         overlapping_terms = Term.objects.filter(
             active=True,  # Check only active terms
             date_from__lt=self.date_to,
             date_to__gt=self.date_from
-        )
+        ).exclude(pk=self.pk)
         if overlapping_terms.exists():
             raise ValidationError(
                 "This term overlaps with an existing term."
@@ -174,6 +177,7 @@ class ScheduleTemplate(models.Model):
         for the day (1-10).
         subject (ForeignKey): The subject associated with the schedule
         template.
+        updated_at (DateTimeField): The time of the last change.
 
     Meta:
         ordering (list): The default ordering of ScheduleTemplate instances
@@ -197,6 +201,7 @@ class ScheduleTemplate(models.Model):
         null=False
     )
     subject = models.ForeignKey(Subject, on_delete=models.CASCADE, null=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
 
@@ -249,13 +254,15 @@ class Schedule(models.Model):
         for the day (1-10).
         subject (ForeignKey): The subject associated with the schedule.
         homework (TextField): The homework for students
+        updated_at (DateTimeField): The time of the last change.
 
     Meta:
         ordering (list): The default ordering of Schedule instances
         is by study_group, date, order_number.
         constraints (list): Unique constraints for the model fields by
         study_group, date, order_number.
-        indexes (list): Indexes for optimizing queries by study group and date.
+        indexes (list): Indexes for optimizing queries by study group and date
+        and by date.
     """
     study_group = models.ForeignKey(
         StudyGroup,
@@ -272,6 +279,7 @@ class Schedule(models.Model):
     )
     subject = models.ForeignKey(Subject, on_delete=models.CASCADE, null=False)
     homework = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
 
@@ -291,6 +299,10 @@ class Schedule(models.Model):
             models.Index(
                 fields=['study_group', 'date'],
                 name='study_group_date_idx'),
+            # Date-bounded lists of all study groups, e.g. in the admin
+            models.Index(
+                fields=['date'],
+                name='schedule_date_idx'),
         ]
 
     def __str__(self):
@@ -318,6 +330,7 @@ class StudentMark(models.Model):
         student (ForeignKey): The student.
         schedule (ForeignKey):The schedule associated with the student's mark.
         mark (PositiveIntegerField): The student's mark (0-100).
+        updated_at (DateTimeField): The time of the last change.
 
     Meta:
         ordering (list): The default ordering of StudentMark instances
@@ -343,6 +356,7 @@ class StudentMark(models.Model):
         ],
         null=False
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
 
@@ -379,3 +393,117 @@ class StudentMark(models.Model):
             f"{self.student} - "
             f"{self.mark}"
         )
+
+
+class StudentMarkSummary(models.Model):
+    """
+    Model representing the summary of a student's marks for a subject within
+    a term. The rows are maintained from StudentMark changes and can be
+    rebuilt with the `rebuild_mark_summary` management command.
+
+    Attributes:
+        student (ForeignKey): The student.
+        subject (ForeignKey): The subject of the marked lessons.
+        term (ForeignKey): The term of the marked lessons.
+        mark_sum (PositiveIntegerField): The sum of the marks.
+        mark_count (PositiveIntegerField): The number of the marks.
+        mark_min (PositiveIntegerField): The lowest mark.
+        mark_max (PositiveIntegerField): The highest mark.
+
+    Meta:
+        ordering (list): The default ordering of StudentMarkSummary instances
+        is by term, student, subject.
+        constraints (list): Unique constraints for the model fields by
+        student, subject, term.
+        indexes (list): Indexes for optimizing queries by term and subject.
+    """
+    student = models.ForeignKey(User, on_delete=models.CASCADE, null=False)
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, null=False)
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, null=False)
+    mark_sum = models.PositiveIntegerField(default=0)
+    mark_count = models.PositiveIntegerField(default=0)
+    mark_min = models.PositiveIntegerField(default=0)
+    mark_max = models.PositiveIntegerField(default=0)
+
+    class Meta:
+
+        ordering = ["term", "student", "subject"]
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    'student',
+                    'subject',
+                    'term'
+                ], name='unique_student_mark_summary_row'
+            ),
+        ]
+
+        indexes = [
+            models.Index(
+                fields=['term', 'subject'],
+                name='summary_term_subject_idx'),
+        ]
+
+    @property
+    def average(self):
+        """Returns the average mark."""
+        return self.mark_sum / self.mark_count if self.mark_count else 0
+
+    def __str__(self):
+        """
+        String representation of the StudentMarkSummary instance.
+
+        Returns:
+            str: A formatted string containing the term, student, subject
+            and the average mark.
+        """
+
+        return (
+            f"{self.term} - "
+            f"{self.student} - "
+            f"{self.subject} - "
+            f"{self.average:.1f}"
+        )
+
+
+class ScheduleSearchToken(models.Model):
+    """
+    Model representing a word of the homework of a lesson. The rows are the
+    homework search index of databases without full-text search and are
+    maintained from Schedule changes.
+
+    Attributes:
+        schedule (ForeignKey): The lesson.
+        token (CharField): The lowercased word.
+
+    Meta:
+        constraints (list): Unique constraints for the model fields by token
+        and schedule, also used to find the lessons of a word or prefix.
+    """
+    schedule = models.ForeignKey(
+        Schedule,
+        on_delete=models.CASCADE,
+        null=False
+    )
+    token = models.CharField(max_length=64, null=False)
+
+    class Meta:
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    'token',
+                    'schedule'
+                ], name='unique_schedule_search_token_row'
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the ScheduleSearchToken instance.
+
+        Returns:
+            str: A formatted string containing the lesson and the word.
+        """
+        return f"{self.schedule_id} - {self.token}"
@@ -0,0 +1,50 @@
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+# Querysets estimated below this number of rows are counted exactly
+EXACT_COUNT_LIMIT = 10000
+
+
+def get_estimated_count(queryset):
+    """
+    Returns the number of rows of a queryset estimated by the query planner.
+
+    Args:
+        queryset (QuerySet): The queryset.
+
+    Returns:
+        int: The estimated number of rows, or None if the database provides
+        no estimate.
+    """
+    if connections[queryset.db].vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    # The driver may return the plan decoded or as text
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator using the planner's row estimate instead of COUNT(*) for
+    large querysets.
+
+    The number of pages of a large changelist is approximate, which is
+    acceptable for browsing. Small querysets and databases without an
+    estimate are counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        """ Returns the estimated or the exact number of objects. """
+        estimate = get_estimated_count(self.object_list)
+        if estimate is not None and estimate >= EXACT_COUNT_LIMIT:
+            return estimate
+        return super().count
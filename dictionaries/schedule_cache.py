@@ -0,0 +1,393 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count, QuerySet
+
+from .models import Schedule, ScheduleTemplate, StudentMark, StudyGroup
+
+DEFAULT_TIMEOUT = 60 * 60
+
+
+def get_cache():
+    """
+    Returns the cache backend of the schedule grids.
+
+    Returns:
+        BaseCache: The backend named by the SCHEDULE_CACHE_ALIAS setting.
+    """
+    return caches[getattr(settings, 'SCHEDULE_CACHE_ALIAS', 'default')]
+
+
+def get_timeout():
+    """
+    Returns the lifetime of cached weeks in seconds.
+
+    Returns:
+        int: The SCHEDULE_CACHE_TIMEOUT setting or one hour.
+    """
+    return getattr(settings, 'SCHEDULE_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+
+
+def get_week_start(day):
+    """
+    Returns the Monday of the week of a date.
+
+    Args:
+        day (date): A date of the week.
+
+    Returns:
+        date: The first day of the week.
+    """
+    return day - timedelta(days=day.weekday())
+
+
+def get_version_key(study_group_id, week_start):
+    """ Returns the cache key of the version counter of a week. """
+    return f"schedule:version:{study_group_id}:{week_start.isoformat()}"
+
+
+def get_template_version_key(term_id, study_group_id):
+    """
+    Returns the cache key of the version counter of the schedule templates
+    of a term and a study group.
+    """
+    return f"schedule_template:version:{term_id}:{study_group_id}"
+
+
+def get_version(key):
+    """
+    Returns the current value of a version counter.
+
+    A missing counter starts from the current time, so a counter lost on
+    eviction never matches entries stored under an earlier value.
+
+    Args:
+        key (str): The cache key of the counter.
+
+    Returns:
+        int: The version included in the keys of the cached entries.
+    """
+    cache = get_cache()
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_versions(keys):
+    """
+    Increments version counters.
+
+    Args:
+        keys (iterable): The cache keys of the counters.
+    """
+    cache = get_cache()
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+def bump_versions_on_commit(keys):
+    """
+    Increments version counters at once and again after the transaction
+    commits, so readers that loaded the data before the commit do not keep
+    it.
+
+    Process-local copies of the data, such as the term index and the choice
+    lists, are dropped by the process making the change. Other processes
+    reload theirs when they see the bumped version, which requires the
+    schedule cache to be shared by all processes (see main.W002). The copies
+    also expire after the schedule cache timeout, which bounds their
+    staleness should a bump be lost with an evicted counter.
+
+    Args:
+        keys (set): The cache keys of the counters.
+    """
+    if not keys:
+        return
+    bump_versions(keys)
+    transaction.on_commit(lambda: bump_versions(keys))
+
+
+def get_week_version(study_group_id, week_start):
+    """
+    Returns the current version of a week of a study group.
+
+    Args:
+        study_group_id (int): The study group.
+        week_start (date): The Monday of the week.
+
+    Returns:
+        int: The version included in the keys of the week's entries.
+    """
+    return get_version(get_version_key(study_group_id, week_start))
+
+
+def invalidate_weeks(keys):
+    """
+    Invalidates the cached weeks containing lessons.
+
+    Args:
+        keys (iterable): (study_group_id, date) tuples of the changed
+        lessons. Dates may also be 'YYYY-MM-DD' strings.
+    """
+    to_date = Schedule._meta.get_field('date').to_python
+    bump_versions_on_commit({
+        get_version_key(study_group_id, get_week_start(to_date(day)))
+        for study_group_id, day in keys
+    })
+
+
+def invalidate_date_range(study_group_ids, date_from, date_to):
+    """
+    Invalidates the cached weeks of study groups within a date range.
+
+    Args:
+        study_group_ids (iterable): The study groups.
+        date_from (date): The first changed date.
+        date_to (date): The last changed date.
+    """
+    week_starts = []
+    week_start = get_week_start(date_from)
+    while week_start <= date_to:
+        week_starts.append(week_start)
+        week_start += timedelta(days=7)
+    invalidate_weeks(
+        (study_group_id, week_start)
+        for study_group_id in study_group_ids
+        for week_start in week_starts
+    )
+
+
+def get_week_schedules(study_group_id, week_start):
+    """
+    Returns the lessons of a week of a study group with their subjects.
+
+    Args:
+        study_group_id (int): The study group.
+        week_start (date): The Monday of the week.
+
+    Returns:
+        list: The Schedule instances of the week.
+    """
+    cache = get_cache()
+    version = get_week_version(study_group_id, week_start)
+    key = f"schedule:week:{study_group_id}:{week_start.isoformat()}:{version}"
+    schedules = cache.get(key)
+    if schedules is None:
+        schedules = list(
+            Schedule.objects.filter(
+                study_group=study_group_id,
+                date__range=(week_start, week_start + timedelta(days=6))
+            ).select_related('subject')
+        )
+        cache.set(key, schedules, get_timeout())
+    return schedules
+
+
+def get_week_marks(study_group_id, week_start, schedules, student=None):
+    """
+    Returns the marks of the lessons of a week.
+
+    Tutors share one entry with the number of marks per lesson, students get
+    an overlay entry with their own marks.
+
+    Args:
+        study_group_id (int): The study group.
+        week_start (date): The Monday of the week.
+        schedules (list): The Schedule instances of the week.
+        student (User, optional): The student whose marks are returned.
+
+    Returns:
+        dict: A dictionary keyed by schedule ID with the student's mark or
+        the number of marks.
+    """
+    if not schedules:
+        return {}
+
+    cache = get_cache()
+    version = get_week_version(study_group_id, week_start)
+    key = (
+        f"schedule:marks:{study_group_id}:{week_start.isoformat()}:{version}:"
+        f"{student.pk if student else 'count'}"
+    )
+    marks = cache.get(key)
+    if marks is None:
+        student_marks = StudentMark.objects.filter(
+            schedule__in=[schedule.id for schedule in schedules]
+        ).order_by()
+        if student:
+            marks = dict(
+                student_marks.filter(
+                    student=student
+                ).values_list('schedule', 'mark')
+            )
+        else:
+            marks = dict(
+                student_marks.values('schedule').annotate(
+                    marks=Count('id')
+                ).values_list('schedule', 'marks')
+            )
+        cache.set(key, marks, get_timeout())
+    return marks
+
+
+def invalidate_templates(keys):
+    """
+    Invalidates the cached schedule templates of terms and study groups.
+
+    Args:
+        keys (iterable): (term_id, study_group_id) tuples of the changed
+        templates.
+    """
+    bump_versions_on_commit({
+        get_template_version_key(term_id, study_group_id)
+        for term_id, study_group_id in keys
+    })
+
+
+def get_term_templates(term_id, study_group_id):
+    """
+    Returns the schedule templates of a term and a study group with their
+    subjects.
+
+    Args:
+        term_id (int): The term.
+        study_group_id (int): The study group.
+
+    Returns:
+        list: ScheduleTemplate instances ordered by weekday and order number.
+    """
+    cache = get_cache()
+    version = get_version(get_template_version_key(term_id, study_group_id))
+    key = f"schedule_template:grid:{term_id}:{study_group_id}:{version}"
+    templates = cache.get(key)
+    if templates is None:
+        templates = list(
+            ScheduleTemplate.objects.filter(
+                term=term_id, study_group=study_group_id
+            ).select_related('subject').order_by('weekday', 'order_number')
+        )
+        cache.set(key, templates, get_timeout())
+    return templates
+
+
+def get_schedule_week(instance):
+    """
+    Returns the study group and the date of a lesson without loading
+    deferred fields.
+
+    Args:
+        instance (Schedule): The lesson.
+
+    Returns:
+        tuple: (study_group_id, date) or None if they are not loaded.
+    """
+    study_group_id = instance.__dict__.get('study_group_id')
+    day = instance.__dict__.get('date')
+    if study_group_id is None or day is None:
+        return None
+    return study_group_id, day
+
+
+def remember_schedule_week(sender, instance, **kwargs):
+    """
+    Stores the week a lesson was loaded with, so moving the lesson
+    invalidates the previous week as well.
+    """
+    instance._loaded_week = get_schedule_week(instance)
+
+
+def invalidate_schedule(sender, instance, **kwargs):
+    """ Invalidates the weeks of a saved or deleted lesson. """
+    keys = {
+        get_schedule_week(instance), getattr(instance, '_loaded_week', None)
+    }
+    keys.discard(None)
+    invalidate_weeks(keys)
+    instance._loaded_week = get_schedule_week(instance)
+
+
+def get_origin_model(origin):
+    """
+    Returns the model of the object or queryset a deletion started from.
+
+    Args:
+        origin: The origin argument of the post_delete signal.
+
+    Returns:
+        type: The model or None for saves.
+    """
+    if origin is None:
+        return None
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+def invalidate_student_mark(sender, instance, origin=None, **kwargs):
+    """
+    Invalidates the week of the lesson of a saved or deleted mark.
+
+    Marks deleted with their lesson, study group or student are skipped, as
+    the lessons and invalidate_user_marks invalidate their weeks without a
+    query per mark.
+    """
+    if get_origin_model(origin) in (Schedule, StudyGroup, User):
+        return
+    try:
+        schedule = instance.schedule
+    except Schedule.DoesNotExist:
+        return
+    invalidate_weeks([(schedule.study_group_id, schedule.date)])
+
+
+def invalidate_user_marks(sender, instance, **kwargs):
+    """ Invalidates the weeks of the marks of a user to be deleted. """
+    invalidate_weeks(
+        Schedule.objects.filter(
+            studentmark__student=instance
+        ).values_list('study_group_id', 'date').distinct()
+    )
+
+
+def get_template_cell(instance):
+    """
+    Returns the term and the study group of a schedule template without
+    loading deferred fields.
+
+    Args:
+        instance (ScheduleTemplate): The schedule template.
+
+    Returns:
+        tuple: (term_id, study_group_id) or None if they are not loaded.
+    """
+    term_id = instance.__dict__.get('term_id')
+    study_group_id = instance.__dict__.get('study_group_id')
+    if term_id is None or study_group_id is None:
+        return None
+    return term_id, study_group_id
+
+
+def remember_template_cell(sender, instance, **kwargs):
+    """
+    Stores the term and the study group a schedule template was loaded with,
+    so moving the template invalidates the previous grid as well.
+    """
+    instance._loaded_cell = get_template_cell(instance)
+
+
+def invalidate_schedule_template(sender, instance, **kwargs):
+    """ Invalidates the grids of a saved or deleted schedule template. """
+    keys = {
+        get_template_cell(instance), getattr(instance, '_loaded_cell', None)
+    }
+    keys.discard(None)
+    invalidate_templates(keys)
+    instance._loaded_cell = get_template_cell(instance)
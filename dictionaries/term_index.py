@@ -0,0 +1,119 @@
+import time
+from bisect import bisect_right
+from itertools import accumulate
+
+from django.db import connection
+from django.utils.functional import cached_property
+
+from .models import Term
+from .schedule_cache import bump_versions_on_commit, get_timeout, get_version
+
+TERM_VERSION_KEY = 'term:version'
+
+
+class TermIndex:
+    """
+    Interval index of terms resolving dates without queries.
+
+    The terms are sorted by their start date and looked up with bisect.
+    Inactive terms are not checked for overlaps, so the running maximum of
+    the end dates bounds the scan of the terms starting before a date.
+
+    Attributes:
+        terms (list): Term instances ordered by date_from.
+    """
+    def __init__(self, terms):
+        self.terms = sorted(terms, key=lambda term: term.date_from)
+        self.starts = [term.date_from for term in self.terms]
+        self.max_ends = list(accumulate(
+            (term.date_to for term in self.terms), max
+        ))
+
+    def get_overlapping(self, date_from, date_to):
+        """
+        Returns the terms overlapping a date range.
+
+        Args:
+            date_from (date): The first date of the range.
+            date_to (date): The last date of the range.
+
+        Returns:
+            list: Term instances ordered by date_from.
+        """
+        terms = []
+        position = bisect_right(self.starts, date_to) - 1
+        while position >= 0 and self.max_ends[position] >= date_from:
+            if self.terms[position].date_to >= date_from:
+                terms.append(self.terms[position])
+            position -= 1
+        terms.reverse()
+        return terms
+
+    def get_term(self, day):
+        """
+        Returns the term containing a date.
+
+        Args:
+            day (date): The date to look up.
+
+        Returns:
+            Term: The earliest starting term containing the date or None.
+        """
+        terms = self.get_overlapping(day, day)
+        return terms[0] if terms else None
+
+    def get_terms(self, days):
+        """
+        Resolves the terms of many dates at once.
+
+        Args:
+            days (iterable): The dates to look up.
+
+        Returns:
+            dict: The term containing each date or None, keyed by the date.
+        """
+        return {day: self.get_term(day) for day in set(days)}
+
+    @cached_property
+    def active(self):
+        """ Returns the index of the active terms. """
+        return TermIndex(term for term in self.terms if term.active)
+
+
+# The index of all terms keyed by the version it was loaded under, with the
+# time it expires at
+_term_index = {}
+
+
+def get_term_index(active=False):
+    """
+    Returns the index of the terms, loading it only after a term changed.
+
+    An index loaded inside a transaction is not kept, as it could hold
+    terms that are rolled back. A kept index is reloaded after the schedule
+    cache timeout even if the version did not change.
+
+    Args:
+        active (bool): Return the index of the active terms only.
+
+    Returns:
+        TermIndex: The index of the terms.
+    """
+    version = get_version(TERM_VERSION_KEY)
+    cached = _term_index.get(version)
+    if cached and (cached[0] is None or cached[0] > time.monotonic()):
+        index = cached[1]
+    else:
+        index = TermIndex(Term.objects.all())
+        if not connection.in_atomic_block:
+            timeout = get_timeout()
+            expires = None if timeout is None else time.monotonic() + timeout
+            _term_index.clear()
+            _term_index[version] = (expires, index)
+    return index.active if active else index
+
+
+def invalidate_terms(sender, **kwargs):
+    """ Drops the term index of this process and bumps its version. """
+    _term_index.clear()
+    bump_versions_on_commit({TERM_VERSION_KEY})
@@ -1,15 +1,21 @@
 from datetime import date
 
 from django.contrib.admin import AdminSite
+from django.contrib.admin.widgets import (
+    AutocompleteSelect,
+    ForeignKeyRawIdWidget
+)
 from django.contrib.auth.models import User, Group
 from django.test import TestCase, Client
 from django.urls import reverse
+from django.utils import timezone
 
 from dictionaries.admin import (
     ScheduleTemplateAdmin,
     ScheduleAdmin,
     StudentMarkAdmin
 )
+from dictionaries.choices import CachedModelChoiceField
 from dictionaries.models import (
     StudyGroup,
     Term,
@@ -18,6 +24,10 @@ from dictionaries.models import (
     Schedule,
     StudentMark
 )
+from dictionaries.pagination import (
+    EstimatedCountPaginator,
+    get_estimated_count
+)
 
 
 class TestAdminSite(AdminSite):
@@ -287,6 +297,20 @@ class AdminTests(TestCase):
         self.assertIn(self.subject, subjects)
         self.assertNotIn(self.inactive_subject, subjects)
 
+    def test_foreign_keys_use_cached_choices(self):
+        """
+        Test that the dictionary foreign keys of the templates and lessons
+        choose from the cached choice lists.
+        """
+        for model_admin, model in (
+            (self.schedule_template_admin, ScheduleTemplate),
+            (self.schedule_admin, Schedule),
+        ):
+            formfield = model_admin.formfield_for_foreignkey(
+                model._meta.get_field('subject'), None
+            )
+            self.assertIsInstance(formfield, CachedModelChoiceField)
+
     def test_study_group_foreign_key_filter(self):
         """
         Test that the queryset for the 'study_group' foreign key includes only
@@ -328,3 +352,124 @@ class AdminTests(TestCase):
 
         self.assertIn(self.active_user, students)
         self.assertNotIn(self.inactive_user, students)
+
+
+class DateBoundedAdminTests(TestCase):
+    """
+    Test the changelists of the lessons and the student marks limited to the
+    current month.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create a superuser, a lesson of the current month with marks of
+        several students and a lesson of a past year.
+        """
+        cls.superuser = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='password'
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.subject = Subject.objects.create(name="subject1")
+        cls.current = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=timezone.localdate(),
+            order_number=1,
+            subject=cls.subject
+        )
+        cls.past = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2020, 4, 1),
+            order_number=1,
+            subject=cls.subject
+        )
+        for number in range(8):
+            student = User.objects.create_user(username=f"student{number}")
+            StudentMark.objects.create(
+                schedule=cls.current, student=student, mark=80
+            )
+        StudentMark.objects.create(
+            schedule=cls.past, student=student, mark=70
+        )
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def test_schedule_changelist_defaults_to_current_month(self):
+        """
+        Test that the lesson changelist without parameters lists the lessons
+        of the current month only.
+        """
+        url = reverse('admin:dictionaries_schedule_changelist')
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(response.context['cl'].result_list), [self.current]
+        )
+
+        response = self.client.get(url, {'date__year': 2020})
+        self.assertEqual(list(response.context['cl'].result_list), [self.past])
+
+    def test_schedule_changelist_lists_all_dates(self):
+        """
+        Test that the "All dates" link of the date hierarchy lists the
+        lessons of every date.
+        """
+        url = reverse('admin:dictionaries_schedule_changelist')
+        response = self.client.get(url, {'date__year': 2020})
+        all_dates = response.context['cl'].get_query_string(
+            remove=['date__year']
+        )
+
+        response = self.client.get(url + all_dates)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.context['cl'].result_list), {self.current, self.past}
+        )
+
+    def test_student_mark_changelist_loads_relations_once(self):
+        """
+        Test that the student mark changelist loads the lessons and students
+        with the marks instead of a query per row.
+        """
+        url = reverse('admin:dictionaries_studentmark_changelist')
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['cl'].result_list), 8)
+
+        response = self.client.get(url, {'q': 'student7'})
+        self.assertEqual(len(response.context['cl'].result_list), 2)
+
+    def test_student_mark_form_widgets(self):
+        """
+        Test that the lesson and the student of a mark are not rendered as
+        select boxes listing every row.
+        """
+        response = self.client.get(
+            reverse('admin:dictionaries_studentmark_add')
+        )
+
+        form = response.context['adminform'].form
+        self.assertIsInstance(
+            form.fields['schedule'].widget, ForeignKeyRawIdWidget
+        )
+        self.assertIsInstance(
+            form.fields['student'].widget.widget, AutocompleteSelect
+        )
+
+    def test_paginator_counts_exactly_without_estimate(self):
+        """
+        Test that the paginator counts the rows when the database has no
+        row estimate.
+        """
+        marks = StudentMark.objects.all()
+
+        self.assertIsNone(get_estimated_count(marks))
+        self.assertEqual(EstimatedCountPaginator(marks, 5).count, 9)
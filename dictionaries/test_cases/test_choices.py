@@ -0,0 +1,138 @@
+from datetime import date
+
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+
+from dictionaries import choices
+from dictionaries.forms import (
+    ScheduleForm,
+    ScheduleTemplateFilterForm,
+    ScheduleTemplateForm
+)
+from dictionaries.models import StudyGroup, Subject, Term
+from dictionaries.schedule_cache import get_cache
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'choices-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedChoicesTests(TransactionTestCase):
+    """ Test suite for the cached choice lists of the dictionary forms. """
+
+    def setUp(self):
+        """
+        Sets up an active and an inactive term, study group and subject
+        without cached choices.
+        """
+        get_cache().clear()
+        choices._choices.clear()
+        self.term = Term.objects.create(
+            name="Autumn",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        Term.objects.create(
+            name="Old",
+            date_from=date(2023, 9, 1),
+            date_to=date(2023, 12, 31),
+            active=False
+        )
+        self.study_group = StudyGroup.objects.create(name="Group A")
+        StudyGroup.objects.create(name="Group Z", active=False)
+        self.subject = Subject.objects.create(name="Math")
+
+    def tearDown(self):
+        """ Drops the choices of the flushed rows. """
+        choices._choices.clear()
+
+    def test_filter_form_renders_without_queries(self):
+        """
+        Test that a filter form renders and validates from the cached
+        choices once they are loaded.
+        """
+        str(ScheduleTemplateFilterForm())
+
+        with self.assertNumQueries(0):
+            html = str(ScheduleTemplateFilterForm())
+            form = ScheduleTemplateFilterForm(data={
+                'term': self.term.pk, 'study_group': self.study_group.pk
+            })
+            self.assertTrue(form.is_valid())
+
+        self.assertIn("Autumn", html)
+        self.assertNotIn("Group Z", html)
+        self.assertEqual(form.cleaned_data['term'], self.term)
+
+    def test_invalid_choice_is_rejected(self):
+        """ Test that rows outside the choices fail validation. """
+        inactive = StudyGroup.objects.get(name="Group Z")
+        form = ScheduleTemplateFilterForm(data={
+            'term': self.term.pk, 'study_group': inactive.pk
+        })
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('study_group', form.errors)
+
+    def test_saved_rows_invalidate_choices(self):
+        """ Test that added and deactivated rows change the choices. """
+        str(ScheduleTemplateFilterForm())
+        StudyGroup.objects.create(name="Group B")
+        self.study_group.active = False
+        self.study_group.save()
+
+        html = str(ScheduleTemplateFilterForm())
+
+        self.assertIn("Group B", html)
+        self.assertNotIn("Group A", html)
+
+    @override_settings(SCHEDULE_CACHE_TIMEOUT=0)
+    def test_expired_choices_are_reloaded(self):
+        """
+        Test that the choices are reloaded after the timeout even without
+        a version bump.
+        """
+        str(ScheduleTemplateFilterForm())
+        StudyGroup.objects.filter(pk=self.study_group.pk).update(active=False)
+
+        self.assertNotIn("Group A", str(ScheduleTemplateFilterForm()))
+
+    def test_choices_loaded_in_transaction_are_not_kept(self):
+        """ Test that rolled back rows do not stay in the choices. """
+        with transaction.atomic():
+            StudyGroup.objects.create(name="Group B")
+            self.assertIn("Group B", str(ScheduleTemplateFilterForm()))
+            transaction.set_rollback(True)
+
+        self.assertNotIn("Group B", str(ScheduleTemplateFilterForm()))
+
+    def test_model_forms_resolve_initial_rows_from_choices(self):
+        """
+        Test that the template and schedule forms show the names of their
+        initial rows without queries.
+        """
+        initial = {
+            'term': self.term.pk,
+            'study_group': self.study_group.pk,
+            'weekday': 0,
+            'date': '2024-09-02',
+        }
+        str(ScheduleTemplateForm(initial=initial))
+        str(ScheduleForm(initial=initial))
+
+        with self.assertNumQueries(0):
+            template_form = ScheduleTemplateForm(initial=initial)
+            schedule_form = ScheduleForm(initial=initial)
+            str(template_form)
+            str(schedule_form)
+
+        self.assertEqual(
+            template_form.fields['term_name'].initial, self.term
+        )
+        self.assertEqual(
+            schedule_form.fields['study_group_name'].initial, self.study_group
+        )
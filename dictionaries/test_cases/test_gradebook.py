@@ -0,0 +1,99 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from dictionaries.gradebook import get_gradebook
+from dictionaries.mark_summary import rebuild_mark_summaries
+from dictionaries.models import (
+    Schedule,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term
+)
+
+
+class GradebookTests(TestCase):
+    """ Test suite for the gradebook aggregation. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a term with lessons and marks of two students. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.math = Subject.objects.create(name="Math")
+        cls.art = Subject.objects.create(name="Art")
+        cls.anna = User.objects.create_user(
+            username="anna", first_name="Anna", last_name="Adams"
+        )
+        cls.bob = User.objects.create_user(
+            username="bob", first_name="Bob", last_name="Brown"
+        )
+        marks = {
+            (cls.anna, cls.math): [50, 75, 100],
+            (cls.anna, cls.art): [90],
+            (cls.bob, cls.math): [65],
+        }
+        order_number = 0
+        for (student, subject), values in marks.items():
+            for value in values:
+                order_number += 1
+                schedule = Schedule.objects.create(
+                    study_group=cls.study_group,
+                    date=date(2024, 9, 2),
+                    order_number=order_number,
+                    subject=subject
+                )
+                StudentMark.objects.create(
+                    schedule=schedule, student=student, mark=value
+                )
+        # A mark outside of the term
+        schedule = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2025, 1, 10),
+            order_number=1,
+            subject=cls.math
+        )
+        StudentMark.objects.create(schedule=schedule, student=cls.anna, mark=0)
+        rebuild_mark_summaries()
+
+    def test_gradebook_statistics(self):
+        """
+        Test that the gradebook reads the figures of each student and subject
+        within the term from the summary rows and counts the distribution of
+        the marks in two queries.
+        """
+        with self.assertNumQueries(2):
+            gradebook = get_gradebook(self.term, study_group=self.study_group)
+
+        self.assertEqual(
+            [(row['student_name'], row['subject']) for row in gradebook],
+            [
+                ('Anna Adams', 'Art'),
+                ('Anna Adams', 'Math'),
+                ('Bob Brown', 'Math'),
+            ]
+        )
+        anna_math = gradebook[1]
+        self.assertEqual(anna_math['average'], 75.0)
+        self.assertEqual(anna_math['count'], 3)
+        self.assertEqual(anna_math['min'], 50)
+        self.assertEqual(anna_math['max'], 100)
+        self.assertEqual(
+            anna_math['distribution'],
+            [('0-59', 1), ('60-69', 0), ('70-79', 1), ('80-89', 0),
+             ('90-100', 1)]
+        )
+
+    def test_gradebook_filters(self):
+        """ Test that the gradebook is limited by subject and student. """
+        gradebook = get_gradebook(
+            self.term, subject=self.math, student=self.bob
+        )
+        self.assertEqual(len(gradebook), 1)
+        self.assertEqual(gradebook[0]['average'], 65.0)
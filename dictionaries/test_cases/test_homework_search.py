@@ -0,0 +1,98 @@
+from datetime import date
+
+from django.test import TestCase
+
+from dictionaries.homework_search import search_schedules, tokenize
+from dictionaries.models import (
+    Schedule,
+    ScheduleSearchToken,
+    StudyGroup,
+    Subject
+)
+
+
+class HomeworkSearchTests(TestCase):
+    """ Test suite for the homework search and its token index. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up lessons with homework of two study groups. """
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.other_group = StudyGroup.objects.create(name="Group B")
+        cls.math = Subject.objects.create(name="Mathematics")
+        cls.art = Subject.objects.create(name="Art History")
+        cls.fractions = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=cls.math,
+            homework="Exercises 4-7 on Fractions, page 12."
+        )
+        cls.painting = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 10, 7),
+            order_number=2,
+            subject=cls.art,
+            homework="Sketch a still life."
+        )
+        Schedule.objects.create(
+            study_group=cls.other_group,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=cls.math,
+            homework="Fractions again"
+        )
+
+    def search(self, query, **kwargs):
+        """ Returns the lessons of the first study group found by a query. """
+        return list(search_schedules(query, self.study_group, **kwargs))
+
+    def test_tokenize(self):
+        """ Test that words are lowercased and unique. """
+        self.assertEqual(
+            tokenize("Read, read and WRITE_notes!"),
+            ['read', 'and', 'write', 'notes']
+        )
+
+    def test_homework_prefix(self):
+        """ Test that words are found by their beginning in any case. """
+        self.assertEqual(self.search("FRACT"), [self.fractions])
+        self.assertEqual(self.search("page 12"), [self.fractions])
+        self.assertEqual(self.search("ractions"), [])
+
+    def test_subject_and_homework_words(self):
+        """
+        Test that every word may match the homework or the subject name.
+        """
+        self.assertEqual(self.search("history"), [self.painting])
+        self.assertEqual(self.search("math fractions"), [self.fractions])
+        self.assertEqual(self.search("math sketch"), [])
+
+    def test_scope(self):
+        """ Test that the study group and the date range limit the lessons. """
+        self.assertEqual(
+            self.search("a", date_from=date(2024, 10, 1)), [self.painting]
+        )
+        self.assertEqual(
+            self.search("fractions", date_to=date(2024, 8, 31)), []
+        )
+
+    def test_saved_homework_is_indexed(self):
+        """ Test that changed homework replaces the old words. """
+        self.fractions.homework = "Decimals"
+        self.fractions.save()
+
+        self.assertEqual(self.search("fractions"), [])
+        self.assertEqual(self.search("decimal"), [self.fractions])
+
+    def test_deleted_lesson_removes_tokens(self):
+        """ Test that the tokens are deleted with the lesson. """
+        self.painting.delete()
+
+        self.assertFalse(
+            ScheduleSearchToken.objects.filter(token='sketch').exists()
+        )
+
+    def test_empty_query(self):
+        """ Test that a query without words finds nothing. """
+        self.assertEqual(self.search(" ,. "), [])
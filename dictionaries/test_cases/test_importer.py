@@ -0,0 +1,214 @@
+import io
+import os
+import tempfile
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.core.management import call_command
+from django.test import TestCase
+
+from dictionaries.importer import (
+    ScheduleTemplateImporter,
+    StudentMarkImporter
+)
+from dictionaries.models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudentMarkSummary,
+    StudyGroup,
+    Subject,
+    Term
+)
+from users.models import UserProfile
+
+
+class ImporterTestMixin:
+    """ Shared data for the importer tests. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a term, a study group, subjects and a student. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.other_group = StudyGroup.objects.create(name="Group B")
+        cls.math = Subject.objects.create(name="Math")
+        cls.art = Subject.objects.create(name="Art")
+        cls.student = User.objects.create_user(username="anna")
+        cls.student.groups.add(Group.objects.get(name="Student"))
+        UserProfile.objects.create(
+            user=cls.student, study_group=cls.study_group
+        )
+        cls.lesson = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=cls.math
+        )
+
+
+class ScheduleTemplateImporterTests(ImporterTestMixin, TestCase):
+    """ Test suite for the schedule template importer. """
+
+    def test_import_templates_in_batches(self):
+        """
+        Test that valid rows are written with one upsert per batch and
+        that lookups are loaded once.
+        """
+        lines = ["term,study_group,weekday,order_number,subject"]
+        lines += [
+            f"term1,Group A,{weekday},{order_number},math"
+            for weekday in ('Monday', 'Tuesday', '2')
+            for order_number in range(1, 11)
+        ]
+
+        # Three lookups, the savepoint pair and one upsert per batch
+        with self.assertNumQueries(3 + 2 + 2):
+            result = ScheduleTemplateImporter(batch_size=20).run(lines)
+
+        self.assertEqual(result.imported, 30)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(
+            ScheduleTemplate.objects.filter(weekday=2).count(), 10
+        )
+
+    def test_errors_are_reported_per_row(self):
+        """ Test that invalid rows are reported and the others imported. """
+        lines = [
+            "term,study_group,weekday,order_number,subject",
+            "Term1,Group A,Monday,1,Math",
+            "Term9,Group A,Monday,2,Math",
+            "Term1,Group A,Someday,3,Math",
+            "Term1,Group A,Monday,11,Math",
+            "Term1,Group A,Monday,1,Art",
+        ]
+        result = ScheduleTemplateImporter().run(lines)
+
+        self.assertEqual(result.imported, 1)
+        self.assertEqual(
+            result.errors,
+            [
+                (3, "Unknown term 'Term9'."),
+                (4, "Unknown weekday 'Someday'."),
+                (5, "Order number must be between 1 and 10."),
+                (6, "Duplicate row in the file."),
+            ]
+        )
+
+    def test_existing_template_gets_imported_subject(self):
+        """ Test that an existing template cell is updated. """
+        template = ScheduleTemplate.objects.create(
+            term=self.term,
+            study_group=self.study_group,
+            weekday=0,
+            order_number=1,
+            subject=self.math
+        )
+        ScheduleTemplateImporter().run([
+            "term,study_group,weekday,order_number,subject",
+            "Term1,Group A,Monday,1,Art",
+        ])
+
+        template.refresh_from_db()
+        self.assertEqual(template.subject, self.art)
+
+    def test_missing_columns(self):
+        """ Test that a file without the required columns is rejected. """
+        result = ScheduleTemplateImporter().run(["term,subject", "Term1,Art"])
+
+        self.assertEqual(result.imported, 0)
+        self.assertEqual(
+            result.errors,
+            [(1, "Missing columns: study_group, weekday, order_number.")]
+        )
+
+
+class StudentMarkImporterTests(ImporterTestMixin, TestCase):
+    """ Test suite for the student mark importer. """
+
+    def test_import_marks(self):
+        """
+        Test that marks are attached to lessons, validated and summarized.
+        """
+        StudentMark.objects.create(
+            schedule=self.lesson, student=self.student, mark=10
+        )
+        result = StudentMarkImporter().run([
+            "date,study_group,order_number,student,mark",
+            "2024-09-02,Group A,1,anna,90",
+            "2024-09-02,Group A,2,anna,90",
+            "2024-09-02,Group B,1,anna,90",
+            "02.09.2024,Group A,1,anna,90",
+            "2024-09-02,Group A,1,bob,90",
+        ])
+
+        self.assertEqual(result.imported, 1)
+        self.assertEqual(
+            [line for line, _ in result.errors], [3, 4, 5, 6]
+        )
+        self.assertEqual(
+            StudentMark.objects.get(student=self.student).mark, 90
+        )
+        self.assertEqual(
+            StudentMarkSummary.objects.get(student=self.student).mark_sum, 90
+        )
+
+    def test_batch_loads_lessons_of_its_dates_and_groups(self):
+        """
+        Test that a batch loads only the lessons of the dates and study
+        groups of its rows.
+        """
+        Schedule.objects.bulk_create([
+            Schedule(
+                study_group=self.study_group,
+                date=date(2024, 9, 3),
+                order_number=1,
+                subject=self.math
+            ),
+            Schedule(
+                study_group=self.other_group,
+                date=date(2024, 9, 4),
+                order_number=1,
+                subject=self.math
+            ),
+        ])
+        importer = StudentMarkImporter()
+        importer.load_lookups()
+
+        importer.prepare_batch([
+            (2, {'date': '2024-09-02', 'study_group': 'group a'}),
+            (3, {'date': '2024-09-04', 'study_group': 'Group A'}),
+            (4, {'date': '2024-09-03', 'study_group': 'Group C'}),
+        ])
+
+        self.assertEqual(
+            list(importer.schedules),
+            [(self.study_group.pk, date(2024, 9, 2), 1)]
+        )
+
+    def test_import_command(self):
+        """ Test that the command imports a file and reports errors. """
+        with tempfile.NamedTemporaryFile(
+            'w', suffix='.csv', delete=False, encoding='utf-8'
+        ) as f:
+            f.write(
+                "date,study_group,order_number,student,mark\n"
+                "2024-09-02,Group A,1,anna,70\n"
+                "2024-09-02,Group A,1,anna,80\n"
+            )
+        self.addCleanup(os.remove, f.name)
+        out = io.StringIO()
+        err = io.StringIO()
+        call_command(
+            'import_csv', 'student_marks', f.name, stdout=out, stderr=err
+        )
+
+        self.assertIn("Imported 1 rows, rejected 1 rows", out.getvalue())
+        self.assertIn("Line 3: Duplicate row in the file.", err.getvalue())
+        self.assertEqual(
+            StudentMark.objects.get(student=self.student).mark, 70
+        )
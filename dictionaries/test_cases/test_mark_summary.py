@@ -0,0 +1,338 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth.models import Group, User
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from dictionaries.mark_summary import (
+    rebuild_mark_summaries,
+    refresh_mark_summaries,
+    refresh_term_summaries
+)
+from dictionaries.models import (
+    Schedule,
+    StudentMark,
+    StudentMarkSummary,
+    StudyGroup,
+    Subject,
+    Term
+)
+from users.models import UserProfile
+
+
+class MarkSummaryTestMixin:
+    """ Shared data for the mark summary tests. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a term, two lessons, a tutor and two students. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.math = Subject.objects.create(name="Math")
+        cls.art = Subject.objects.create(name="Art")
+        cls.first_lesson = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=cls.math
+        )
+        cls.second_lesson = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 9, 3),
+            order_number=1,
+            subject=cls.math
+        )
+        cls.tutor = User.objects.create_user(
+            username="tutor", password="password"
+        )
+        cls.tutor.groups.add(Group.objects.get(name="Tutor"))
+        cls.anna = User.objects.create_user(username="anna")
+        cls.bob = User.objects.create_user(username="bob")
+        student_group = Group.objects.get(name="Student")
+        cls.anna.groups.add(student_group)
+        cls.bob.groups.add(student_group)
+        for student in (cls.anna, cls.bob):
+            UserProfile.objects.create(
+                user=student, study_group=cls.study_group, checked=True
+            )
+
+    def add_mark(self, schedule, student, mark):
+        """ Creates a student mark and refreshes its summary row. """
+        student_mark = StudentMark.objects.create(
+            schedule=schedule, student=student, mark=mark
+        )
+        refresh_mark_summaries([(student.pk, schedule.pk)])
+        return student_mark
+
+    def get_summary(self, student, subject):
+        """ Returns the summary row of the student and subject. """
+        return StudentMarkSummary.objects.filter(
+            student=student, subject=subject, term=self.term
+        ).first()
+
+
+class MarkSummaryTests(MarkSummaryTestMixin, TestCase):
+    """ Test suite for the mark summary maintenance and rebuild. """
+
+    def test_refresh_aggregates_marks(self):
+        """
+        Test that the summary holds the sum, count, min and max of the marks.
+        """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        self.add_mark(self.second_lesson, self.anna, 90)
+
+        summary = self.get_summary(self.anna, self.math)
+        self.assertEqual(
+            (
+                summary.mark_sum,
+                summary.mark_count,
+                summary.mark_min,
+                summary.mark_max
+            ),
+            (150, 2, 60, 90)
+        )
+        self.assertEqual(summary.average, 75)
+
+    def test_refresh_removes_empty_rows(self):
+        """ Test that the row is removed with the last mark. """
+        student_mark = self.add_mark(self.first_lesson, self.anna, 60)
+        student_mark.delete()
+        refresh_mark_summaries([(self.anna.pk, self.first_lesson.pk)])
+
+        self.assertIsNone(self.get_summary(self.anna, self.math))
+
+    def test_marks_outside_of_terms_are_ignored(self):
+        """ Test that marks outside of every term have no summary row. """
+        lesson = Schedule.objects.create(
+            study_group=self.study_group,
+            date=date(2025, 1, 10),
+            order_number=1,
+            subject=self.math
+        )
+        self.add_mark(lesson, self.anna, 60)
+
+        self.assertFalse(StudentMarkSummary.objects.exists())
+
+    def test_rebuild_matches_incremental_maintenance(self):
+        """
+        Test that a rebuild from scratch produces the incrementally
+        maintained rows.
+        """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        self.add_mark(self.second_lesson, self.anna, 90)
+        self.add_mark(self.first_lesson, self.bob, 70)
+        fields = (
+            'student', 'subject', 'term',
+            'mark_sum', 'mark_count', 'mark_min', 'mark_max'
+        )
+        expected = list(StudentMarkSummary.objects.values_list(*fields))
+
+        StudentMarkSummary.objects.all().delete()
+        self.assertEqual(rebuild_mark_summaries(batch_size=1), 2)
+        self.assertEqual(
+            list(StudentMarkSummary.objects.values_list(*fields)), expected
+        )
+
+    def test_refresh_term_summaries(self):
+        """
+        Test that the rows of the terms overlapping the dates are rebuilt
+        from the marks within the current dates of the terms.
+        """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        self.add_mark(self.second_lesson, self.anna, 90)
+        Term.objects.filter(pk=self.term.pk).update(date_to=date(2024, 9, 2))
+
+        self.assertEqual(
+            refresh_term_summaries([(date(2024, 9, 1), date(2024, 12, 31))]),
+            1
+        )
+        summary = self.get_summary(self.anna, self.math)
+        self.assertEqual((summary.mark_count, summary.mark_sum), (1, 60))
+
+    def test_rebuild_command(self):
+        """ Test that the command rebuilds the summary and reports it. """
+        StudentMark.objects.create(
+            schedule=self.first_lesson, student=self.anna, mark=60
+        )
+        out = StringIO()
+        call_command('rebuild_mark_summary', stdout=out)
+
+        self.assertEqual(self.get_summary(self.anna, self.math).mark_sum, 60)
+        self.assertIn("Created 1 summary rows", out.getvalue())
+
+
+class MarkSummaryViewTests(MarkSummaryTestMixin, TestCase):
+    """
+    Test suite for the mark summary maintenance by the student mark and
+    schedule views.
+    """
+
+    def setUp(self):
+        """ Logs in the tutor. """
+        self.client = Client()
+        self.client.login(username="tutor", password="password")
+
+    def test_add_student_mark_view(self):
+        """ Test that adding a mark creates the summary row. """
+        self.client.post(
+            reverse('tutor:add_student_mark', args=[self.first_lesson.pk]),
+            {'student': self.anna.pk, 'mark': 80}
+        )
+
+        self.assertEqual(self.get_summary(self.anna, self.math).mark_sum, 80)
+
+    def test_edit_student_mark_view_moves_mark(self):
+        """
+        Test that editing the student of a mark refreshes the rows of both
+        students.
+        """
+        student_mark = self.add_mark(self.first_lesson, self.anna, 60)
+        self.client.post(
+            reverse(
+                'tutor:edit_student_mark',
+                args=[self.first_lesson.pk, student_mark.pk]
+            ),
+            {'student': self.bob.pk, 'mark': 75}
+        )
+
+        self.assertIsNone(self.get_summary(self.anna, self.math))
+        self.assertEqual(self.get_summary(self.bob, self.math).mark_max, 75)
+
+    def test_delete_student_mark_view(self):
+        """ Test that deleting a mark refreshes the summary row. """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        student_mark = self.add_mark(self.second_lesson, self.anna, 90)
+        self.client.post(
+            reverse(
+                'tutor:delete_student_mark',
+                args=[self.second_lesson.pk, student_mark.pk]
+            )
+        )
+
+        summary = self.get_summary(self.anna, self.math)
+        self.assertEqual((summary.mark_count, summary.mark_max), (1, 60))
+
+    def test_edit_schedule_view_moves_marks_to_subject(self):
+        """
+        Test that changing the subject of a lesson moves its marks to the
+        summary row of the new subject.
+        """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        self.client.post(
+            reverse('tutor:edit_schedule', args=[self.first_lesson.pk]),
+            {
+                'date': self.first_lesson.date,
+                'study_group': self.study_group.pk,
+                'order_number': 1,
+                'subject': self.art.pk
+            }
+        )
+
+        self.assertIsNone(self.get_summary(self.anna, self.math))
+        self.assertEqual(self.get_summary(self.anna, self.art).mark_sum, 60)
+
+    def test_delete_schedule_view(self):
+        """ Test that deleting a lesson removes its marks from the summary. """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        self.client.post(
+            reverse('tutor:delete_schedule', args=[self.first_lesson.pk])
+        )
+
+        self.assertIsNone(self.get_summary(self.anna, self.math))
+
+    def test_student_mark_admin(self):
+        """
+        Test that adding and deleting a mark in the admin refreshes the
+        summary row.
+        """
+        User.objects.create_superuser(username="admin", password="password")
+        self.client.login(username="admin", password="password")
+        self.client.post(
+            reverse('admin:dictionaries_studentmark_add'),
+            {
+                'schedule': self.first_lesson.pk,
+                'student': self.anna.pk,
+                'mark': 70
+            }
+        )
+        self.assertEqual(self.get_summary(self.anna, self.math).mark_sum, 70)
+
+        student_mark = StudentMark.objects.get(student=self.anna)
+        self.client.post(
+            reverse(
+                'admin:dictionaries_studentmark_delete',
+                args=[student_mark.pk]
+            ),
+            {'post': 'yes'}
+        )
+        self.assertIsNone(self.get_summary(self.anna, self.math))
+
+    def test_schedule_admin_moves_marks_to_subject(self):
+        """
+        Test that changing the subject of a lesson in the admin moves its
+        marks to the summary row of the new subject.
+        """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        User.objects.create_superuser(username="admin", password="password")
+        self.client.login(username="admin", password="password")
+        self.client.post(
+            reverse(
+                'admin:dictionaries_schedule_change',
+                args=[self.first_lesson.pk]
+            ),
+            {
+                'study_group': self.study_group.pk,
+                'date': self.first_lesson.date,
+                'order_number': 1,
+                'subject': self.art.pk,
+                'homework': ''
+            }
+        )
+
+        self.assertIsNone(self.get_summary(self.anna, self.math))
+        self.assertEqual(self.get_summary(self.anna, self.art).mark_sum, 60)
+
+    def test_schedule_admin_delete(self):
+        """ Test that deleting a lesson in the admin refreshes the summary. """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        self.add_mark(self.second_lesson, self.anna, 90)
+        User.objects.create_superuser(username="admin", password="password")
+        self.client.login(username="admin", password="password")
+        self.client.post(
+            reverse(
+                'admin:dictionaries_schedule_delete',
+                args=[self.second_lesson.pk]
+            ),
+            {'post': 'yes'}
+        )
+
+        summary = self.get_summary(self.anna, self.math)
+        self.assertEqual((summary.mark_count, summary.mark_max), (1, 60))
+
+    def test_term_admin_dates(self):
+        """
+        Test that changing the dates of a term in the admin refreshes the
+        summary rows of its marks.
+        """
+        self.add_mark(self.first_lesson, self.anna, 60)
+        self.add_mark(self.second_lesson, self.anna, 90)
+        User.objects.create_superuser(username="admin", password="password")
+        self.client.login(username="admin", password="password")
+        self.client.post(
+            reverse('admin:dictionaries_term_change', args=[self.term.pk]),
+            {
+                'name': self.term.name,
+                'date_from': self.term.date_from,
+                'date_to': date(2024, 9, 2),
+                'active': 'on'
+            }
+        )
+
+        summary = self.get_summary(self.anna, self.math)
+        self.assertEqual((summary.mark_count, summary.mark_max), (1, 60))
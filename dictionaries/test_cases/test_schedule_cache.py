@@ -0,0 +1,306 @@
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from dictionaries.importer import ScheduleTemplateImporter
+from dictionaries.models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term
+)
+from dictionaries.schedule_cache import (
+    get_cache,
+    get_term_templates,
+    get_version_key,
+    get_week_marks,
+    get_week_schedules,
+    get_week_version
+)
+from users.models import UserProfile
+
+WEEK_START = date(2024, 9, 2)
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'schedule-cache-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ScheduleCacheTests(TestCase):
+    """ Test suite for the versioned weekly schedule cache. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a lesson with a mark of a student. """
+        Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.math = Subject.objects.create(name="Math")
+        cls.art = Subject.objects.create(name="Art")
+        cls.tutor = User.objects.create_user(
+            username="tutor", password="password"
+        )
+        cls.tutor.groups.add(Group.objects.get(name="Tutor"))
+        cls.student = User.objects.create_user(
+            username="student", password="password"
+        )
+        cls.student.groups.add(Group.objects.get(name="Student"))
+        UserProfile.objects.create(
+            user=cls.student, study_group=cls.study_group, checked=True
+        )
+        cls.lesson = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 9, 3),
+            order_number=1,
+            subject=cls.math
+        )
+        StudentMark.objects.create(
+            schedule=cls.lesson, student=cls.student, mark=75
+        )
+
+    def setUp(self):
+        """ Starts every test with an empty cache. """
+        get_cache().clear()
+
+    def get_week(self):
+        """ Returns the lessons of the test week. """
+        return get_week_schedules(self.study_group.pk, WEEK_START)
+
+    def test_cached_week_skips_queries(self):
+        """ Test that a cached week is returned without queries. """
+        schedules = self.get_week()
+        get_week_marks(self.study_group.pk, WEEK_START, schedules)
+
+        with self.assertNumQueries(0):
+            schedules = self.get_week()
+            marks = get_week_marks(self.study_group.pk, WEEK_START, schedules)
+            subject = schedules[0].subject.name
+
+        self.assertEqual(subject, 'Math')
+        self.assertEqual(marks, {self.lesson.pk: 1})
+
+    def test_student_overlay(self):
+        """ Test that students get their own marks next to tutor counts. """
+        schedules = self.get_week()
+
+        self.assertEqual(
+            get_week_marks(
+                self.study_group.pk, WEEK_START, schedules,
+                student=self.student
+            ),
+            {self.lesson.pk: 75}
+        )
+        self.assertEqual(
+            get_week_marks(self.study_group.pk, WEEK_START, schedules),
+            {self.lesson.pk: 1}
+        )
+
+    def test_saved_lesson_invalidates_week(self):
+        """ Test that a changed lesson is visible at once. """
+        self.get_week()
+        self.lesson.subject = self.art
+        self.lesson.save()
+
+        self.assertEqual(self.get_week()[0].subject, self.art)
+
+    def test_moved_lesson_invalidates_both_weeks(self):
+        """ Test that moving a lesson refreshes the previous week too. """
+        self.get_week()
+        lesson = Schedule.objects.get(pk=self.lesson.pk)
+        lesson.date = date(2024, 9, 10)
+        lesson.save()
+
+        self.assertEqual(self.get_week(), [])
+        self.assertEqual(
+            get_week_schedules(self.study_group.pk, date(2024, 9, 9)),
+            [lesson]
+        )
+
+    def test_marks_invalidate_week(self):
+        """ Test that saved and deleted marks refresh the cached marks. """
+        schedules = self.get_week()
+        get_week_marks(
+            self.study_group.pk, WEEK_START, schedules, student=self.student
+        )
+        student_mark = StudentMark.objects.get(schedule=self.lesson)
+        student_mark.mark = 90
+        student_mark.save()
+
+        self.assertEqual(
+            get_week_marks(
+                self.study_group.pk, WEEK_START, self.get_week(),
+                student=self.student
+            ),
+            {self.lesson.pk: 90}
+        )
+
+        student_mark.delete()
+        self.assertEqual(
+            get_week_marks(self.study_group.pk, WEEK_START, self.get_week()),
+            {}
+        )
+
+    def test_deleted_lesson_skips_queries_per_mark(self):
+        """
+        Test that deleting a lesson does not load the lesson of each of its
+        marks and invalidates the week.
+        """
+        def delete_lesson(students):
+            lesson = Schedule.objects.create(
+                study_group=self.study_group,
+                date=date(2024, 9, 4),
+                order_number=students,
+                subject=self.math
+            )
+            StudentMark.objects.bulk_create(
+                StudentMark(schedule=lesson, student=student, mark=80)
+                for student in User.objects.all()[:students]
+            )
+            with CaptureQueriesContext(connection) as queries:
+                lesson.delete()
+            return len(queries)
+
+        self.get_week()
+        self.assertEqual(delete_lesson(1), delete_lesson(2))
+        self.assertEqual(self.get_week(), [self.lesson])
+
+    def test_deleted_student_invalidates_week(self):
+        """ Test that deleting a student removes the cached marks. """
+        schedules = self.get_week()
+        get_week_marks(self.study_group.pk, WEEK_START, schedules)
+
+        self.student.delete()
+
+        self.assertEqual(
+            get_week_marks(self.study_group.pk, WEEK_START, self.get_week()),
+            {}
+        )
+
+    def test_lost_version_does_not_serve_old_entries(self):
+        """
+        Test that a new counter after eviction is higher than the old one.
+        """
+        version = get_week_version(self.study_group.pk, WEEK_START)
+        get_cache().delete(get_version_key(self.study_group.pk, WEEK_START))
+
+        self.assertGreater(
+            get_week_version(self.study_group.pk, WEEK_START), version
+        )
+
+    def test_bulk_marks_invalidate_week(self):
+        """ Test that marks saved in bulk refresh the student dashboard. """
+        client = Client()
+        client.login(username="student", password="password")
+        url = f"{reverse('student:dashboard')}?date=2024-09-03"
+        self.assertContains(client.get(url), 'Your mark: 75')
+
+        client.login(username="tutor", password="password")
+        client.post(
+            reverse('tutor:bulk_student_mark', args=[self.lesson.pk]),
+            {f'mark_{self.student.pk}': 60}
+        )
+
+        client.login(username="student", password="password")
+        self.assertContains(client.get(url), 'Your mark: 60')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ScheduleTemplateCacheTests(TestCase):
+    """ Test suite for the cached schedule template grids. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a template of a term and a study group. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.math = Subject.objects.create(name="Math")
+        cls.art = Subject.objects.create(name="Art")
+        cls.tutor = User.objects.create_user(
+            username="tutor", password="password"
+        )
+        cls.tutor.groups.add(Group.objects.get(name="Tutor"))
+        cls.template = ScheduleTemplate.objects.create(
+            term=cls.term,
+            study_group=cls.study_group,
+            weekday=0,
+            order_number=1,
+            subject=cls.math
+        )
+
+    def setUp(self):
+        """ Starts every test with an empty cache. """
+        get_cache().clear()
+
+    def get_templates(self):
+        """ Returns the templates of the test term and study group. """
+        return get_term_templates(self.term.pk, self.study_group.pk)
+
+    def test_cached_grid_skips_queries(self):
+        """
+        Test that the subjects are loaded with the templates and a cached
+        grid is returned without queries.
+        """
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get_templates()[0].subject.name, 'Math')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_templates()[0].subject.name, 'Math')
+
+    def test_template_writes_invalidate_grid(self):
+        """ Test that saved and deleted templates refresh the grid. """
+        self.get_templates()
+        template = ScheduleTemplate.objects.get(pk=self.template.pk)
+        template.subject = self.art
+        template.save()
+        self.assertEqual(self.get_templates()[0].subject, self.art)
+
+        template.delete()
+        self.assertEqual(self.get_templates(), [])
+
+    def test_import_invalidates_grid(self):
+        """ Test that imported templates refresh the grid. """
+        self.get_templates()
+        ScheduleTemplateImporter().run([
+            'term,study_group,weekday,order_number,subject',
+            'Term1,Group A,Monday,2,Art',
+        ])
+
+        self.assertEqual(
+            [template.order_number for template in self.get_templates()],
+            [1, 2]
+        )
+
+    def test_fill_uses_current_templates(self):
+        """
+        Test that the fill path reads the cached grid and sees template
+        changes.
+        """
+        self.get_templates()
+        self.template.subject = self.art
+        self.template.save()
+        client = Client()
+        client.login(username="tutor", password="password")
+
+        client.post(reverse('tutor:fill_schedule'), {
+            'date': '2024-09-04', 'study_group': self.study_group.pk
+        })
+
+        lesson = Schedule.objects.get(study_group=self.study_group)
+        self.assertEqual(lesson.date, date(2024, 9, 2))
+        self.assertEqual(lesson.subject, self.art)
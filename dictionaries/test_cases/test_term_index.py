@@ -0,0 +1,208 @@
+from datetime import date
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings
+)
+
+from dictionaries import term_index
+from dictionaries.models import Term
+from dictionaries.schedule_cache import get_cache
+from dictionaries.term_index import TermIndex, get_term_index
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'term-index-tests',
+    }
+}
+
+
+class TermIndexTests(SimpleTestCase):
+    """ Test suite for the date lookups of the term interval index. """
+
+    def setUp(self):
+        """
+        Sets up two active terms with a gap and a long inactive term
+        overlapping both.
+        """
+        self.autumn = Term(
+            pk=1, name="Autumn",
+            date_from=date(2024, 9, 1), date_to=date(2024, 12, 31)
+        )
+        self.spring = Term(
+            pk=2, name="Spring",
+            date_from=date(2025, 1, 15), date_to=date(2025, 6, 30)
+        )
+        self.year = Term(
+            pk=3, name="Year", active=False,
+            date_from=date(2024, 8, 1), date_to=date(2025, 7, 31)
+        )
+        self.index = TermIndex([self.spring, self.year, self.autumn])
+
+    def test_get_term_returns_earliest_containing_term(self):
+        """
+        Test that a date resolves to the earliest starting term containing
+        it, including terms starting long before the date.
+        """
+        self.assertEqual(self.index.get_term(date(2024, 8, 15)), self.year)
+        self.assertEqual(self.index.get_term(date(2025, 1, 5)), self.year)
+        self.assertIsNone(self.index.get_term(date(2025, 8, 1)))
+        self.assertIsNone(self.index.get_term(date(2024, 7, 31)))
+
+    def test_active_index_skips_inactive_terms(self):
+        """ Test that the active index resolves active terms only. """
+        active = self.index.active
+
+        self.assertEqual(active.get_term(date(2024, 12, 31)), self.autumn)
+        self.assertEqual(active.get_term(date(2025, 1, 15)), self.spring)
+        self.assertIsNone(active.get_term(date(2025, 1, 5)))
+
+    def test_get_terms_resolves_many_dates(self):
+        """ Test that many dates are resolved in one call. """
+        days = [date(2025, 1, 14), date(2025, 1, 15), date(2025, 1, 14)]
+
+        self.assertEqual(
+            self.index.active.get_terms(days),
+            {date(2025, 1, 14): None, date(2025, 1, 15): self.spring}
+        )
+
+    def test_get_overlapping_orders_by_start(self):
+        """ Test that the terms of a date range are ordered by start date. """
+        self.assertEqual(
+            self.index.get_overlapping(date(2024, 12, 30), date(2025, 1, 20)),
+            [self.year, self.autumn, self.spring]
+        )
+        self.assertEqual(
+            self.index.active.get_overlapping(
+                date(2025, 1, 1), date(2025, 1, 14)
+            ),
+            []
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TermIndexCacheTests(TransactionTestCase):
+    """ Test suite for loading and invalidating the process-wide index. """
+
+    def setUp(self):
+        """ Starts every test without a loaded index. """
+        get_cache().clear()
+        term_index._term_index.clear()
+        self.term = Term.objects.create(
+            name="Autumn",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+
+    def tearDown(self):
+        """ Drops the index of the flushed terms. """
+        term_index._term_index.clear()
+
+    def test_index_is_loaded_once(self):
+        """ Test that lookups after the first one run no queries. """
+        get_term_index()
+
+        with self.assertNumQueries(0):
+            term = get_term_index(active=True).get_term(date(2024, 10, 1))
+
+        self.assertEqual(term, self.term)
+
+    def test_saved_and_deleted_terms_invalidate_index(self):
+        """ Test that term changes are visible to the next lookup. """
+        get_term_index()
+        spring = Term.objects.create(
+            name="Spring",
+            date_from=date(2025, 1, 15),
+            date_to=date(2025, 6, 30)
+        )
+        self.assertEqual(get_term_index().get_term(date(2025, 2, 1)), spring)
+
+        spring.active = False
+        spring.save()
+        self.assertIsNone(
+            get_term_index(active=True).get_term(date(2025, 2, 1))
+        )
+
+        self.term.delete()
+        self.assertIsNone(get_term_index().get_term(date(2024, 10, 1)))
+
+    @override_settings(SCHEDULE_CACHE_TIMEOUT=0)
+    def test_expired_index_is_reloaded(self):
+        """
+        Test that the index is reloaded after the timeout even without a
+        version bump.
+        """
+        get_term_index()
+        Term.objects.bulk_create([Term(
+            name="Spring",
+            date_from=date(2025, 1, 15),
+            date_to=date(2025, 6, 30)
+        )])
+
+        self.assertIsNotNone(get_term_index().get_term(date(2025, 2, 1)))
+
+    def test_index_loaded_in_transaction_is_not_kept(self):
+        """ Test that a rolled back term does not stay in the index. """
+        with transaction.atomic():
+            Term.objects.create(
+                name="Spring",
+                date_from=date(2025, 1, 15),
+                date_to=date(2025, 6, 30)
+            )
+            self.assertIsNotNone(
+                get_term_index().get_term(date(2025, 2, 1))
+            )
+            transaction.set_rollback(True)
+
+        self.assertIsNone(get_term_index().get_term(date(2025, 2, 1)))
+
+
+class TermCleanTests(TestCase):
+    """ Test suite for the overlap validation of the terms. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up an active term. """
+        cls.term = Term.objects.create(
+            name="Autumn",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+
+    def test_saved_term_does_not_overlap_itself(self):
+        """ Test that a saved term can be validated again. """
+        self.term.name = "Autumn 2024"
+
+        self.term.clean()
+
+    def test_adjacent_term_is_valid(self):
+        """ Test that a term may start on the last day of another term. """
+        Term(
+            name="Winter",
+            date_from=date(2024, 12, 31),
+            date_to=date(2025, 1, 14)
+        ).clean()
+
+    def test_overlap_is_checked_in_the_database(self):
+        """
+        Test that a term saved without invalidating the term index still
+        counts as an overlap.
+        """
+        get_term_index()
+        Term.objects.bulk_create([Term(
+            name="Winter",
+            date_from=date(2025, 1, 1),
+            date_to=date(2025, 1, 31)
+        )])
+
+        with self.assertRaises(ValidationError):
+            Term(
+                name="January",
+                date_from=date(2025, 1, 10),
+                date_to=date(2025, 1, 20)
+            ).clean()
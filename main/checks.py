@@ -0,0 +1,115 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+from django.db import DatabaseError, connections
+
+POOLERS = ('', 'pgbouncer')
+# Cache backends holding their data in the memory of one process
+PROCESS_LOCAL_CACHES = ('django.core.cache.backends.locmem.LocMemCache',)
+
+
+def get_database_errors(alias, settings_dict, pooler):
+    """
+    Validates the connection settings of a database.
+
+    Args:
+        alias (str): The alias of the database.
+        settings_dict (dict): The settings of the database.
+        pooler (str): The DATABASE_POOLER setting.
+
+    Returns:
+        list: The errors and warnings of the settings.
+    """
+    errors = []
+    if pooler not in POOLERS:
+        errors.append(Error(
+            f"Unknown DATABASE_POOLER '{pooler}'.",
+            hint="Use 'pgbouncer' or leave it empty.",
+            id='main.E001',
+        ))
+    elif pooler and 'postgresql' not in settings_dict['ENGINE']:
+        errors.append(Error(
+            f"DATABASE_POOLER '{pooler}' requires a PostgreSQL database, "
+            f"but '{alias}' uses {settings_dict['ENGINE']}.",
+            id='main.E002',
+        ))
+    if settings_dict.get('CONN_MAX_AGE') != 0 and not settings_dict.get(
+        'CONN_HEALTH_CHECKS'
+    ):
+        errors.append(Warning(
+            f"Persistent connections of '{alias}' are reused without "
+            "health checks.",
+            hint="A request reusing a connection closed by the server "
+            "fails. Set CONN_HEALTH_CHECKS=True.",
+            id='main.W001',
+        ))
+    return errors
+
+
+@register()
+def check_database_settings(app_configs, **kwargs):
+    """ Validates the connection settings of all databases. """
+    errors = []
+    for alias, settings_dict in connections.settings.items():
+        errors += get_database_errors(
+            alias, settings_dict, getattr(settings, 'DATABASE_POOLER', '')
+        )
+    return errors
+
+
+@register(Tags.database)
+def check_database_connections(app_configs, databases=None, **kwargs):
+    """
+    Connects to the databases given with the --database option, so a
+    release with unusable connection settings fails before serving requests.
+    """
+    errors = []
+    for alias in databases or []:
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError as error:
+            errors.append(Error(
+                f"Cannot connect to the '{alias}' database: {error}",
+                id='main.E003',
+            ))
+    return errors
+
+
+def get_cache_warnings(alias, cache_settings, workers):
+    """
+    Validates that the schedule cache is shared by all web server processes.
+
+    The cached weeks, template grids, choices and terms are invalidated by
+    version counters in this cache. A process sees a counter bumped by
+    another process only when the cache is shared; with a cache local to
+    each process, the others keep serving their data until it expires after
+    SCHEDULE_CACHE_TIMEOUT.
+
+    Args:
+        alias (str): The SCHEDULE_CACHE_ALIAS setting.
+        cache_settings (dict): The settings of the cache.
+        workers (int): The WEB_CONCURRENCY setting.
+
+    Returns:
+        list: The warnings of the settings.
+    """
+    if workers > 1 and cache_settings['BACKEND'] in PROCESS_LOCAL_CACHES:
+        return [Warning(
+            f"The '{alias}' schedule cache is local to one process, but "
+            f"WEB_CONCURRENCY is {workers}. Changes reach the other "
+            "processes only after SCHEDULE_CACHE_TIMEOUT.",
+            hint="Set REDIS_URL so the processes share the cache versions, "
+            "or run a single worker.",
+            id='main.W002',
+        )]
+    return []
+
+
+@register(Tags.caches)
+def check_schedule_cache(app_configs, **kwargs):
+    """ Validates that the schedule cache is shared by all workers. """
+    alias = getattr(settings, 'SCHEDULE_CACHE_ALIAS', 'default')
+    return get_cache_warnings(
+        alias,
+        settings.CACHES[alias],
+        getattr(settings, 'WEB_CONCURRENCY', 1)
+    )
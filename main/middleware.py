@@ -0,0 +1,173 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .timing import RequestMetrics, current_metrics, timing_window
+
+logger = logging.getLogger(__name__)
+timing_logger = logging.getLogger('main.timing')
+
+DEFAULT_THRESHOLD = 5
+DEFAULT_TIMED_NAMESPACES = ('tutor', 'student')
+
+# Parameter lists of IN lookups differ in length between requests
+IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+WHITESPACE = re.compile(r'\s+')
+
+
+class NPlusOneQueryError(Exception):
+    """ Raised when a request repeats the same SQL statement too often. """
+
+
+def normalize_sql(sql):
+    """
+    Normalizes an SQL statement so repeated statements with different
+    parameters are counted together.
+
+    Args:
+        sql (str): The SQL statement with parameter placeholders.
+
+    Returns:
+        str: The statement with collapsed IN lists and whitespace.
+    """
+    return WHITESPACE.sub(' ', IN_LIST.sub('IN (...)', sql)).strip()
+
+
+class QueryCounter:
+    """
+    Database execute wrapper counting the executed statements.
+
+    Attributes:
+        statements (Counter): Number of executions by normalized statement.
+    """
+    def __init__(self):
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        self.statements[normalize_sql(sql)] += 1
+        return execute(sql, params, many, context)
+
+    def get_repeated(self, threshold):
+        """
+        Returns the statements executed more often than the threshold.
+
+        Args:
+            threshold (int): The highest allowed number of executions.
+
+        Returns:
+            list: (statement, count) tuples, the most repeated first.
+        """
+        return [
+            (sql, count) for sql, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+class NPlusOneQueryMiddleware:
+    """
+    Development middleware flagging N+1 queries.
+
+    The SQL statements executed while handling a request are grouped by
+    their normalized text. Statements repeated more often than the
+    N_PLUS_ONE_THRESHOLD setting are logged as warnings, or raised as
+    NPlusOneQueryError when the N_PLUS_ONE_RAISE setting is True.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+
+        repeated = counter.get_repeated(
+            getattr(settings, 'N_PLUS_ONE_THRESHOLD', DEFAULT_THRESHOLD)
+        )
+        if repeated:
+            self.report(request, repeated)
+        return response
+
+    def report(self, request, repeated):
+        """
+        Logs or raises the repeated statements of a request.
+
+        Args:
+            request (HttpRequest): The handled request.
+            repeated (list): (statement, count) tuples.
+
+        Raises:
+            NPlusOneQueryError: If the N_PLUS_ONE_RAISE setting is True.
+        """
+        message = f"N+1 queries in {request.method} {request.path}: " + (
+            "; ".join(f"{count}x {sql}" for sql, count in repeated)
+        )
+        if getattr(settings, 'N_PLUS_ONE_RAISE', False):
+            raise NPlusOneQueryError(message)
+        logger.warning(message)
+
+
+class RequestTimingMiddleware:
+    """
+    Opt-in middleware instrumenting requests.
+
+    The number and duration of the SQL statements, the template render time
+    and the total time of every request are sent in the Server-Timing
+    response header and logged as one JSON line. The total times of the
+    views in the REQUEST_TIMING_NAMESPACES are kept in the rolling window
+    shown on the staff timing page.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            metrics.total_time = time.perf_counter() - started
+            current_metrics.reset(token)
+
+        url_name = self.get_url_name(request)
+        response.headers['Server-Timing'] = metrics.get_server_timing()
+        timing_logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'url_name': url_name,
+            'status': response.status_code,
+            'sql_count': metrics.sql_count,
+            'sql_ms': round(metrics.sql_time * 1000, 1),
+            'render_ms': round(metrics.render_time * 1000, 1),
+            'total_ms': round(metrics.total_time * 1000, 1),
+        }))
+        namespaces = getattr(
+            settings, 'REQUEST_TIMING_NAMESPACES', DEFAULT_TIMED_NAMESPACES
+        )
+        if url_name and url_name.split(':')[0] in namespaces:
+            timing_window.record(url_name, metrics.total_time)
+        return response
+
+    def get_url_name(self, request):
+        """
+        Returns the namespaced URL name of the handled view.
+
+        Args:
+            request (HttpRequest): The handled request.
+
+        Returns:
+            str: The URL name, or None if the URL was not resolved.
+        """
+        match = getattr(request, 'resolver_match', None)
+        return match.view_name if match else None
@@ -0,0 +1,71 @@
+from django.test import SimpleTestCase
+
+from main.checks import get_cache_warnings, get_database_errors
+
+LOCMEM = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+REDIS = {'BACKEND': 'django.core.cache.backends.redis.RedisCache'}
+POSTGRESQL = {
+    'ENGINE': 'django.db.backends.postgresql',
+    'CONN_MAX_AGE': 60,
+    'CONN_HEALTH_CHECKS': True,
+}
+
+
+class DatabaseChecksTests(SimpleTestCase):
+    """ Test suite for the validation of the connection settings. """
+
+    def get_ids(self, settings_dict, pooler=''):
+        """ Returns the IDs of the errors of the settings. """
+        return [
+            error.id
+            for error in get_database_errors('default', settings_dict, pooler)
+        ]
+
+    def test_valid_settings(self):
+        """ Test that persistent, checked connections pass. """
+        self.assertEqual(self.get_ids(POSTGRESQL), [])
+        self.assertEqual(self.get_ids(POSTGRESQL, 'pgbouncer'), [])
+
+    def test_pooler(self):
+        """
+        Test that only PgBouncer is supported, in front of PostgreSQL only.
+        """
+        self.assertEqual(self.get_ids(POSTGRESQL, 'pgpool'), ['main.E001'])
+        self.assertEqual(
+            self.get_ids(
+                dict(POSTGRESQL, ENGINE='django.db.backends.sqlite3'),
+                'pgbouncer'
+            ),
+            ['main.E002']
+        )
+
+    def test_persistent_connections_without_health_checks(self):
+        """
+        Test that persistent connections without health checks warn and
+        connections per request do not.
+        """
+        settings_dict = dict(POSTGRESQL, CONN_HEALTH_CHECKS=False)
+
+        self.assertEqual(self.get_ids(settings_dict), ['main.W001'])
+        self.assertEqual(
+            self.get_ids(dict(settings_dict, CONN_MAX_AGE=0)), []
+        )
+        self.assertEqual(
+            self.get_ids(dict(settings_dict, CONN_MAX_AGE=None)),
+            ['main.W001']
+        )
+
+
+class CacheChecksTests(SimpleTestCase):
+    """ Test suite for the validation of the schedule cache backend. """
+
+    def test_local_cache_with_several_workers(self):
+        """
+        Test that a process-local cache is reported for several workers
+        only.
+        """
+        warnings = get_cache_warnings('default', LOCMEM, 2)
+
+        self.assertEqual([warning.id for warning in warnings], ['main.W002'])
+        self.assertEqual(get_cache_warnings('default', LOCMEM, 1), [])
+        self.assertEqual(get_cache_warnings('default', REDIS, 4), [])
@@ -0,0 +1,63 @@
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from main.middleware import (
+    NPlusOneQueryError,
+    NPlusOneQueryMiddleware,
+    normalize_sql
+)
+
+
+def repeat_query(times):
+    """ Returns a view executing the same query several times. """
+    def view(request):
+        for number in range(times):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT %s", [number])
+        return HttpResponse()
+    return view
+
+
+class NPlusOneQueryMiddlewareTests(SimpleTestCase):
+    """ Test suite for the NPlusOneQueryMiddleware. """
+    databases = {'default'}
+
+    def setUp(self):
+        """ Initializes a request factory for test requests. """
+        self.request = RequestFactory().get('/')
+
+    def test_normalize_sql(self):
+        """
+        Test that IN lists of different lengths and whitespace are
+        normalized to the same statement.
+        """
+        self.assertEqual(
+            normalize_sql('SELECT *\n  FROM "t" WHERE "id" IN (%s, %s, %s)'),
+            normalize_sql('SELECT * FROM "t" WHERE "id" IN (%s)'),
+        )
+
+    @override_settings(N_PLUS_ONE_THRESHOLD=3, N_PLUS_ONE_RAISE=True)
+    def test_repeated_queries_raise(self):
+        """ Test that statements repeated above the threshold raise. """
+        middleware = NPlusOneQueryMiddleware(repeat_query(4))
+
+        with self.assertRaisesMessage(NPlusOneQueryError, '4x SELECT %s'):
+            middleware(self.request)
+
+    @override_settings(N_PLUS_ONE_THRESHOLD=3, N_PLUS_ONE_RAISE=False)
+    def test_repeated_queries_are_logged(self):
+        """ Test that repeated statements are logged when not raised. """
+        middleware = NPlusOneQueryMiddleware(repeat_query(4))
+
+        with self.assertLogs('main.middleware', 'WARNING') as logs:
+            middleware(self.request)
+
+        self.assertIn('N+1 queries in GET /', logs.output[0])
+
+    @override_settings(N_PLUS_ONE_THRESHOLD=3, N_PLUS_ONE_RAISE=True)
+    def test_queries_within_threshold(self):
+        """ Test that statements within the threshold pass. """
+        middleware = NPlusOneQueryMiddleware(repeat_query(3))
+
+        self.assertEqual(middleware(self.request).status_code, 200)
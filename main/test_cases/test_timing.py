@@ -0,0 +1,124 @@
+import json
+from copy import deepcopy
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.shortcuts import render
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import resolve, reverse
+
+from main.middleware import RequestTimingMiddleware
+from main.timing import get_percentile, timing_window
+from users.models import UserProfile
+
+TIMED_TEMPLATES = deepcopy(settings.TEMPLATES)
+TIMED_TEMPLATES[0]['BACKEND'] = 'main.timing.TimedDjangoTemplates'
+
+
+def timed_view(request):
+    """ Returns a view executing a query and rendering a template. """
+    UserProfile.objects.count()
+    return render(request, "main/home.html")
+
+
+class TimingWindowTests(TestCase):
+    """ Test suite for the rolling window of request durations. """
+
+    def setUp(self):
+        """ Starts every test with an empty window. """
+        timing_window.clear()
+
+    def test_percentile(self):
+        """ Test the nearest-rank percentiles. """
+        values = list(range(1, 101))
+
+        self.assertEqual(get_percentile(values, 50), 50)
+        self.assertEqual(get_percentile(values, 95), 95)
+        self.assertEqual(get_percentile([7], 99), 7)
+
+    @override_settings(REQUEST_TIMING_WINDOW=10)
+    def test_window_keeps_latest_durations(self):
+        """ Test that only the latest durations of a view are kept. """
+        for duration in range(20):
+            timing_window.record('tutor:schedule', duration / 1000)
+
+        stats = timing_window.get_stats()
+        self.assertEqual(stats[0]['count'], 10)
+        self.assertEqual(stats[0]['p50'], 14.0)
+        self.assertEqual(stats[0]['p99'], 19.0)
+
+
+@override_settings(TEMPLATES=TIMED_TEMPLATES)
+class RequestTimingMiddlewareTests(TestCase):
+    """ Test suite for the RequestTimingMiddleware. """
+
+    def setUp(self):
+        """ Starts every test with an empty window. """
+        timing_window.clear()
+        self.middleware = RequestTimingMiddleware(timed_view)
+
+    def get_request(self, path):
+        """ Returns a request resolved like by the URL resolver. """
+        request = RequestFactory().get(path)
+        request.user = AnonymousUser()
+        request.resolver_match = resolve(path)
+        return request
+
+    def test_server_timing_and_log_line(self):
+        """
+        Test that the SQL, render and total times are sent and logged.
+        """
+        with self.assertLogs('main.timing', 'INFO') as logs:
+            response = self.middleware(self.get_request(reverse('home')))
+
+        server_timing = response.headers['Server-Timing']
+        self.assertIn('sql;desc="1 queries"', server_timing)
+        self.assertIn('render;dur=', server_timing)
+        self.assertIn('total;dur=', server_timing)
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual(line['url_name'], 'home')
+        self.assertEqual(line['sql_count'], 1)
+        self.assertGreater(line['render_ms'], 0)
+
+    def test_only_dashboard_views_are_aggregated(self):
+        """ Test that the window collects the tutor and student views. """
+        self.middleware(self.get_request(reverse('home')))
+        self.middleware(self.get_request(reverse('student:dashboard')))
+
+        self.assertEqual(
+            [row['url_name'] for row in timing_window.get_stats()],
+            ['student:dashboard']
+        )
+
+
+class RequestTimingsViewTests(TestCase):
+    """ Test suite for the staff timing page. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a staff user and a regular user. """
+        User.objects.create_user(
+            username="staff", password="password", is_staff=True
+        )
+        User.objects.create_user(username="user", password="password")
+
+    def setUp(self):
+        """ Records a request duration. """
+        timing_window.clear()
+        timing_window.record('tutor:schedule', 0.012)
+
+    def test_staff_sees_timings(self):
+        """ Test that staff users see the recorded percentiles. """
+        self.client.login(username="staff", password="password")
+        response = self.client.get(reverse('request_timings'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'tutor:schedule')
+        self.assertEqual(response.context['stats'][0]['p95'], 12.0)
+
+    def test_regular_user_is_redirected(self):
+        """ Test that other users cannot see the timings. """
+        self.client.login(username="user", password="password")
+        response = self.client.get(reverse('request_timings'))
+
+        self.assertEqual(response.status_code, 302)
@@ -0,0 +1,162 @@
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.template.backends.django import DjangoTemplates, Template
+
+DEFAULT_WINDOW = 500
+PERCENTILES = (50, 95, 99)
+
+# Metrics of the request handled by the current thread or task
+current_metrics = ContextVar('current_metrics', default=None)
+
+
+class RequestMetrics:
+    """
+    Timings collected while a request is handled.
+
+    The instance is used as a database execute wrapper counting and timing
+    the SQL statements.
+
+    Attributes:
+        sql_count (int): Number of executed statements.
+        sql_time (float): Time spent in the database in seconds.
+        render_time (float): Time spent rendering templates in seconds.
+        total_time (float): Duration of the request in seconds.
+    """
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.render_time = 0.0
+        self.total_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - started
+            self.sql_count += 1
+
+    def get_server_timing(self):
+        """
+        Returns the value of the Server-Timing response header.
+
+        Returns:
+            str: The SQL, render and total durations in milliseconds.
+        """
+        return ", ".join([
+            f'sql;desc="{self.sql_count} queries";'
+            f'dur={self.sql_time * 1000:.1f}',
+            f'render;dur={self.render_time * 1000:.1f}',
+            f'total;dur={self.total_time * 1000:.1f}',
+        ])
+
+
+class TimedTemplate(Template):
+    """ Template adding its render time to the current request metrics. """
+
+    def render(self, context=None, request=None):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.render_time += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    Django template backend measuring the render time of the templates.
+
+    Templates included by a rendered template are measured as a part of it.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+
+def get_percentile(values, percentile):
+    """
+    Returns a percentile of values with the nearest-rank method.
+
+    Args:
+        values (list): The sorted values.
+        percentile (int): The percentile between 1 and 100.
+
+    Returns:
+        float: The value below which the percentile of values falls.
+    """
+    rank = math.ceil(percentile / 100 * len(values))
+    return values[max(rank, 1) - 1]
+
+
+class TimingWindow:
+    """
+    In-process rolling window of request durations per URL name.
+
+    Only the latest durations of every URL name are kept, so the statistics
+    follow the current behaviour of the process. Every worker process keeps
+    its own window.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations = defaultdict(self.create_window)
+
+    def create_window(self):
+        """ Returns an empty window sized by the REQUEST_TIMING_WINDOW. """
+        return deque(
+            maxlen=getattr(settings, 'REQUEST_TIMING_WINDOW', DEFAULT_WINDOW)
+        )
+
+    def record(self, url_name, duration):
+        """
+        Adds a request duration to the window of a URL name.
+
+        Args:
+            url_name (str): The namespaced URL name of the view.
+            duration (float): The duration in seconds.
+        """
+        with self.lock:
+            self.durations[url_name].append(duration)
+
+    def clear(self):
+        """ Removes all recorded durations. """
+        with self.lock:
+            self.durations.clear()
+
+    def get_stats(self):
+        """
+        Returns the statistics of the recorded durations.
+
+        Returns:
+            list: Dictionaries with the URL name, the number of requests and
+            the p50, p95 and p99 durations in milliseconds, ordered by the
+            p95 duration, slowest first.
+        """
+        with self.lock:
+            windows = {
+                url_name: sorted(durations)
+                for url_name, durations in self.durations.items()
+            }
+        stats = []
+        for url_name, durations in windows.items():
+            row = {'url_name': url_name, 'count': len(durations)}
+            for percentile in PERCENTILES:
+                row[f'p{percentile}'] = round(
+                    get_percentile(durations, percentile) * 1000, 1
+                )
+            stats.append(row)
+        return sorted(stats, key=lambda row: row['p95'], reverse=True)
+
+
+timing_window = TimingWindow()
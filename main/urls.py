@@ -4,4 +4,5 @@ from django.urls import path
 urlpatterns = [
     path('', views.home, name='home'),
     path('contact/', views.contact, name='contact'),
+    path('timings/', views.request_timings, name='request_timings'),
 ]
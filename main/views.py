@@ -1,5 +1,9 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.conf import settings
 from django.shortcuts import render
 import os
+
+from .timing import timing_window
 if os.path.isfile('env.py'):
     import env
 
@@ -19,3 +23,16 @@ def contact(request):
         "main/contact.html",
         {"google_maps_api_key": os.environ.get("GOOGLE_MAPS_API_KEY")}
     )
+
+
+@staff_member_required
+def request_timings(request):
+    """ Renders the per-view request timings of the current process. """
+    return render(
+        request,
+        "main/request_timings.html",
+        {
+            "stats": timing_window.get_stats(),
+            "enabled": getattr(settings, "REQUEST_TIMING", False),
+        }
+    )
@@ -40,10 +40,53 @@ document.addEventListener('DOMContentLoaded', function () {
                 }
             }
             if (areAllFieldsFilled(form)) {
-                form.submit();
+                if (weekNavigation) {
+                    weekNavigation.load(getSelection(form));
+                } else {
+                    form.submit();
+                }
             }
         };
 
+        // Load the grid data asynchronously when the JSON API is available
+        const weekNavigation = schedule.getAttribute('data-api-url')
+            ? createWeekNavigation(form, schedule, function () {
+                updateSelectionDescription(form, selectionDescription, dataTemplateName);
+            })
+            : null;
+        if (weekNavigation) {
+            form.addEventListener('submit', function (event) {
+                event.preventDefault();
+            });
+            form.querySelectorAll('input, select').forEach(function (field) {
+                field.addEventListener('change', function () {
+                    if (areAllFieldsFilled(form)) {
+                        weekNavigation.load(getSelection(form));
+                    }
+                });
+            });
+            const previousWeek = document.getElementById('previous-week');
+            if (previousWeek) {
+                previousWeek.addEventListener('click', function (event) {
+                    event.preventDefault();
+                    weekNavigation.shift(-7);
+                });
+            }
+            const nextWeek = document.getElementById('next-week');
+            if (nextWeek) {
+                nextWeek.addEventListener('click', function (event) {
+                    event.preventDefault();
+                    weekNavigation.shift(7);
+                });
+            }
+            window.addEventListener('popstate', function (event) {
+                if (event.state && event.state.date) {
+                    weekNavigation.load(event.state, { push: false });
+                }
+            });
+            weekNavigation.start();
+        }
+
         const submitSelection = document.getElementById('submit-selection');
         if (submitSelection) {
             submitSelection.addEventListener('click', upadateSelection);
@@ -93,6 +136,342 @@ function updateSelectionDescription(form, selectionDescription, dataTemplateName
     }
 }
 
+// Number of recently viewed weeks kept in the browser
+const WEEK_CACHE_SIZE = 8;
+// Number of lessons per day displayed in the schedule grid
+const LESSONS_PER_DAY = 10;
+
+// Least recently used cache of the loaded weeks
+class WeekCache {
+    constructor(maxSize = WEEK_CACHE_SIZE) {
+        this.maxSize = maxSize;
+        this.entries = new Map();
+    }
+
+    has(key) {
+        return this.entries.has(key);
+    }
+
+    // Return the entry and mark it as the most recently used one
+    get(key) {
+        if (!this.entries.has(key)) {
+            return undefined;
+        }
+        const value = this.entries.get(key);
+        this.entries.delete(key);
+        this.entries.set(key, value);
+        return value;
+    }
+
+    // Store the entry and drop the least recently used ones over the limit
+    set(key, value) {
+        this.entries.delete(key);
+        this.entries.set(key, value);
+        while (this.entries.size > this.maxSize) {
+            this.entries.delete(this.entries.keys().next().value);
+        }
+    }
+}
+
+// Function to move a 'YYYY-MM-DD' date by a number of days
+function shiftDate(dateString, days) {
+    const date = new Date(`${dateString}T00:00:00Z`);
+    date.setUTCDate(date.getUTCDate() + days);
+    return date.toISOString().slice(0, 10);
+}
+
+// Function to get the Monday of the week of a 'YYYY-MM-DD' date
+function getWeekStart(dateString) {
+    const weekday = (new Date(`${dateString}T00:00:00Z`).getUTCDay() + 6) % 7;
+    return shiftDate(dateString, -weekday);
+}
+
+// Function to format a 'YYYY-MM-DD' date for the grid header
+function formatDate(dateString) {
+    return new Date(`${dateString}T00:00:00Z`).toLocaleDateString('en-US', {
+        year: 'numeric', month: 'short', day: 'numeric', timeZone: 'UTC'
+    });
+}
+
+// Function to read the selected date and study group from the form
+function getSelection(form) {
+    return {
+        date: form.querySelector("[name='date']").value,
+        studyGroup: form.querySelector("select[name='study_group']").value,
+    };
+}
+
+// Function to get the cache key of the week of a selection
+function getWeekKey(selection) {
+    return `${selection.studyGroup}:${getWeekStart(selection.date)}`;
+}
+
+// Function to build the JSON API URL of the week of a selection
+function buildWeekUrl(apiUrl, selection) {
+    const params = new URLSearchParams({
+        date: getWeekStart(selection.date),
+        study_group: selection.studyGroup,
+    });
+    return `${apiUrl}?${params}`;
+}
+
+// Function to build the page URL of a selection
+function buildPageUrl(pagePath, selection, isStudent) {
+    const params = new URLSearchParams({ date: selection.date });
+    if (!isStudent) {
+        params.set('study_group', selection.studyGroup);
+    }
+    return `${pagePath}?${params}`;
+}
+
+// Function to load a week from the JSON API
+function fetchWeek(apiUrl, selection) {
+    return fetch(buildWeekUrl(apiUrl, selection), {
+        credentials: 'same-origin',
+        headers: { 'Accept': 'application/json' },
+    }).then(function (response) {
+        if (!response.ok) {
+            throw new Error(`Week request failed with status ${response.status}`);
+        }
+        return response.json().then(function (data) {
+            return { etag: response.headers.get('ETag'), data: data };
+        });
+    });
+}
+
+// Function to create an element with classes and text
+function createElement(tagName, className, text) {
+    const element = document.createElement(tagName);
+    if (className) {
+        element.className = className;
+    }
+    if (text !== undefined && text !== null) {
+        element.textContent = text;
+    }
+    return element;
+}
+
+// Function to create the subject row of a lesson
+function createSubjectRow(order, subject) {
+    const row = createElement('div', 'row m-0 p-0');
+    row.append(
+        createElement('div', 'col-2 text-center p-0 m-0 border-end border-bottom border-secondary', order),
+        createElement('div', 'col-10 px-1 m-0 border-bottom border-secondary', subject)
+    );
+    return row;
+}
+
+// Function to create the homework cell with the marks badge
+function createHomeworkCell(tagName, lesson, badgeLabel) {
+    const cell = createElement(tagName, 'col-10 px-1 position-relative text-truncate', lesson ? `Tasks: ${lesson.homework}` : '');
+    if (lesson && lesson.marks) {
+        const badge = createElement('span', 'badge bg-primary rounded-pill position-absolute end-0', lesson.marks);
+        badge.setAttribute('aria-label', badgeLabel);
+        cell.append(badge);
+    }
+    return cell;
+}
+
+// Function to create a lesson of the tutor's grid linked to its form
+function createTutorLesson(day, order, lesson, options) {
+    const link = createElement('a', 'text-decoration-none text-reset');
+    if (lesson) {
+        link.href = options.editUrl.replace('/0/', `/${lesson.id}/`);
+        link.setAttribute('aria-label', `Edit schedule for ${lesson.subject} and order ${order} on ${day.label}, ${formatDate(day.date)}`);
+    } else {
+        const params = new URLSearchParams({
+            date: day.date, study_group: options.studyGroup, order_number: order
+        });
+        link.href = `${options.addUrl}?${params}`;
+        link.setAttribute('aria-label', `Add a schedule on ${day.label}, ${formatDate(day.date)} for order ${order}`);
+    }
+    const homeworkRow = createElement('div', `row m-0 p-0${order < LESSONS_PER_DAY ? ' border-bottom border-light' : ''}`);
+    homeworkRow.append(
+        createElement('div', 'col-2 text-center p-0 m-0 border-end border-secondary', 'H'),
+        createHomeworkCell('div', lesson, 'Number of marks for this subject')
+    );
+    const content = createElement('div', 'row m-0');
+    content.append(createSubjectRow(order, lesson ? lesson.subject : ''), homeworkRow);
+    link.append(content);
+    return link;
+}
+
+// Function to create a lesson of the student's grid with the homework
+function createStudentLesson(day, order, lesson) {
+    const collapseId = `collapse-${day.weekday}-${order}`;
+    const button = createElement('button', 'accordion-button');
+    button.type = 'button';
+    button.setAttribute('data-bs-toggle', 'collapse');
+    button.setAttribute('data-bs-target', `#${collapseId}`);
+    button.setAttribute('aria-expanded', 'true');
+    button.setAttribute('aria-controls', collapseId);
+    button.setAttribute('aria-label', `View homework details for ${lesson ? lesson.subject : ''} on ${day.label}`);
+    const chevron = createElement('span', 'col-2 text-center p-0 m-0 border-end border-secondary');
+    chevron.append(createElement('i', 'fas fa-chevron-down ms-auto'));
+    button.append(chevron, createHomeworkCell('span', lesson, `Your mark: ${lesson ? lesson.marks : ''}`));
+
+    const header = createElement('div', 'accordion-header');
+    header.append(button);
+    const collapse = createElement('div', 'accordion-collapse collapse border-top border-secondary');
+    collapse.id = collapseId;
+    collapse.setAttribute('data-bs-parent', '#accordionExample');
+    collapse.append(createElement('div', 'accordion-body p-1', lesson ? `Tasks: ${lesson.homework}` : ''));
+    const item = createElement('div', 'accordion-item p-0');
+    item.append(header, collapse);
+
+    const homeworkRow = createElement('div', `row m-0 p-0${order < LESSONS_PER_DAY ? ' border-bottom border-light' : ''}`);
+    homeworkRow.append(item);
+    const content = createElement('div', 'row m-0');
+    content.append(createSubjectRow(order, lesson ? lesson.subject : ''), homeworkRow);
+    return content;
+}
+
+// Function to create the column of a day with all its lessons
+function createDayColumn(day, options) {
+    const header = createElement('div', `card-header ${day.weekday < 5 ? 'text-bg-info' : 'text-bg-danger'} text-light bg-opacity-50 text-uppercase`);
+    const headerContainer = createElement('div', 'container');
+    headerContainer.append(
+        createElement('div', 'row', day.label),
+        createElement('div', 'row', formatDate(day.date))
+    );
+    header.append(headerContainer);
+
+    const lessons = new Map(day.lessons.map(lesson => [lesson.order_number, lesson]));
+    const list = createElement('ul', 'list-group list-group-flush bg-transparent');
+    for (let order = 1; order <= LESSONS_PER_DAY; order++) {
+        const listItem = createElement('li', 'list-group-item p-0 text-bg-secondary bg-opacity-50 border-0');
+        listItem.append(
+            options.isStudent
+                ? createStudentLesson(day, order, lessons.get(order))
+                : createTutorLesson(day, order, lessons.get(order), options)
+        );
+        list.append(listItem);
+    }
+
+    const card = createElement('div', 'card bg-transparent mt-3 border-light');
+    card.append(header, list);
+    const column = createElement('div', 'col px-0');
+    column.append(card);
+    return column;
+}
+
+// Function to replace the schedule grid with the loaded week
+function renderWeek(schedule, data) {
+    const options = {
+        isStudent: schedule.getAttribute('data-template-name') === 'student-schedule',
+        editUrl: schedule.getAttribute('data-edit-url'),
+        addUrl: schedule.getAttribute('data-add-url'),
+        studyGroup: data.study_group.id,
+    };
+    const grid = schedule.querySelector('.row');
+    grid.replaceChildren(...data.days.map(day => createDayColumn(day, options)));
+
+    const isEmpty = data.days.every(day => day.lessons.length === 0);
+    schedule.setAttribute('data-empty', isEmpty ? 'True' : 'False');
+    const fillForm = document.getElementById('fill-form');
+    if (fillForm) {
+        fillForm.querySelector("[name='date']").value = data.week_start;
+        fillForm.querySelector("[name='study_group']").value = data.study_group.id;
+        fillForm.hidden = !isEmpty;
+    }
+}
+
+// Function to set up the asynchronous week navigation of the schedule grid
+function createWeekNavigation(form, schedule, onSelectionChange) {
+    const apiUrl = schedule.getAttribute('data-api-url');
+    const isStudent = schedule.getAttribute('data-template-name') === 'student-schedule';
+    const cache = new WeekCache();
+    const pending = new Map();
+    let currentKey = null;
+
+    // Request a week once, sharing the request between callers
+    const request = function (selection) {
+        const key = getWeekKey(selection);
+        if (!pending.has(key)) {
+            pending.set(key, fetchWeek(apiUrl, selection).then(function (entry) {
+                pending.delete(key);
+                cache.set(key, entry);
+                return entry;
+            }, function (error) {
+                pending.delete(key);
+                throw error;
+            }));
+        }
+        return pending.get(key);
+    };
+
+    // Load the previous and the next week in the background
+    const prefetch = function (selection) {
+        const idle = window.requestIdleCallback || function (callback) {
+            return setTimeout(callback, 200);
+        };
+        idle(function () {
+            [-7, 7].forEach(function (days) {
+                const adjacent = { ...selection, date: shiftDate(selection.date, days) };
+                if (!cache.has(getWeekKey(adjacent))) {
+                    request(adjacent).catch(function () {});
+                }
+            });
+        });
+    };
+
+    const load = function (selection, { push = true } = {}) {
+        const key = getWeekKey(selection);
+        const pageUrl = buildPageUrl(window.location.pathname, selection, isStudent);
+        currentKey = key;
+        form.querySelector("[name='date']").value = selection.date;
+        form.querySelector("select[name='study_group']").value = selection.studyGroup;
+        onSelectionChange();
+        if (push && pageUrl !== window.location.pathname + window.location.search) {
+            window.history.pushState(selection, '', pageUrl);
+        }
+
+        // Show a recently viewed week at once and revalidate it
+        const cached = cache.get(key);
+        if (cached) {
+            renderWeek(schedule, cached.data);
+        }
+        return request(selection).then(function (entry) {
+            if (key === currentKey && (!cached || cached.etag !== entry.etag)) {
+                renderWeek(schedule, entry.data);
+            }
+            prefetch(selection);
+        }).catch(function () {
+            // Fall back to the server rendered page
+            window.location.assign(pageUrl);
+        });
+    };
+
+    return {
+        load: load,
+        shift: function (days) {
+            const selection = getSelection(form);
+            if (selection.date && selection.studyGroup) {
+                load({ ...selection, date: shiftDate(selection.date, days) });
+            }
+        },
+        start: function () {
+            const selection = getSelection(form);
+            if (selection.date && selection.studyGroup) {
+                currentKey = getWeekKey(selection);
+                window.history.replaceState(selection, '', window.location.href);
+                prefetch(selection);
+            }
+        },
+    };
+}
+
 if (typeof module !== 'undefined' && module.exports) {
-    module.exports = { areAllFieldsFilled, updateSelectionDescription };
+    module.exports = {
+        areAllFieldsFilled,
+        updateSelectionDescription,
+        WeekCache,
+        shiftDate,
+        getWeekStart,
+        getWeekKey,
+        buildWeekUrl,
+        buildPageUrl,
+        renderWeek,
+        createWeekNavigation,
+    };
 }
\ No newline at end of file
@@ -3,7 +3,17 @@
  * @jest-environment jsdom
 */
 
-const { areAllFieldsFilled, updateSelectionDescription } = require("../dashboard");
+const {
+    areAllFieldsFilled,
+    updateSelectionDescription,
+    WeekCache,
+    shiftDate,
+    getWeekStart,
+    buildWeekUrl,
+    buildPageUrl,
+    renderWeek,
+    createWeekNavigation,
+} = require("../dashboard");
 
 const htmlSheduleTemplates = `
     <form id="selection-shedule-templates">
@@ -150,4 +160,175 @@ describe('Schedule Selection Form', () => {
         
         expect(areAllFieldsFilled(form)).toBe(false);
     });
-});
\ No newline at end of file
+});
+
+
+const htmlWeekSchedule = `
+    <form id="selection-schedule">
+        <input type="date" name="date" value="2024-09-05" required>
+        <select name="study_group" required>
+            <option value=""></option>
+            <option value="1" selected>Group A</option>
+            <option value="2">Group B</option>
+        </select>
+    </form>
+    <form id="fill-form" hidden>
+        <input type="hidden" name="date">
+        <input type="hidden" name="study_group">
+    </form>
+    <div id="schedule" data-empty="False" data-template-name="schedule"
+        data-api-url="/tutor/api/schedule/week/" data-edit-url="/tutor/schedule/edit/0/"
+        data-add-url="/tutor/schedule/add/">
+        <div class="row"></div>
+    </div>
+`;
+
+// Function to build the API response of a week with one lesson
+function getWeekData(weekStart, lessons = []) {
+    const labels = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'];
+    return {
+        study_group: { id: 1, name: 'Group A' },
+        week_start: weekStart,
+        week_end: shiftDate(weekStart, 6),
+        days: labels.map((label, weekday) => ({
+            weekday: weekday,
+            label: label,
+            date: shiftDate(weekStart, weekday),
+            lessons: weekday === 2 ? lessons : [],
+        })),
+    };
+}
+
+// Function to let the pending promises settle
+async function flushPromises() {
+    for (let i = 0; i < 10; i++) {
+        await Promise.resolve();
+    }
+}
+
+// Function to mock a successful API response
+function mockResponse(data, etag) {
+    return Promise.resolve({
+        ok: true,
+        status: 200,
+        headers: { get: () => etag },
+        json: () => Promise.resolve(data),
+    });
+}
+
+describe('Week helpers', () => {
+    test('should find the Monday of the week', () => {
+        expect(getWeekStart('2024-09-02')).toBe('2024-09-02');
+        expect(getWeekStart('2024-09-05')).toBe('2024-09-02');
+        expect(getWeekStart('2024-09-08')).toBe('2024-09-02');
+    });
+
+    test('should shift dates across months and years', () => {
+        expect(shiftDate('2024-12-30', 7)).toBe('2025-01-06');
+        expect(shiftDate('2024-03-04', -7)).toBe('2024-02-26');
+    });
+
+    test('should build the API and page URLs', () => {
+        const selection = { date: '2024-09-05', studyGroup: '1' };
+        expect(buildWeekUrl('/api/', selection)).toBe('/api/?date=2024-09-02&study_group=1');
+        expect(buildPageUrl('/tutor/schedule/', selection, false)).toBe('/tutor/schedule/?date=2024-09-05&study_group=1');
+        expect(buildPageUrl('/student/', selection, true)).toBe('/student/?date=2024-09-05');
+    });
+});
+
+describe('WeekCache', () => {
+    test('should drop the least recently used week', () => {
+        const cache = new WeekCache(2);
+        cache.set('a', 1);
+        cache.set('b', 2);
+        expect(cache.get('a')).toBe(1);
+        cache.set('c', 3);
+
+        expect(cache.has('a')).toBe(true);
+        expect(cache.has('b')).toBe(false);
+        expect(cache.has('c')).toBe(true);
+    });
+});
+
+describe('Week rendering', () => {
+    beforeEach(() => {
+        document.body.innerHTML = htmlWeekSchedule;
+    });
+
+    test('should render the lessons with links and marks', () => {
+        const schedule = document.getElementById('schedule');
+        renderWeek(schedule, getWeekData('2024-09-02', [
+            { id: 5, order_number: 2, subject: 'Math', homework: '<b>Read</b>', marks: 3 },
+        ]));
+
+        const columns = schedule.querySelectorAll('.row > .col');
+        expect(columns.length).toBe(7);
+        const links = columns[2].querySelectorAll('a');
+        expect(links.length).toBe(10);
+        expect(links[1].getAttribute('href')).toBe('/tutor/schedule/edit/5/');
+        expect(links[1].textContent).toContain('Tasks: <b>Read</b>');
+        expect(links[1].querySelector('.badge').textContent).toBe('3');
+        expect(links[0].getAttribute('href')).toBe(
+            '/tutor/schedule/add/?date=2024-09-04&study_group=1&order_number=1'
+        );
+        expect(schedule.getAttribute('data-empty')).toBe('False');
+        expect(document.getElementById('fill-form').hidden).toBe(true);
+    });
+
+    test('should show the fill form for an empty week', () => {
+        const schedule = document.getElementById('schedule');
+        renderWeek(schedule, getWeekData('2024-09-09'));
+
+        const fillForm = document.getElementById('fill-form');
+        expect(schedule.getAttribute('data-empty')).toBe('True');
+        expect(fillForm.hidden).toBe(false);
+        expect(fillForm.querySelector("[name='date']").value).toBe('2024-09-09');
+    });
+});
+
+describe('Week navigation', () => {
+    let form, schedule, onSelectionChange;
+
+    beforeEach(() => {
+        jest.useFakeTimers();
+        document.body.innerHTML = htmlWeekSchedule;
+        form = document.getElementById('selection-schedule');
+        schedule = document.getElementById('schedule');
+        onSelectionChange = jest.fn();
+        global.fetch = jest.fn(url => {
+            const weekStart = new URL(url, 'http://localhost').searchParams.get('date');
+            return mockResponse(getWeekData(weekStart), `"${weekStart}"`);
+        });
+    });
+
+    afterEach(() => {
+        jest.useRealTimers();
+        delete global.fetch;
+    });
+
+    test('should prefetch the adjacent weeks', () => {
+        const navigation = createWeekNavigation(form, schedule, onSelectionChange);
+        navigation.start();
+        jest.runAllTimers();
+
+        expect(global.fetch.mock.calls.map(call => call[0])).toEqual([
+            '/tutor/api/schedule/week/?date=2024-08-26&study_group=1',
+            '/tutor/api/schedule/week/?date=2024-09-09&study_group=1',
+        ]);
+    });
+
+    test('should show the next week from the cache', async () => {
+        const navigation = createWeekNavigation(form, schedule, onSelectionChange);
+        navigation.start();
+        jest.runAllTimers();
+        await flushPromises();
+
+        navigation.shift(7);
+
+        // The prefetched week is rendered before the revalidation finishes
+        expect(form.querySelector("[name='date']").value).toBe('2024-09-12');
+        expect(onSelectionChange).toHaveBeenCalled();
+        expect(schedule.querySelectorAll('.card-header')[0].textContent).toContain('Sep 9, 2024');
+        expect(window.location.search).toBe('?date=2024-09-12&study_group=1');
+    });
+});
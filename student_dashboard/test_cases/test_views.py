@@ -0,0 +1,207 @@
+from datetime import date
+
+from django.contrib.auth.models import User, Group
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from dictionaries.forms import GradebookFilterForm, HomeworkSearchForm
+from dictionaries.mark_summary import rebuild_mark_summaries
+from dictionaries.models import (
+    Schedule,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term
+)
+from users.models import UserProfile
+
+
+class GradebookViewTests(TestCase):
+    """ Test suite for GradebookView. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a term, a lesson and marks of two students. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.subject = Subject.objects.create(name="Math")
+        cls.schedule = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=cls.subject
+        )
+        cls.tutor_user = User.objects.create_user(
+            username="tutor",
+            password="password"
+        )
+        cls.tutor_user.groups.add(Group.objects.get(name="Tutor"))
+        cls.students = []
+        for username, mark in (("student", 80), ("other", 40)):
+            student = User.objects.create_user(
+                username=username,
+                password="password"
+            )
+            student.groups.add(Group.objects.get(name="Student"))
+            UserProfile.objects.create(
+                user=student, study_group=cls.study_group, checked=True
+            )
+            StudentMark.objects.create(
+                schedule=cls.schedule, student=student, mark=mark
+            )
+            cls.students.append(student)
+        rebuild_mark_summaries()
+
+    def setUp(self):
+        """ Sets up a test client and the URL for the gradebook view. """
+        self.client = Client()
+        self.url = reverse('student:gradebook')
+
+    def test_get_without_selection(self):
+        """ Test that the page renders an empty gradebook with the form. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'student_dashboard/gradebook.html')
+        self.assertIsInstance(response.context['form'], GradebookFilterForm)
+        self.assertEqual(response.context['gradebook'], [])
+
+    def test_tutor_sees_all_students(self):
+        """ Test that a tutor sees statistics of the whole study group. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.get(self.url, {
+            'term': self.term.pk,
+            'study_group': self.study_group.pk
+        })
+
+        self.assertEqual(len(response.context['gradebook']), 2)
+
+    def test_student_sees_only_own_marks(self):
+        """ Test that a student sees only their own statistics. """
+        self.client.login(username="student", password="password")
+        response = self.client.get(self.url, {'term': self.term.pk})
+
+        gradebook = response.context['gradebook']
+        self.assertEqual(len(gradebook), 1)
+        self.assertEqual(gradebook[0]['student'], self.students[0].pk)
+        self.assertEqual(gradebook[0]['average'], 80.0)
+
+    def test_anonymous_user_is_redirected(self):
+        """ Test that an anonymous user cannot open the gradebook. """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+
+
+class HomeworkSearchViewTests(TestCase):
+    """ Test suite for HomeworkSearchView. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up lessons with homework of two study groups. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.other_group = StudyGroup.objects.create(name="Group B")
+        subject = Subject.objects.create(name="Math")
+        for day in range(2, 27):
+            Schedule.objects.create(
+                study_group=cls.study_group,
+                date=date(2024, 9, day),
+                order_number=1,
+                subject=subject,
+                homework=f"Exercise {day}"
+            )
+        Schedule.objects.create(
+            study_group=cls.other_group,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=subject,
+            homework="Exercise of group B"
+        )
+        tutor = User.objects.create_user(
+            username="tutor",
+            password="password"
+        )
+        tutor.groups.add(Group.objects.get(name="Tutor"))
+        student = User.objects.create_user(
+            username="student",
+            password="password"
+        )
+        student.groups.add(Group.objects.get(name="Student"))
+        UserProfile.objects.create(
+            user=student, study_group=cls.study_group, checked=True
+        )
+
+    def setUp(self):
+        """ Sets up a test client and the URL for the search view. """
+        self.client = Client()
+        self.url = reverse('student:homework_search')
+
+    def test_empty_search(self):
+        """ Test that the page renders the form without results. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(
+            response, 'student_dashboard/homework_search.html'
+        )
+        self.assertIsInstance(response.context['form'], HomeworkSearchForm)
+        self.assertIsNone(response.context['page'])
+
+    def test_paginated_results(self):
+        """ Test that the results are paginated newest first. """
+        self.client.login(username="tutor", password="password")
+        params = {
+            'q': 'exercise',
+            'study_group': self.study_group.pk,
+            'term': self.term.pk,
+        }
+        response = self.client.get(self.url, params)
+
+        page = response.context['page']
+        self.assertEqual(page.paginator.count, 25)
+        self.assertEqual(len(page.object_list), 20)
+        self.assertEqual(page.object_list[0].date, date(2024, 9, 26))
+        self.assertNotIn('page=', response.context['query_string'])
+
+        response = self.client.get(self.url, {**params, 'page': 2})
+        self.assertEqual(len(response.context['page'].object_list), 5)
+
+    def test_student_searches_own_group(self):
+        """ Test that a student always searches the own study group. """
+        self.client.login(username="student", password="password")
+        response = self.client.get(self.url, {
+            'q': 'group', 'study_group': self.other_group.pk
+        })
+
+        self.assertEqual(response.context['page'].paginator.count, 0)
+        self.assertContains(response, 'No lessons found for the search.')
+
+    def test_invalid_date_range(self):
+        """ Test that a reversed date range is reported. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.get(self.url, {
+            'q': 'exercise',
+            'study_group': self.study_group.pk,
+            'date_from': '2024-10-01',
+            'date_to': '2024-09-01',
+        })
+
+        self.assertIsNone(response.context['page'])
+        self.assertContains(
+            response, 'The start date must not be later than the end date.'
+        )
+
+    def test_anonymous_user_is_redirected(self):
+        """ Test that an anonymous user cannot search. """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
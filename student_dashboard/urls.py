@@ -1,7 +1,9 @@
 from django.urls import path
-from .views import StudentScheduleView
+from .views import StudentScheduleView, GradebookView, HomeworkSearchView
 
 app_name = "student"
 urlpatterns = [
-    path('', StudentScheduleView.as_view(), name='dashboard'), 
+    path('', StudentScheduleView.as_view(), name='dashboard'),
+    path('gradebook/', GradebookView.as_view(), name='gradebook'),
+    path('search/', HomeworkSearchView.as_view(), name='homework_search'),
 ]
@@ -1,5 +1,14 @@
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.contrib import messages
+from django.core.paginator import Paginator
+from django.shortcuts import render
+from django.views.generic import View
 
+from dictionaries.forms import GradebookFilterForm, HomeworkSearchForm
+from dictionaries.gradebook import MARK_BANDS, get_gradebook
+from dictionaries.homework_search import search_schedules
 from tutor_dashboard.views import ScheduleView
+from users.roles import get_user_role
 
 
 class StudentScheduleView(ScheduleView):
@@ -13,3 +22,141 @@ class StudentScheduleView(ScheduleView):
     """
     template_name = 'student_dashboard/student_dashboard.html'
     url_name = 'student:dashboard'
+
+
+class GradebookView(PermissionRequiredMixin, View):
+    """
+    View for displaying mark statistics for a term per student and subject.
+
+    Students see only their own marks in their study group; tutors select
+    a study group and, optionally, a subject.
+    """
+    template_name = 'student_dashboard/gradebook.html'
+    permission_required = 'dictionaries.view_studentmark'
+
+    def get(self, request):
+        """
+        Handles GET requests to display the gradebook filter form and the
+        statistics for the selected filters.
+
+        Parameters:
+        - request: The HTTP request object containing optional query parameters
+        for term, study group and subject.
+
+        Returns:
+        - Renders the gradebook page with the filter form and the gradebook
+        rows if the selection is valid.
+        """
+        user_role = get_user_role(request.user)
+        get_params = request.GET
+        if user_role.is_student and get_params:
+            get_params = request.GET.copy()
+            get_params['study_group'] = user_role.study_group
+
+        form = GradebookFilterForm(
+            get_params or None,
+            is_student=user_role.is_student,
+            user_study_group=user_role.study_group,
+        )
+
+        gradebook = []
+        if form.is_valid():
+            gradebook = get_gradebook(
+                form.cleaned_data['term'],
+                study_group=form.cleaned_data['study_group'],
+                subject=form.cleaned_data['subject'],
+                student=request.user if user_role.is_student else None,
+            )
+            if not gradebook:
+                messages.info(
+                    request, "No marks available for the selected filters."
+                )
+        elif form.is_bound:
+            # Form validation error message
+            for field, errors in form.errors.items():
+                messages.error(
+                    request, f"Error in {field}: {', '.join(errors)}"
+                )
+
+        return render(
+            request,
+            self.template_name,
+            {
+                'form': form,
+                'gradebook': gradebook,
+                'mark_bands': [
+                    f"{band[0]}-{band[1]}" for band in MARK_BANDS
+                ],
+            }
+        )
+
+
+class HomeworkSearchView(PermissionRequiredMixin, View):
+    """
+    View for finding lessons of a study group by homework text and subject
+    name within a term or a date range.
+
+    Students search only their own study group; tutors select a study group.
+    """
+    template_name = 'student_dashboard/homework_search.html'
+    permission_required = 'dictionaries.view_schedule'
+    paginate_by = 20
+
+    def get(self, request):
+        """
+        Handles GET requests to display the search form and a page of the
+        matching lessons.
+
+        Parameters:
+        - request: The HTTP request object containing optional query parameters
+        for the searched words, study group, term, date range and page.
+
+        Returns:
+        - Renders the search page with the form, the page of the lessons and
+        the query string of the search without the page number.
+        """
+        user_role = get_user_role(request.user)
+        get_params = request.GET
+        if user_role.is_student and get_params:
+            get_params = request.GET.copy()
+            get_params['study_group'] = user_role.study_group
+
+        form = HomeworkSearchForm(
+            get_params or None,
+            is_student=user_role.is_student,
+            user_study_group=user_role.study_group,
+        )
+
+        page = None
+        if form.is_valid():
+            schedules = search_schedules(
+                form.cleaned_data['q'],
+                form.cleaned_data['study_group'],
+                date_from=form.cleaned_data['date_from'],
+                date_to=form.cleaned_data['date_to'],
+            )
+            page = Paginator(schedules, self.paginate_by).get_page(
+                request.GET.get('page')
+            )
+            if not page.object_list:
+                messages.info(
+                    request, "No lessons found for the search."
+                )
+        elif form.is_bound:
+            # Form validation error message
+            for field, errors in form.errors.items():
+                messages.error(
+                    request, f"Error in {field}: {', '.join(errors)}"
+                )
+
+        query_params = request.GET.copy()
+        query_params.pop('page', None)
+        return render(
+            request,
+            self.template_name,
+            {
+                'form': form,
+                'page': page,
+                'query_string': query_params.urlencode(),
+            }
+        )
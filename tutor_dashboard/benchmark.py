@@ -0,0 +1,409 @@
+import copy
+import platform
+import statistics
+import subprocess
+import time
+from contextlib import nullcontext
+from datetime import timedelta
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, transaction
+from django.db.backends.signals import connection_created
+from django.db.models import Count
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from dictionaries.models import Schedule, StudentMark, StudyGroup
+from dictionaries.schedule_cache import get_cache, get_week_start
+from dictionaries.term_index import get_term_index
+from main.context_processors import current_year
+from main.timing import get_percentile
+from student_dashboard.views import StudentScheduleView
+from users.context_processors import user_profile_parameters
+from users.models import UserProfile
+from users.roles import TUTOR_GROUP
+
+from .views.schedule_template_views import ScheduleTemplateView
+from .views.schedule_views import (
+    EditScheduleView,
+    FillScheduleView,
+    ScheduleView
+)
+
+DEFAULT_ITERATIONS = 20
+
+
+class BenchmarkData:
+    """
+    The users and rows the benchmarks request.
+
+    The student with the most marked lessons is chosen, so the benchmarks
+    run against the busiest study group of the dataset.
+
+    Attributes:
+        tutor (User): A tutor.
+        student (User): A checked student.
+        study_group (StudyGroup): The student's study group.
+        lesson (Schedule): The student's lesson with the most marks.
+        term (Term): The term of the lesson.
+    """
+    def __init__(self):
+        profile = UserProfile.objects.filter(
+            checked=True, study_group__isnull=False
+        ).select_related('user', 'study_group').annotate(
+            marks=Count('user__studentmark')
+        ).order_by('-marks', 'pk').first()
+        self.tutor = User.objects.filter(groups__name=TUTOR_GROUP).first()
+        if profile is None or self.tutor is None:
+            raise ValueError(
+                "No tutor or checked student found. Generate the data with "
+                "generate_synthetic_data first."
+            )
+        self.student = profile.user
+        self.study_group = profile.study_group
+        self.lesson = Schedule.objects.filter(
+            study_group=self.study_group
+        ).annotate(
+            marks=Count('studentmark')
+        ).order_by('-marks', 'date').first()
+        if self.lesson is None:
+            raise ValueError("The study group of the student has no lessons.")
+        self.term = get_term_index().get_term(self.lesson.date)
+
+
+def get_request(user, path='/', method='get', data=None):
+    """
+    Builds a request as the middleware would pass it to a view.
+
+    Args:
+        user (User): The user of the request. A copy without the cached role
+        is attached, as every request loads the user again.
+        path (str): The requested path.
+        method (str): The HTTP method.
+        data (dict, optional): The GET or POST parameters.
+
+    Returns:
+        HttpRequest: The request with a session and message storage.
+    """
+    request = getattr(RequestFactory(), method)(path, data or {})
+    request.user = copy.copy(user)
+    request.user.__dict__.pop('_user_role', None)
+    request.session = SessionBase()
+    request._messages = FallbackStorage(request)
+    return request
+
+
+def tutor_schedule(data):
+    """ Returns a call of the tutor's weekly schedule. """
+    request = get_request(data.tutor, data={
+        'date': data.lesson.date, 'study_group': data.study_group.pk
+    })
+    return lambda: ScheduleView.as_view()(request)
+
+
+def student_schedule(data):
+    """ Returns a call of the student's weekly schedule. """
+    request = get_request(data.student, data={'date': data.lesson.date})
+    return lambda: StudentScheduleView.as_view()(request)
+
+
+def edit_schedule(data):
+    """ Returns a call of the lesson page with the marks of the students. """
+    request = get_request(data.tutor)
+    return lambda: EditScheduleView.as_view()(request, pk=data.lesson.pk)
+
+
+def fill_schedule(data):
+    """
+    Returns a call filling the week of the lesson from the templates. The
+    lessons of the week are deleted first and restored by the rollback.
+    """
+    week_start = get_week_start(data.lesson.date)
+    Schedule.objects.filter(
+        study_group=data.study_group,
+        date__range=(week_start, week_start + timedelta(days=6))
+    ).delete()
+    request = get_request(data.tutor, method='post', data={
+        'date': data.lesson.date, 'study_group': data.study_group.pk
+    })
+    return lambda: FillScheduleView.as_view()(request)
+
+
+def template_grid(data):
+    """ Returns a call of the schedule template grid of the term. """
+    request = get_request(data.tutor, data={
+        'term': data.term.pk if data.term else '',
+        'study_group': data.study_group.pk
+    })
+    return lambda: ScheduleTemplateView.as_view()(request)
+
+
+def context_processors(data):
+    """ Returns a call of the context processors of a student request. """
+    def run():
+        request = get_request(data.student)
+        user_profile_parameters(request)
+        current_year(request)
+    return run
+
+
+# Benchmarked paths by name
+BENCHMARKS = {
+    'tutor_schedule': tutor_schedule,
+    'student_schedule': student_schedule,
+    'edit_schedule': edit_schedule,
+    'fill_schedule': fill_schedule,
+    'template_grid': template_grid,
+    'context_processors': context_processors,
+}
+
+# Benchmarks writing to the database, run in rolled back transactions
+WRITING_BENCHMARKS = {'fill_schedule'}
+
+
+def measure(benchmark, data, iterations, cold_cache=False, rollback=False):
+    """
+    Times a benchmark and counts its queries.
+
+    Writing benchmarks run every iteration in a transaction that is rolled
+    back, so they start from the same data. The others run outside of a
+    transaction, as the choices and the term index are not kept when they
+    are loaded inside one.
+
+    Args:
+        benchmark (callable): The benchmark function.
+        data (BenchmarkData): The users and rows to request.
+        iterations (int): The number of timed runs.
+        cold_cache (bool): Clear the schedule cache before every run.
+        rollback (bool): Roll back the changes of every run.
+
+    Returns:
+        dict: The number of queries of the last run and the minimum,
+        median, p95 and mean durations in milliseconds.
+    """
+    durations = []
+    queries = 0
+    for _ in range(iterations):
+        with transaction.atomic() if rollback else nullcontext():
+            if cold_cache:
+                get_cache().clear()
+            run = benchmark(data)
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                run()
+                durations.append(time.perf_counter() - started)
+            queries = len(captured)
+            if rollback:
+                transaction.set_rollback(True)
+
+    durations.sort()
+    return {
+        'queries': queries,
+        'min_ms': round(durations[0] * 1000, 3),
+        'median_ms': round(statistics.median(durations) * 1000, 3),
+        'p95_ms': round(get_percentile(durations, 95) * 1000, 3),
+        'mean_ms': round(statistics.mean(durations) * 1000, 3),
+    }
+
+
+def get_revision():
+    """
+    Returns the current git commit, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    names=None, iterations=DEFAULT_ITERATIONS, cold_cache=False
+):
+    """
+    Runs benchmarks against the current database.
+
+    Args:
+        names (list, optional): The names of the benchmarks. All benchmarks
+        run when it is empty.
+        iterations (int): The number of timed runs per benchmark.
+        cold_cache (bool): Clear the schedule cache before every run.
+
+    Returns:
+        dict: The environment, the size of the dataset and the results by
+        benchmark name, comparable across commits.
+
+    Raises:
+        ValueError: If the database has no data to benchmark.
+    """
+    data = BenchmarkData()
+    return {
+        'revision': get_revision(),
+        'created_at': timezone.now().isoformat(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'iterations': iterations,
+        'cold_cache': cold_cache,
+        'dataset': {
+            'study_groups': StudyGroup.objects.count(),
+            'students': UserProfile.objects.count(),
+            'lessons': Schedule.objects.count(),
+            'marks': StudentMark.objects.count(),
+        },
+        'results': {
+            name: measure(
+                BENCHMARKS[name],
+                data,
+                iterations,
+                cold_cache,
+                rollback=name in WRITING_BENCHMARKS
+            )
+            for name in names or BENCHMARKS
+        },
+    }
+
+
+def get_environ(user, path, data):
+    """
+    Builds the WSGI environ of a GET request of a logged in user.
+
+    Args:
+        user (User): The user of the request.
+        path (str): The requested path.
+        data (dict): The GET parameters.
+
+    Returns:
+        dict: The environ with the session cookie of the user.
+    """
+    client = Client()
+    client.force_login(user)
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': urlencode(data),
+        'HTTP_COOKIE': f"{settings.SESSION_COOKIE_NAME}="
+        f"{client.cookies[settings.SESSION_COOKIE_NAME].value}",
+    }
+    setup_testing_defaults(environ)
+    return environ
+
+
+def send_wsgi_request(application, environ):
+    """
+    Sends a request to the WSGI application as a WSGI server would, so the
+    request signals open and close the database connections.
+    """
+    response = application(dict(environ), lambda status, headers: None)
+    try:
+        b''.join(response)
+    finally:
+        response.close()
+
+
+def measure_connections(application, environ, conn_max_age, iterations):
+    """
+    Times requests with a lifetime of the database connections.
+
+    Args:
+        application (WSGIHandler): The WSGI application.
+        environ (dict): The environ of the request.
+        conn_max_age (int): The CONN_MAX_AGE of the default database.
+        iterations (int): The number of timed requests.
+
+    Returns:
+        dict: The lifetime, the number of opened connections and the
+        median, p95 and mean durations in milliseconds.
+    """
+    settings_dict = connection.settings_dict
+    previous = settings_dict['CONN_MAX_AGE']
+    opened = []
+
+    def count(sender, connection, **kwargs):
+        opened.append(connection.alias)
+
+    settings_dict['CONN_MAX_AGE'] = conn_max_age
+    connection.close()
+    connection_created.connect(count)
+    durations = []
+    try:
+        # Loads the templates and caches
+        send_wsgi_request(application, environ)
+        opened.clear()
+        for _ in range(iterations):
+            started = time.perf_counter()
+            send_wsgi_request(application, environ)
+            durations.append(time.perf_counter() - started)
+    finally:
+        connection_created.disconnect(count)
+        settings_dict['CONN_MAX_AGE'] = previous
+        connection.close()
+
+    durations.sort()
+    return {
+        'conn_max_age': conn_max_age,
+        'connections': len(opened),
+        'median_ms': round(statistics.median(durations) * 1000, 3),
+        'p95_ms': round(get_percentile(durations, 95) * 1000, 3),
+        'mean_ms': round(statistics.mean(durations) * 1000, 3),
+    }
+
+
+def run_connection_benchmark(iterations=DEFAULT_ITERATIONS, conn_max_age=None):
+    """
+    Times the student dashboard with a connection per request and with the
+    configured lifetime of the connections.
+
+    The requests pass the whole WSGI handler, so the connections are opened
+    and closed as under the gunicorn WSGI workers of the Procfile.
+
+    Args:
+        iterations (int): The number of timed requests per mode.
+        conn_max_age (int, optional): The lifetime of the connections of
+        the second mode. Defaults to the CONN_MAX_AGE setting.
+
+    Returns:
+        dict: The environment and the results by mode.
+
+    Raises:
+        ValueError: If the database has no data to benchmark.
+    """
+    if conn_max_age is None:
+        conn_max_age = connection.settings_dict['CONN_MAX_AGE']
+    data = BenchmarkData()
+    environ = get_environ(
+        data.student, reverse('student:dashboard'), {'date': data.lesson.date}
+    )
+    application = get_wsgi_application()
+    with override_settings(
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, environ['HTTP_HOST']]
+    ):
+        results = {
+            mode: measure_connections(
+                application, environ, max_age, iterations
+            )
+            for mode, max_age in (
+                ('per_request', 0), ('configured', conn_max_age)
+            )
+        }
+    return {
+        'revision': get_revision(),
+        'created_at': timezone.now().isoformat(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'iterations': iterations,
+        'health_checks': connection.settings_dict['CONN_HEALTH_CHECKS'],
+        'results': results,
+    }
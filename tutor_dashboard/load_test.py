@@ -0,0 +1,423 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import timedelta
+from functools import partial
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.asgi import get_asgi_application
+from django.db import connection, connections
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from dictionaries.models import Schedule
+from dictionaries.schedule_cache import get_week_start
+from main.timing import get_percentile
+from users.models import UserProfile
+from users.roles import TUTOR_GROUP
+
+DEFAULT_USERS = 20
+DEFAULT_REQUESTS = 50
+# Share of the requests by endpoint before first period: every student opens
+# the dashboard while a few tutors enter marks and fill the week
+DEFAULT_MIX = {
+    'student_schedule': 90,
+    'bulk_student_mark': 8,
+    'fill_schedule': 2,
+}
+
+
+class EndpointStats:
+    """
+    Responses collected for an endpoint by all virtual users.
+
+    Attributes:
+        durations (list): Response times in seconds.
+        queries (list): Numbers of queries per request.
+        errors (int): Number of responses with a server error.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations = []
+        self.queries = []
+        self.errors = 0
+
+    def add(self, duration, queries, error):
+        """
+        Records a response.
+
+        Args:
+            duration (float): The response time in seconds.
+            queries (int): The number of executed queries, or None if the
+            queries are not counted.
+            error (bool): Whether the response is a server error.
+        """
+        with self.lock:
+            self.durations.append(duration)
+            if queries is not None:
+                self.queries.append(queries)
+            self.errors += error
+
+    def get_report(self, elapsed):
+        """
+        Returns the statistics of the endpoint.
+
+        Args:
+            elapsed (float): The duration of the run in seconds.
+
+        Returns:
+            dict: The numbers of requests and errors, the throughput, the
+            p50, p95 and p99 response times in milliseconds and the mean and
+            maximum numbers of queries, if they are counted.
+        """
+        durations = sorted(self.durations)
+        report = {
+            'requests': len(durations),
+            'errors': self.errors,
+            'throughput_rps': round(len(durations) / elapsed, 1),
+        }
+        for percentile in (50, 95, 99):
+            report[f'p{percentile}_ms'] = round(
+                get_percentile(durations, percentile) * 1000, 1
+            )
+        if self.queries:
+            report['queries_mean'] = round(
+                sum(self.queries) / len(self.queries), 1
+            )
+            report['queries_max'] = max(self.queries)
+        return report
+
+
+class LoadTestData:
+    """
+    The users and lessons requested by the virtual users.
+
+    Attributes:
+        day (date): The simulated school day.
+        students (list): (User, study group ID) tuples of checked students.
+        tutor (User): The tutor entering marks and filling weeks.
+        lessons (list): (schedule ID, student IDs) tuples of the lessons of
+        the day.
+        fill_date (date): A date of the week filled by the tutors.
+        study_group_ids (list): The study groups of the students.
+    """
+    def __init__(self, day, fill_date):
+        self.day = day
+        self.fill_date = fill_date
+        self.tutor = User.objects.filter(groups__name=TUTOR_GROUP).first()
+        self.students = [
+            (profile.user, profile.study_group_id)
+            for profile in UserProfile.objects.filter(
+                checked=True, study_group__isnull=False
+            ).select_related('user')
+        ]
+        if self.tutor is None or not self.students:
+            raise ValueError(
+                "No tutor or checked student found. Generate the data with "
+                "generate_synthetic_data first."
+            )
+        self.study_group_ids = sorted({
+            study_group_id for _, study_group_id in self.students
+        })
+        group_students = {}
+        for user, study_group_id in self.students:
+            group_students.setdefault(study_group_id, []).append(user.pk)
+        self.lessons = [
+            (pk, group_students[study_group_id])
+            for pk, study_group_id in Schedule.objects.filter(
+                date=day, study_group__in=self.study_group_ids
+            ).values_list('pk', 'study_group_id')
+        ]
+        if not self.lessons:
+            raise ValueError(f"No lessons found on {day}.")
+
+    def clear_fill_week(self):
+        """
+        Removes the lessons of the filled week, so the first fill of every
+        study group writes the week and the following fills are rejected
+        as they would be in production.
+        """
+        week_start = get_week_start(self.fill_date)
+        Schedule.objects.filter(
+            study_group__in=self.study_group_ids,
+            date__range=(week_start, week_start + timedelta(days=6))
+        ).delete()
+
+
+class VirtualUser(threading.Thread):
+    """
+    A thread sending a sequence of requests with its own test clients.
+
+    Students are split between the virtual users. The clients log in before
+    the run starts, so the logins are neither timed nor compete with the
+    requests.
+    """
+    def __init__(self, data, students, actions, stats):
+        super().__init__()
+        self.data = data
+        self.actions = actions
+        self.stats = stats
+        self.rng = random.Random()
+        self.students = [self.login(user) for user in students]
+        self.tutor = self.login(data.tutor)
+
+    def login(self, user):
+        """ Returns a client logged in as a user. """
+        client = Client(raise_request_exception=False)
+        client.force_login(user)
+        return client
+
+    def student_schedule(self):
+        """ Returns the request of a student opening the dashboard. """
+        return self.rng.choice(self.students).get, reverse(
+            'student:dashboard'
+        ), {'date': self.data.day}
+
+    def bulk_student_mark(self):
+        """ Returns the request of a tutor entering the marks of a lesson. """
+        schedule_id, student_ids = self.rng.choice(self.data.lessons)
+        return (
+            self.tutor.post,
+            reverse('tutor:bulk_student_mark', args=[schedule_id]),
+            {
+                f'mark_{student_id}': self.rng.randint(40, 100)
+                for student_id in student_ids
+            }
+        )
+
+    def fill_schedule(self):
+        """ Returns the request of a tutor filling a week. """
+        return self.tutor.post, reverse('tutor:fill_schedule'), {
+            'date': self.data.fill_date,
+            'study_group': self.rng.choice(self.data.study_group_ids),
+        }
+
+    def run(self):
+        """ Sends the requests and records the responses. """
+        try:
+            for action in self.actions:
+                send, url, params = getattr(self, action)()
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    try:
+                        error = send(url, params).status_code >= 500
+                    except Exception:
+                        # Errors outside of the views, e.g. in middleware
+                        error = True
+                    duration = time.perf_counter() - started
+                self.stats[action].add(duration, len(queries), error)
+        finally:
+            connections.close_all()
+
+
+class AsgiClient:
+    """
+    Client sending the requests of a logged in user to the ASGI application
+    the way an ASGI server passes them, including the per-request thread of
+    the sync code.
+
+    Attributes:
+        application (ASGIHandler): The ASGI application.
+        headers (list): The cookie and CSRF headers of the user's session.
+    """
+    def __init__(self, application, user):
+        client = Client()
+        client.force_login(user)
+        csrf_token = get_random_string(32)
+        session = client.cookies[settings.SESSION_COOKIE_NAME].value
+        self.application = application
+        self.headers = [
+            (b'host', b'testserver'),
+            (b'cookie', (
+                f"{settings.SESSION_COOKIE_NAME}={session}; "
+                f"{settings.CSRF_COOKIE_NAME}={csrf_token}"
+            ).encode()),
+            (b'x-csrftoken', csrf_token.encode()),
+        ]
+
+    async def get(self, path, data):
+        """ Sends a GET request and returns the status code. """
+        return await self.request(
+            'GET', path, urlencode(data, doseq=True).encode(), b''
+        )
+
+    async def post(self, path, data):
+        """ Sends a form POST request and returns the status code. """
+        return await self.request(
+            'POST', path, b'', urlencode(data, doseq=True).encode()
+        )
+
+    async def request(self, method, path, query_string, body):
+        """
+        Sends a request and returns the status code.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The requested path.
+            query_string (bytes): The encoded GET parameters.
+            body (bytes): The encoded form data.
+
+        Returns:
+            int: The status code of the response.
+        """
+        headers = list(self.headers)
+        if body:
+            headers += [
+                (b'content-type', b'application/x-www-form-urlencoded'),
+                (b'content-length', str(len(body)).encode()),
+            ]
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': query_string,
+            'root_path': '',
+            'headers': headers,
+            'client': ('127.0.0.1', 0),
+            'server': ('testserver', 80),
+        }
+        messages = [{'type': 'http.request', 'body': body}]
+        status = []
+
+        async def receive():
+            return messages.pop() if messages else {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status.append(message['status'])
+
+        await self.application(scope, receive, send)
+        return status[0]
+
+
+class AsyncVirtualUser(VirtualUser):
+    """
+    A virtual user sending its requests as a task of one event loop, as the
+    users served by one uvicorn worker. It is awaited instead of started.
+
+    The queries of a request run in the thread of the request, so they are
+    not counted.
+    """
+    def __init__(self, application, *args):
+        self.application = application
+        super().__init__(*args)
+
+    def login(self, user):
+        """ Returns an ASGI client logged in as a user. """
+        return AsgiClient(self.application, user)
+
+    async def arun(self):
+        """ Sends the requests and records the responses. """
+        for action in self.actions:
+            send, url, params = getattr(self, action)()
+            started = time.perf_counter()
+            try:
+                error = await send(url, params) >= 500
+            except Exception:
+                error = True
+            self.stats[action].add(time.perf_counter() - started, None, error)
+
+
+async def run_async_virtual_users(virtual_users):
+    """ Runs the virtual users concurrently in the current event loop. """
+    await asyncio.gather(
+        *(virtual_user.arun() for virtual_user in virtual_users)
+    )
+
+
+def run_load_test(
+    day,
+    fill_date,
+    users=DEFAULT_USERS,
+    requests=DEFAULT_REQUESTS,
+    mix=None,
+    seed=0,
+    clear_fill_week=True,
+    asgi=False
+):
+    """
+    Replays the start-of-day traffic against the current database.
+
+    Every virtual user is a thread with its own database connection sending
+    requests through the Django test client, so the whole middleware stack
+    runs without a server, as in a threaded WSGI worker. In ASGI mode the
+    virtual users are tasks of one event loop sending requests to the ASGI
+    application instead, as in one uvicorn worker. The requests of every
+    virtual user are drawn from the mix up front.
+
+    Args:
+        day (date): The simulated school day.
+        fill_date (date): A date of the week filled by the tutors.
+        users (int): The number of concurrent virtual users.
+        requests (int): The number of requests per virtual user.
+        mix (dict, optional): Weights of the endpoints.
+        seed (int): The seed of the request sequences.
+        clear_fill_week (bool): Remove the lessons of the filled week first.
+        asgi (bool): Send the requests to the ASGI application.
+
+    Returns:
+        dict: The run parameters, the total throughput and the statistics
+        by endpoint.
+
+    Raises:
+        ValueError: If the database has no data to request.
+    """
+    mix = mix or DEFAULT_MIX
+    data = LoadTestData(day, fill_date)
+    if clear_fill_week:
+        data.clear_fill_week()
+
+    rng = random.Random(seed)
+    stats = {action: EndpointStats() for action in mix}
+    students = [user for user, _ in data.students]
+    rng.shuffle(students)
+    if asgi:
+        virtual_user_class = partial(AsyncVirtualUser, get_asgi_application())
+    else:
+        virtual_user_class = VirtualUser
+    virtual_users = [
+        virtual_user_class(
+            data,
+            students[number::users] or students,
+            rng.choices(list(mix), weights=list(mix.values()), k=requests),
+            stats
+        )
+        for number in range(users)
+    ]
+
+    # The test client sends requests to the 'testserver' host
+    with override_settings(
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']
+    ):
+        started = time.perf_counter()
+        if asgi:
+            asyncio.run(run_async_virtual_users(virtual_users))
+        else:
+            for virtual_user in virtual_users:
+                virtual_user.start()
+            for virtual_user in virtual_users:
+                virtual_user.join()
+        elapsed = time.perf_counter() - started
+
+    total = sum(len(endpoint.durations) for endpoint in stats.values())
+    return {
+        'server': 'asgi' if asgi else 'wsgi',
+        'users': users,
+        'requests_per_user': requests,
+        'day': str(day),
+        'elapsed_s': round(elapsed, 2),
+        'throughput_rps': round(total / elapsed, 1),
+        'endpoints': {
+            action: endpoint.get_report(elapsed)
+            for action, endpoint in stats.items() if endpoint.durations
+        },
+    }
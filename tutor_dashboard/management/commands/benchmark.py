@@ -0,0 +1,69 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tutor_dashboard.benchmark import (
+    BENCHMARKS,
+    DEFAULT_ITERATIONS,
+    run_benchmarks
+)
+
+
+class Command(BaseCommand):
+    """
+    Times and query-counts the key schedule paths and writes the results as
+    JSON comparable across commits.
+
+    Examples:
+        python manage.py benchmark --output before.json
+        python manage.py benchmark --benchmark tutor_schedule --iterations 100
+    """
+    help = (
+        "Times and query-counts the key schedule views and writes the "
+        "results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        """ Adds the command line arguments. """
+        parser.add_argument(
+            '--benchmark', action='append', dest='benchmarks',
+            choices=sorted(BENCHMARKS),
+            help="Name of a benchmark. Defaults to all benchmarks."
+        )
+        parser.add_argument(
+            '--iterations', type=int, default=DEFAULT_ITERATIONS,
+            help="The number of timed runs per benchmark."
+        )
+        parser.add_argument(
+            '--cold-cache', action='store_true',
+            help="Clear the schedule cache before every run."
+        )
+        parser.add_argument(
+            '--output', help="Path of the JSON file. Defaults to stdout."
+        )
+
+    def handle(self, *args, **options):
+        """ Runs the benchmarks and writes the results. """
+        if options['iterations'] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        try:
+            results = run_benchmarks(
+                names=options['benchmarks'],
+                iterations=options['iterations'],
+                cold_cache=options['cold_cache'],
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        output = json.dumps(results, indent=2)
+        if not options['output']:
+            self.stdout.write(output)
+            return
+        try:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        except OSError as error:
+            raise CommandError(f"Cannot write {options['output']}: {error}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Results written to {options['output']}."
+        ))
@@ -0,0 +1,69 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tutor_dashboard.benchmark import (
+    DEFAULT_ITERATIONS,
+    run_connection_benchmark
+)
+
+
+class Command(BaseCommand):
+    """
+    Times the student dashboard through the WSGI handler, as the Procfile
+    serves it, with a database connection per request and with the
+    configured CONN_MAX_AGE, and writes the results as JSON.
+
+    Examples:
+        python manage.py connection_benchmark --iterations 200
+        python manage.py connection_benchmark --conn-max-age 60 \\
+            --output connections.json
+    """
+    help = (
+        "Compares the request latency with a database connection per "
+        "request and with the configured connection lifetime."
+    )
+
+    def add_arguments(self, parser):
+        """ Adds the command line arguments. """
+        parser.add_argument(
+            '--iterations', type=int, default=DEFAULT_ITERATIONS,
+            help="The number of timed requests per mode."
+        )
+        parser.add_argument(
+            '--conn-max-age', type=int,
+            help="The lifetime of the connections in seconds. Defaults to "
+            "the CONN_MAX_AGE setting."
+        )
+        parser.add_argument(
+            '--output', help="Path of the JSON file. Defaults to stdout."
+        )
+
+    def handle(self, *args, **options):
+        """ Runs the benchmark and writes the results. """
+        if options['iterations'] < 1 or (
+            options['conn_max_age'] is not None and options['conn_max_age'] < 1
+        ):
+            raise CommandError(
+                "--iterations and --conn-max-age must be at least 1."
+            )
+        try:
+            results = run_connection_benchmark(
+                iterations=options['iterations'],
+                conn_max_age=options['conn_max_age'],
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        output = json.dumps(results, indent=2)
+        if not options['output']:
+            self.stdout.write(output)
+            return
+        try:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        except OSError as error:
+            raise CommandError(f"Cannot write {options['output']}: {error}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Results written to {options['output']}."
+        ))
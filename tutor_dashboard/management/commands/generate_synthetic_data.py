@@ -0,0 +1,81 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from dictionaries.models import StudyGroup
+from tutor_dashboard.synthetic import DEFAULT_BATCH_SIZE, generate_dataset
+
+
+class Command(BaseCommand):
+    """
+    Generates a synthetic dataset of study groups, students, templates, a
+    year of lessons and marks for benchmarks.
+
+    Examples:
+        python manage.py generate_synthetic_data
+        python manage.py generate_synthetic_data --study-groups 50 \\
+            --students 30 --marks-per-lesson 10 --seed 1
+    """
+    help = (
+        "Generates study groups, students, terms, subjects, templates, a "
+        "year of lessons and marks for benchmarks."
+    )
+
+    def add_arguments(self, parser):
+        """ Adds the command line arguments. """
+        parser.add_argument(
+            '--study-groups', type=int, default=10,
+            help="The number of study groups."
+        )
+        parser.add_argument(
+            '--students', type=int, default=25,
+            help="The number of students per study group."
+        )
+        parser.add_argument(
+            '--subjects', type=int, default=12,
+            help="The number of subjects."
+        )
+        parser.add_argument(
+            '--lessons-per-day', type=int, default=4, choices=range(1, 11),
+            help="The number of lessons per weekday."
+        )
+        parser.add_argument(
+            '--marks-per-lesson', type=int, default=5,
+            help="The number of marks per lesson."
+        )
+        parser.add_argument(
+            '--year', type=int, default=2024,
+            help="The year the generated academic year starts in."
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help="The seed of the random subjects and marks."
+        )
+        parser.add_argument(
+            '--prefix', default='Synthetic',
+            help="The prefix of the generated names."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help="The number of rows written per query."
+        )
+
+    def handle(self, *args, **options):
+        """ Generates the dataset and reports the created rows. """
+        if StudyGroup.objects.filter(
+            name__startswith=f"{options['prefix']} "
+        ).exists():
+            raise CommandError(
+                f"Data with the prefix '{options['prefix']}' already exists."
+            )
+
+        result = generate_dataset(
+            study_groups=options['study_groups'],
+            students=options['students'],
+            subjects=options['subjects'],
+            lessons_per_day=options['lessons_per_day'],
+            marks_per_lesson=options['marks_per_lesson'],
+            year=options['year'],
+            seed=options['seed'],
+            prefix=options['prefix'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(str(result)))
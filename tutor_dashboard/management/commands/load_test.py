@@ -0,0 +1,141 @@
+import json
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from dictionaries.models import Schedule
+from tutor_dashboard.load_test import (
+    DEFAULT_MIX,
+    DEFAULT_REQUESTS,
+    DEFAULT_USERS,
+    run_load_test
+)
+
+
+def parse_weight(value):
+    """
+    Parses an endpoint weight in the name=weight format.
+
+    Args:
+        value (str): The command line value.
+
+    Returns:
+        tuple: The endpoint name and the weight.
+    """
+    name, _, weight = value.partition('=')
+    if name not in DEFAULT_MIX or not weight.isdigit():
+        raise ValueError(value)
+    return name, int(weight)
+
+
+class Command(BaseCommand):
+    """
+    Simulates the start-of-day traffic of students opening the dashboard
+    while tutors enter marks and fill the week, and reports throughput,
+    latency percentiles and query counts per endpoint.
+
+    The tutors' requests write to the database and the lessons of the filled
+    week are removed first, so run it against the synthetic dataset only.
+    Run it with and without --asgi to compare a threaded WSGI worker with
+    an ASGI worker serving the same users.
+
+    Examples:
+        python manage.py load_test --users 50 --requests 100
+        python manage.py load_test --users 50 --requests 100 --asgi
+        python manage.py load_test --mix student_schedule=95 \\
+            --mix bulk_student_mark=5 --mix fill_schedule=0 --output run.json
+    """
+    help = (
+        "Replays the start-of-day traffic against the synthetic dataset and "
+        "reports throughput, latency percentiles and query counts."
+    )
+
+    def add_arguments(self, parser):
+        """ Adds the command line arguments. """
+        parser.add_argument(
+            '--users', type=int, default=DEFAULT_USERS,
+            help="The number of concurrent virtual users."
+        )
+        parser.add_argument(
+            '--requests', type=int, default=DEFAULT_REQUESTS,
+            help="The number of requests per virtual user."
+        )
+        parser.add_argument(
+            '--day', type=date.fromisoformat,
+            help="The simulated day (YYYY-MM-DD). Defaults to the day with "
+            "the most lessons."
+        )
+        parser.add_argument(
+            '--fill-date', type=date.fromisoformat,
+            help="A date of the week filled by the tutors. Defaults to a week "
+            "after the simulated day."
+        )
+        parser.add_argument(
+            '--keep-fill-week', action='store_true',
+            help="Keep the lessons of the filled week, so every fill is "
+            "rejected."
+        )
+        parser.add_argument(
+            '--mix', type=parse_weight, action='append',
+            help="Weight of an endpoint as name=weight. Defaults to "
+            + ", ".join(f"{name}={w}" for name, w in DEFAULT_MIX.items())
+            + "."
+        )
+        parser.add_argument(
+            '--asgi', action='store_true',
+            help="Send the requests to the ASGI application from one event "
+            "loop instead of the WSGI handler from a thread per user."
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--output', help="Path of the JSON file. Defaults to stdout."
+        )
+
+    def handle(self, *args, **options):
+        """ Runs the load test and writes the report. """
+        if options['users'] < 1 or options['requests'] < 1:
+            raise CommandError("--users and --requests must be at least 1.")
+        mix = dict(DEFAULT_MIX, **dict(options['mix'] or []))
+        mix = {name: weight for name, weight in mix.items() if weight}
+        if not mix:
+            raise CommandError("At least one endpoint needs a weight.")
+
+        day = options['day']
+        if day is None:
+            busiest = Schedule.objects.values('date').annotate(
+                lessons=Count('id')
+            ).order_by('-lessons', 'date').first()
+            if busiest is None:
+                raise CommandError(
+                    "No lessons found. Generate the data with "
+                    "generate_synthetic_data first."
+                )
+            day = busiest['date']
+
+        try:
+            report = run_load_test(
+                day,
+                options['fill_date'] or day + timedelta(days=7),
+                users=options['users'],
+                requests=options['requests'],
+                mix=mix,
+                seed=options['seed'],
+                clear_fill_week=not options['keep_fill_week'],
+                asgi=options['asgi'],
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        output = json.dumps(report, indent=2)
+        if not options['output']:
+            self.stdout.write(output)
+            return
+        try:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        except OSError as error:
+            raise CommandError(f"Cannot write {options['output']}: {error}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Report written to {options['output']}."
+        ))
@@ -0,0 +1,77 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dictionaries.models import Term
+from tutor_dashboard.materialization import (
+    DEFAULT_BATCH_SIZE,
+    materialize_schedule
+)
+
+
+class Command(BaseCommand):
+    """
+    Materializes the Schedule from ScheduleTemplate entries for a term or a
+    date range.
+
+    Examples:
+        python manage.py materialize_schedule --term 1
+        python manage.py materialize_schedule --date-from 2024-09-02 \\
+            --date-to 2024-12-20 --study-group 1 --study-group 2 --overwrite
+    """
+    help = (
+        "Creates Schedule rows from schedule templates for every week of a "
+        "term or a date range."
+    )
+
+    def add_arguments(self, parser):
+        """ Adds the command line arguments. """
+        parser.add_argument(
+            '--term', type=int, help="ID of the term to materialize."
+        )
+        parser.add_argument(
+            '--date-from', type=date.fromisoformat,
+            help="The first date (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            '--date-to', type=date.fromisoformat,
+            help="The last date (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            '--study-group', type=int, action='append', dest='study_groups',
+            help="ID of a study group. Defaults to all active study groups."
+        )
+        parser.add_argument(
+            '--overwrite', action='store_true',
+            help="Overwrite subjects of existing lessons instead of skipping."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help="The number of rows written per query."
+        )
+
+    def handle(self, *args, **options):
+        """ Runs the materialization and reports the result. """
+        date_from = options['date_from']
+        date_to = options['date_to']
+        if options['term']:
+            try:
+                term = Term.objects.get(pk=options['term'])
+            except Term.DoesNotExist:
+                raise CommandError(f"Term {options['term']} does not exist.")
+            date_from = date_from or term.date_from
+            date_to = date_to or term.date_to
+
+        if not date_from or not date_to:
+            raise CommandError("Specify --term or --date-from and --date-to.")
+        if date_from > date_to:
+            raise CommandError("--date-from must not be later than --date-to.")
+
+        result = materialize_schedule(
+            date_from,
+            date_to,
+            study_groups=options['study_groups'],
+            overwrite=options['overwrite'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(str(result)))
@@ -0,0 +1,315 @@
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from dictionaries.mark_summary import (
+    get_summary_keys,
+    refresh_mark_summaries
+)
+from dictionaries.models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudyGroup
+)
+from dictionaries.schedule_cache import invalidate_date_range, invalidate_weeks
+from dictionaries.term_index import get_term_index
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class MaterializationResult:
+    """
+    Summary of a schedule materialization run.
+
+    Attributes:
+        created (int): Number of Schedule rows created.
+        updated (int): Number of existing Schedule rows whose subject was
+        overwritten from the template.
+        skipped (int): Number of template rows skipped because the lesson
+        already exists.
+        elapsed (float): Duration of the run in seconds.
+    """
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        """ Returns the number of written rows per second. """
+        written = self.created + self.updated
+        return written / self.elapsed if self.elapsed else float(written)
+
+    def __str__(self):
+        """
+        Returns the string representation of the result.
+
+        Returns:
+            str: A formatted string with the numbers of created, updated and
+            skipped rows and the throughput.
+        """
+        return (
+            f"Created {self.created}, updated {self.updated}, skipped "
+            f"{self.skipped} lessons in {self.elapsed:.2f}s "
+            f"({self.rows_per_second:.0f} rows/s)."
+        )
+
+
+def get_study_groups(study_groups=None):
+    """
+    Returns the IDs of the study groups to materialize.
+
+    Args:
+        study_groups (iterable, optional): StudyGroup instances or IDs. All
+        active study groups are used when it is empty.
+
+    Returns:
+        list: A list of study group IDs.
+    """
+    if study_groups:
+        return [
+            study_group.pk if isinstance(study_group, StudyGroup)
+            else int(study_group)
+            for study_group in study_groups
+        ]
+    return list(StudyGroup.active_objects().values_list('pk', flat=True))
+
+
+def get_template_index(term_ids, study_group_ids):
+    """
+    Loads the schedule templates of the terms and study groups in one query.
+
+    Args:
+        term_ids (list): IDs of the terms.
+        study_group_ids (list): IDs of the study groups.
+
+    Returns:
+        dict: A dictionary keyed by (term_id, study_group_id, weekday) with a
+        list of (order_number, subject_id) tuples.
+    """
+    templates = defaultdict(list)
+    rows = ScheduleTemplate.objects.filter(
+        term__in=term_ids,
+        study_group__in=study_group_ids
+    ).order_by().values_list(
+        'term_id', 'study_group_id', 'weekday', 'order_number', 'subject_id'
+    )
+    for term_id, study_group_id, weekday, order_number, subject_id in rows:
+        templates[(term_id, study_group_id, weekday)].append(
+            (order_number, subject_id)
+        )
+    return templates
+
+
+def expand_templates(date_from, date_to, terms, study_group_ids, templates):
+    """
+    Expands schedule templates over the calendar in memory.
+
+    Args:
+        date_from (date): The first date to materialize.
+        date_to (date): The last date to materialize.
+        terms (list): Term instances ordered by date_from.
+        study_group_ids (list): IDs of the study groups.
+        templates (dict): Templates returned by `get_template_index`.
+
+    Yields:
+        tuple: (study_group_id, date, order_number, subject_id) for every
+        lesson defined by the templates.
+    """
+    term_iter = iter(terms)
+    term = next(term_iter, None)
+    day = date_from
+    while day <= date_to and term:
+        if day > term.date_to:
+            term = next(term_iter, None)
+            continue
+        if day >= term.date_from:
+            for study_group_id in study_group_ids:
+                for order_number, subject_id in templates.get(
+                    (term.pk, study_group_id, day.weekday()), ()
+                ):
+                    yield study_group_id, day, order_number, subject_id
+        day += timedelta(days=1)
+
+
+def materialize_schedule(
+    date_from,
+    date_to,
+    study_groups=None,
+    overwrite=False,
+    batch_size=DEFAULT_BATCH_SIZE
+):
+    """
+    Materializes Schedule rows from ScheduleTemplate entries for every day of
+    the date range and every selected study group.
+
+    Existing lessons are skipped by default. With `overwrite` their subject is
+    replaced by the subject of the template; homework and student marks are
+    kept. The whole run is a single transaction written with chunked bulk
+    inserts.
+
+    Args:
+        date_from (date): The first date to materialize.
+        date_to (date): The last date to materialize.
+        study_groups (iterable, optional): StudyGroup instances or IDs. All
+        active study groups are used when it is empty.
+        overwrite (bool): Overwrite the subject of existing lessons.
+        batch_size (int): The number of rows written per query.
+
+    Returns:
+        MaterializationResult: The numbers of created, updated and skipped
+        rows and the duration of the run.
+    """
+    result = MaterializationResult()
+    started = time.perf_counter()
+
+    study_group_ids = get_study_groups(study_groups)
+    terms = get_term_index(active=True).get_overlapping(date_from, date_to)
+    if not study_group_ids or not terms:
+        return result
+
+    templates = get_template_index(
+        [term.pk for term in terms], study_group_ids
+    )
+
+    with transaction.atomic():
+        # Lock the study groups so concurrent runs do not interleave
+        list(
+            StudyGroup.objects.select_for_update().filter(
+                pk__in=study_group_ids
+            ).values_list('pk', flat=True)
+        )
+        existing = {
+            (study_group_id, day, order_number): (pk, subject_id)
+            for pk, study_group_id, day, order_number, subject_id
+            in Schedule.objects.filter(
+                study_group__in=study_group_ids,
+                date__range=(date_from, date_to)
+            ).order_by().values_list(
+                'pk', 'study_group_id', 'date', 'order_number', 'subject_id'
+            )
+        }
+
+        now = timezone.now()
+        new_rows = []
+        changed_rows = []
+        for study_group_id, day, order_number, subject_id in expand_templates(
+            date_from, date_to, terms, study_group_ids, templates
+        ):
+            current = existing.get((study_group_id, day, order_number))
+            if current is None:
+                new_rows.append(Schedule(
+                    study_group_id=study_group_id,
+                    date=day,
+                    order_number=order_number,
+                    subject_id=subject_id
+                ))
+            elif overwrite and current[1] != subject_id:
+                changed_rows.append(
+                    Schedule(
+                        pk=current[0], subject_id=subject_id, updated_at=now
+                    )
+                )
+            else:
+                result.skipped += 1
+
+        # Marks of overwritten lessons move to the new subject
+        changed_marks = list(
+            StudentMark.objects.filter(
+                schedule__in=[row.pk for row in changed_rows]
+            ).values_list('student_id', 'schedule_id')
+        ) if changed_rows else []
+        previous_keys = get_summary_keys(changed_marks)
+
+        Schedule.objects.bulk_create(new_rows, batch_size=batch_size)
+        Schedule.objects.bulk_update(
+            changed_rows, ['subject', 'updated_at'], batch_size=batch_size
+        )
+        refresh_mark_summaries(changed_marks, previous_keys)
+        if new_rows or changed_rows:
+            invalidate_date_range(study_group_ids, date_from, date_to)
+
+    result.created = len(new_rows)
+    result.updated = len(changed_rows)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def get_template_lessons(template, subject_id, date_from=None):
+    """
+    Returns future lessons generated from the schedule template that are safe
+    to change: lessons without homework and student marks.
+
+    Args:
+        template (ScheduleTemplate): The schedule template.
+        subject_id (int): The subject the lessons were generated with.
+        date_from (date, optional): The first date to consider. Defaults to
+        today.
+
+    Returns:
+        QuerySet: Schedule rows on the template's weekday and order number
+        within the remaining part of the term.
+    """
+    date_from = max(date_from or timezone.localdate(), template.term.date_from)
+    return Schedule.objects.filter(
+        study_group=template.study_group_id,
+        order_number=template.order_number,
+        subject=subject_id,
+        date__range=(date_from, template.term.date_to),
+        date__iso_week_day=template.weekday + 1,
+        homework='',
+    ).filter(
+        ~Exists(StudentMark.objects.filter(schedule=OuterRef('pk')))
+    )
+
+
+def resync_template_lessons(template, old_subject_id, date_from=None):
+    """
+    Applies a subject change of a schedule template to the lessons already
+    generated for future weeks with one bulk update.
+
+    Lessons with homework or student marks are preserved.
+
+    Args:
+        template (ScheduleTemplate): The saved schedule template.
+        old_subject_id (int): The subject of the template before the change.
+        date_from (date, optional): The first date to update. Defaults to
+        today.
+
+    Returns:
+        int: The number of updated lessons.
+    """
+    if old_subject_id == template.subject_id:
+        return 0
+    lessons = get_template_lessons(template, old_subject_id, date_from)
+    # The bulk update does not send signals
+    invalidate_weeks(lessons.values_list('study_group_id', 'date'))
+    return lessons.update(
+        subject=template.subject_id, updated_at=timezone.now()
+    )
+
+
+def remove_template_lessons(template, date_from=None):
+    """
+    Deletes the lessons generated from a schedule template for future weeks.
+
+    Lessons with homework or student marks are preserved.
+
+    Args:
+        template (ScheduleTemplate): The schedule template being deleted.
+        date_from (date, optional): The first date to delete. Defaults to
+        today.
+
+    Returns:
+        int: The number of deleted lessons.
+    """
+    _, deleted = get_template_lessons(
+        template, template.subject_id, date_from
+    ).delete()
+    return deleted.get(Schedule._meta.label, 0)
@@ -0,0 +1,266 @@
+import random
+import time
+from datetime import date
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, User
+from django.db import transaction
+
+from dictionaries.choices import invalidate_choices
+from dictionaries.mark_summary import rebuild_mark_summaries
+from dictionaries.models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term
+)
+from users.models import UserProfile
+from users.roles import STUDENT_GROUP, TUTOR_GROUP
+
+from .materialization import materialize_schedule
+
+DEFAULT_BATCH_SIZE = 1000
+# Password of the generated users
+DEFAULT_PASSWORD = 'synthetic-password'
+
+
+class SyntheticDataResult:
+    """
+    Summary of a synthetic data generation run.
+
+    Attributes:
+        counts (dict): Number of created rows by model name.
+        elapsed (float): Duration of the run in seconds.
+    """
+    def __init__(self):
+        self.counts = {}
+        self.elapsed = 0.0
+
+    def __str__(self):
+        """
+        Returns the string representation of the result.
+
+        Returns:
+            str: A formatted string with the numbers of created rows and the
+            duration.
+        """
+        counts = ", ".join(
+            f"{count} {name}" for name, count in self.counts.items()
+        )
+        return f"Created {counts} in {self.elapsed:.2f}s."
+
+
+def get_terms(year):
+    """
+    Returns the autumn and spring terms of an academic year, creating the
+    missing ones.
+
+    Args:
+        year (int): The year the academic year starts in.
+
+    Returns:
+        list: The two Term instances.
+    """
+    periods = [
+        (f"Autumn {year}", date(year, 9, 1), date(year, 12, 31)),
+        (f"Spring {year + 1}", date(year + 1, 1, 15), date(year + 1, 6, 30)),
+    ]
+    return [
+        Term.objects.get_or_create(
+            date_from=date_from,
+            date_to=date_to,
+            defaults={'name': name}
+        )[0]
+        for name, date_from, date_to in periods
+    ]
+
+
+def create_students(prefix, study_groups, students, batch_size):
+    """
+    Creates checked students in every study group with chunked inserts.
+
+    Args:
+        prefix (str): The prefix of the usernames.
+        study_groups (list): The StudyGroup instances.
+        students (int): The number of students per study group.
+        batch_size (int): The number of rows written per query.
+
+    Returns:
+        dict: The student IDs by study group ID.
+    """
+    # Hashing is slow by design, so all generated users share one hash
+    password = make_password(DEFAULT_PASSWORD)
+    users = User.objects.bulk_create(
+        [
+            User(
+                username=f"{prefix}-g{study_group.pk}-s{number}",
+                first_name=f"Student{number}",
+                last_name=study_group.name,
+                password=password
+            )
+            for study_group in study_groups
+            for number in range(1, students + 1)
+        ],
+        batch_size=batch_size
+    )
+
+    group_ids = dict(Group.objects.values_list('name', 'pk'))
+    User.groups.through.objects.bulk_create(
+        [
+            User.groups.through(
+                user_id=user.pk, group_id=group_ids[STUDENT_GROUP]
+            )
+            for user in users
+        ],
+        batch_size=batch_size
+    )
+
+    study_group_students = {}
+    profiles = []
+    for index, user in enumerate(users):
+        study_group = study_groups[index // students]
+        study_group_students.setdefault(study_group.pk, []).append(user.pk)
+        profiles.append(UserProfile(
+            user_id=user.pk, study_group=study_group, checked=True
+        ))
+    UserProfile.objects.bulk_create(profiles, batch_size=batch_size)
+    return study_group_students
+
+
+def create_marks(study_group_students, marks_per_lesson, rng, batch_size):
+    """
+    Creates marks of randomly chosen students for every generated lesson.
+
+    Args:
+        study_group_students (dict): The student IDs by study group ID.
+        marks_per_lesson (int): The number of marks per lesson.
+        rng (Random): The random number generator.
+        batch_size (int): The number of rows written per query.
+
+    Returns:
+        int: The number of created marks.
+    """
+    lessons = Schedule.objects.filter(
+        study_group__in=study_group_students
+    ).order_by('pk').values_list('pk', 'study_group_id')
+
+    created = 0
+    batch = []
+    for schedule_id, study_group_id in lessons.iterator(chunk_size=batch_size):
+        students = study_group_students[study_group_id]
+        for student_id in rng.sample(
+            students, min(marks_per_lesson, len(students))
+        ):
+            batch.append(StudentMark(
+                schedule_id=schedule_id,
+                student_id=student_id,
+                mark=rng.randint(40, 100)
+            ))
+        if len(batch) >= batch_size:
+            StudentMark.objects.bulk_create(batch)
+            created += len(batch)
+            batch = []
+    StudentMark.objects.bulk_create(batch)
+    return created + len(batch)
+
+
+def generate_dataset(
+    study_groups=10,
+    students=25,
+    subjects=12,
+    lessons_per_day=4,
+    marks_per_lesson=5,
+    year=2024,
+    seed=0,
+    prefix='Synthetic',
+    batch_size=DEFAULT_BATCH_SIZE
+):
+    """
+    Generates a synthetic dataset for benchmarks.
+
+    Creates the subjects, the autumn and spring terms of an academic year,
+    study groups with students and a tutor, schedule templates for every
+    weekday and the lessons of the whole year with marks. All rows are
+    written with chunked bulk inserts in one transaction, so no signals are
+    sent; the mark summary is rebuilt at the end.
+
+    Args:
+        study_groups (int): The number of study groups.
+        students (int): The number of students per study group.
+        subjects (int): The number of subjects.
+        lessons_per_day (int): The number of lessons per weekday (1-10).
+        marks_per_lesson (int): The number of marks per lesson.
+        year (int): The year the academic year starts in.
+        seed (int): The seed of the random subjects and marks.
+        prefix (str): The prefix of the generated names.
+        batch_size (int): The number of rows written per query.
+
+    Returns:
+        SyntheticDataResult: The numbers of created rows and the duration.
+    """
+    result = SyntheticDataResult()
+    started = time.perf_counter()
+    rng = random.Random(seed)
+
+    with transaction.atomic():
+        terms = get_terms(year)
+        subject_list = Subject.objects.bulk_create([
+            Subject(name=f"{prefix} Subject {number}")
+            for number in range(1, subjects + 1)
+        ])
+        study_group_list = StudyGroup.objects.bulk_create([
+            StudyGroup(name=f"{prefix} Group {number}")
+            for number in range(1, study_groups + 1)
+        ])
+        # Bulk inserts send no signals to refresh the cached choice lists
+        invalidate_choices(Subject)
+        invalidate_choices(StudyGroup)
+
+        tutor = User.objects.create_user(
+            username=f"{prefix}-tutor", password=DEFAULT_PASSWORD
+        )
+        tutor.groups.add(Group.objects.get(name=TUTOR_GROUP))
+        study_group_students = create_students(
+            prefix, study_group_list, students, batch_size
+        )
+
+        templates = ScheduleTemplate.objects.bulk_create(
+            [
+                ScheduleTemplate(
+                    term=term,
+                    study_group=study_group,
+                    weekday=weekday,
+                    order_number=order_number,
+                    subject=rng.choice(subject_list)
+                )
+                for term in terms
+                for study_group in study_group_list
+                for weekday in range(5)
+                for order_number in range(1, lessons_per_day + 1)
+            ],
+            batch_size=batch_size
+        )
+        lessons = materialize_schedule(
+            terms[0].date_from,
+            terms[-1].date_to,
+            study_groups=study_group_list,
+            batch_size=batch_size
+        )
+        marks = create_marks(
+            study_group_students, marks_per_lesson, rng, batch_size
+        )
+        summaries = rebuild_mark_summaries(batch_size=batch_size)
+
+    result.counts = {
+        'subjects': len(subject_list),
+        'study groups': len(study_group_list),
+        'students': study_groups * students,
+        'templates': len(templates),
+        'lessons': lessons.created,
+        'marks': marks,
+        'summaries': summaries,
+    }
+    result.elapsed = time.perf_counter() - started
+    return result
@@ -0,0 +1,231 @@
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from dictionaries.models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term
+)
+from users.models import UserProfile
+
+
+class ApiTestMixin:
+    """ Shared data for the JSON API tests. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a week of lessons, a template, a tutor and a student. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.other_group = StudyGroup.objects.create(name="Group B")
+        cls.math = Subject.objects.create(name="Math")
+        cls.tutor = User.objects.create_user(
+            username="tutor", password="password"
+        )
+        cls.tutor.groups.add(Group.objects.get(name="Tutor"))
+        cls.student = User.objects.create_user(
+            username="student", password="password"
+        )
+        cls.student.groups.add(Group.objects.get(name="Student"))
+        UserProfile.objects.create(
+            user=cls.student, study_group=cls.study_group
+        )
+        cls.lesson = Schedule.objects.create(
+            study_group=cls.study_group,
+            date=date(2024, 9, 4),
+            order_number=2,
+            subject=cls.math,
+            homework="Exercise 1"
+        )
+        Schedule.objects.create(
+            study_group=cls.other_group,
+            date=date(2024, 9, 4),
+            order_number=1,
+            subject=cls.math
+        )
+        StudentMark.objects.create(
+            schedule=cls.lesson, student=cls.student, mark=88
+        )
+        ScheduleTemplate.objects.create(
+            term=cls.term,
+            study_group=cls.study_group,
+            weekday=1,
+            order_number=3,
+            subject=cls.math
+        )
+
+    def setUp(self):
+        """ Sets up the test client. """
+        self.client = Client()
+
+
+class ScheduleWeekApiViewTests(ApiTestMixin, TestCase):
+    """ Test suite for the ScheduleWeekApiView. """
+
+    def get_week(self, **headers):
+        """ Requests the week of the lesson for the first study group. """
+        return self.client.get(
+            reverse('tutor:api_schedule_week'),
+            {'date': '2024-09-05', 'study_group': self.study_group.pk},
+            **headers
+        )
+
+    def test_week_grid_for_tutor(self):
+        """ Test that a tutor receives the lessons with mark counts. """
+        self.client.login(username="tutor", password="password")
+        response = self.get_week()
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['week_start'], '2024-09-02')
+        self.assertEqual(data['week_end'], '2024-09-08')
+        self.assertEqual(len(data['days']), 7)
+        self.assertEqual(data['days'][2]['date'], '2024-09-04')
+        self.assertEqual(
+            data['days'][2]['lessons'],
+            [{
+                'id': self.lesson.pk,
+                'order_number': 2,
+                'subject': 'Math',
+                'homework': 'Exercise 1',
+                'marks': 1,
+            }]
+        )
+        self.assertIn('ETag', response.headers)
+        self.assertIn('Last-Modified', response.headers)
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+
+    def test_student_sees_own_group_and_mark(self):
+        """
+        Test that a student always receives the own study group with the
+        own mark.
+        """
+        self.client.login(username="student", password="password")
+        response = self.client.get(
+            reverse('tutor:api_schedule_week'),
+            {'date': '2024-09-05', 'study_group': self.other_group.pk}
+        )
+
+        data = response.json()
+        self.assertEqual(data['study_group']['id'], self.study_group.pk)
+        self.assertEqual(data['days'][2]['lessons'][0]['marks'], 88)
+
+    def test_unchanged_week_returns_not_modified(self):
+        """
+        Test that a request with the current ETag receives 304 after only
+        the version query.
+        """
+        self.client.login(username="tutor", password="password")
+        etag = self.get_week()['ETag']
+
+        # Session, user, two permission queries, the role, the study group
+        # and the version query
+        with self.assertNumQueries(7):
+            response = self.get_week(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_changed_mark_changes_etag(self):
+        """ Test that a changed mark invalidates the client's copy. """
+        self.client.login(username="tutor", password="password")
+        etag = self.get_week()['ETag']
+        student_mark = StudentMark.objects.get(schedule=self.lesson)
+        student_mark.mark = 90
+        student_mark.save()
+
+        response = self.get_week(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_deleted_mark_changes_etag(self):
+        """ Test that a deleted mark invalidates the client's copy. """
+        self.client.login(username="tutor", password="password")
+        etag = self.get_week()['ETag']
+        StudentMark.objects.filter(schedule=self.lesson).delete()
+
+        response = self.get_week(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['days'][2]['lessons'][0]['marks'], 0)
+
+    def test_invalid_parameters(self):
+        """ Test that invalid parameters return the form errors. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.get(
+            reverse('tutor:api_schedule_week'), {'date': 'x'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('study_group', response.json()['errors'])
+
+    def test_anonymous_user_is_redirected(self):
+        """ Test that an anonymous user cannot read the schedule. """
+        response = self.get_week()
+
+        self.assertEqual(response.status_code, 302)
+
+
+class ScheduleTemplateApiViewTests(ApiTestMixin, TestCase):
+    """ Test suite for the ScheduleTemplateApiView. """
+
+    def get_templates(self, **headers):
+        """ Requests the template grid of the term and study group. """
+        return self.client.get(
+            reverse('tutor:api_schedule_templates'),
+            {'term': self.term.pk, 'study_group': self.study_group.pk},
+            **headers
+        )
+
+    def test_template_grid(self):
+        """ Test that the templates are grouped by weekday. """
+        self.client.login(username="tutor", password="password")
+        data = self.get_templates().json()
+
+        self.assertEqual(data['term']['name'], 'Term1')
+        self.assertEqual(
+            data['days'][1]['lessons'],
+            [{
+                'id': ScheduleTemplate.objects.get().pk,
+                'order_number': 3,
+                'subject': 'Math',
+            }]
+        )
+
+    def test_unchanged_templates_return_not_modified(self):
+        """
+        Test that unchanged templates return 304 until a template changes.
+        """
+        self.client.login(username="tutor", password="password")
+        etag = self.get_templates()['ETag']
+
+        response = self.get_templates(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        ScheduleTemplate.objects.create(
+            term=self.term,
+            study_group=self.study_group,
+            weekday=2,
+            order_number=1,
+            subject=self.math
+        )
+        response = self.get_templates(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_student_cannot_read_templates(self):
+        """ Test that a student is not allowed to read templates. """
+        self.client.login(username="student", password="password")
+        response = self.get_templates()
+
+        self.assertEqual(response.status_code, 403)
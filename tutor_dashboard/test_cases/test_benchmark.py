@@ -0,0 +1,280 @@
+import json
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from dictionaries.models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudentMarkSummary,
+    Term
+)
+from dictionaries import choices, term_index
+from tutor_dashboard.benchmark import BENCHMARKS, BenchmarkData, measure
+from tutor_dashboard.synthetic import generate_dataset
+from users.models import UserProfile
+
+
+class SyntheticDataTests(TestCase):
+    """ Test suite for the synthetic dataset generator. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Generates a small dataset. """
+        cls.result = generate_dataset(
+            study_groups=2,
+            students=3,
+            subjects=4,
+            lessons_per_day=1,
+            marks_per_lesson=2,
+            prefix="Test"
+        )
+
+    def test_generated_rows(self):
+        """ Test that a year of lessons with marks is generated. """
+        lessons = Schedule.objects.count()
+
+        self.assertEqual(Term.objects.count(), 2)
+        self.assertEqual(UserProfile.objects.filter(checked=True).count(), 6)
+        self.assertEqual(ScheduleTemplate.objects.count(), 20)
+        self.assertGreater(lessons, 300)
+        self.assertEqual(StudentMark.objects.count(), lessons * 2)
+        self.assertTrue(StudentMarkSummary.objects.exists())
+        self.assertEqual(self.result.counts['lessons'], lessons)
+
+    def test_command_rejects_existing_prefix(self):
+        """ Test that a dataset is not generated twice. """
+        with self.assertRaises(CommandError):
+            call_command(
+                'generate_synthetic_data', '--prefix', 'Test',
+                stdout=StringIO()
+            )
+
+
+class BenchmarkCommandTests(TestCase):
+    """ Test suite for the benchmark management command. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Generates a small dataset. """
+        generate_dataset(
+            study_groups=1,
+            students=2,
+            subjects=2,
+            lessons_per_day=2,
+            marks_per_lesson=2
+        )
+
+    def test_results(self):
+        """
+        Test that every benchmark reports its queries and durations and
+        the writing benchmarks leave the data unchanged.
+        """
+        lessons = Schedule.objects.count()
+        out = StringIO()
+        call_command('benchmark', '--iterations', '2', stdout=out)
+
+        results = json.loads(out.getvalue())
+        self.assertEqual(results['dataset']['lessons'], lessons)
+        self.assertEqual(set(results['results']), set(BENCHMARKS))
+        for result in results['results'].values():
+            self.assertGreater(result['queries'], 0)
+            self.assertLessEqual(result['min_ms'], result['p95_ms'])
+        self.assertEqual(Schedule.objects.count(), lessons)
+
+    def test_empty_database(self):
+        """ Test that the command fails without data. """
+        UserProfile.objects.all().delete()
+
+        with self.assertRaises(CommandError):
+            call_command('benchmark', stdout=StringIO())
+
+
+@override_settings(CACHES={
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'benchmark-tests',
+    }
+})
+class WarmBenchmarkTests(TransactionTestCase):
+    """
+    Test suite for the reading benchmarks, which must run outside of a
+    transaction to measure the process-wide caches.
+    """
+
+    def setUp(self):
+        """ Generates a small dataset without cached terms and choices. """
+        generate_dataset(
+            study_groups=1,
+            students=2,
+            subjects=2,
+            lessons_per_day=2,
+            marks_per_lesson=2
+        )
+        term_index._term_index.clear()
+        choices._choices.clear()
+        self.addCleanup(term_index._term_index.clear)
+        self.addCleanup(choices._choices.clear)
+
+    def test_warm_runs_keep_the_choices(self):
+        """
+        Test that a reading benchmark keeps the choices loaded by its first
+        run.
+        """
+        measure(BENCHMARKS['template_grid'], BenchmarkData(), 2)
+
+        self.assertTrue(choices._choices)
+
+
+class ConnectionBenchmarkCommandTests(TransactionTestCase):
+    """
+    Test suite for the connection_benchmark management command. The
+    requests close the database connections, so the data is committed.
+    """
+
+    def setUp(self):
+        """ Generates a small dataset. """
+        generate_dataset(
+            study_groups=1,
+            students=2,
+            subjects=2,
+            lessons_per_day=2,
+            marks_per_lesson=2
+        )
+
+    def test_results(self):
+        """
+        Test that both connection modes are timed and the configured
+        lifetime opens no more connections than a connection per request.
+        """
+        out = StringIO()
+        call_command('connection_benchmark', '--iterations', '3', stdout=out)
+
+        results = json.loads(out.getvalue())['results']
+        self.assertEqual(results['per_request']['conn_max_age'], 0)
+        self.assertEqual(
+            results['configured']['conn_max_age'],
+            settings.DATABASES['default']['CONN_MAX_AGE']
+        )
+        self.assertLessEqual(
+            results['configured']['connections'],
+            results['per_request']['connections']
+        )
+        for result in results.values():
+            self.assertGreater(result['median_ms'], 0)
+        self.assertEqual(
+            connection.settings_dict['CONN_MAX_AGE'],
+            settings.DATABASES['default']['CONN_MAX_AGE']
+        )
+
+    def test_invalid_arguments(self):
+        """ Test that the lifetime of persistent connections is positive. """
+        with self.assertRaises(CommandError):
+            call_command(
+                'connection_benchmark', '--conn-max-age', '0',
+                stdout=StringIO()
+            )
+
+
+class LoadTestCommandTests(TransactionTestCase):
+    """
+    Test suite for the load_test management command. The virtual users use
+    their own database connections, so the data is committed.
+    """
+
+    def setUp(self):
+        """ Generates a small dataset. """
+        generate_dataset(
+            study_groups=2,
+            students=3,
+            subjects=2,
+            lessons_per_day=2,
+            marks_per_lesson=2
+        )
+
+    def run_load_test(self, *args):
+        """ Runs the command and returns the report. """
+        out = StringIO()
+        call_command('load_test', *args, stdout=out)
+        return json.loads(out.getvalue())
+
+    def test_concurrent_students(self):
+        """
+        Test that the report contains the statistics of concurrent students.
+        """
+        report = self.run_load_test(
+            '--users', '3', '--requests', '5',
+            '--mix', 'bulk_student_mark=0', '--mix', 'fill_schedule=0'
+        )
+
+        self.assertEqual(report['users'], 3)
+        endpoint = report['endpoints']['student_schedule']
+        self.assertEqual(endpoint['requests'], 15)
+        self.assertEqual(endpoint['errors'], 0)
+        self.assertGreater(endpoint['queries_mean'], 0)
+        self.assertLessEqual(endpoint['p50_ms'], endpoint['p99_ms'])
+
+    def test_tutor_writes(self):
+        """
+        Test that mark entry and week fills are reported and the fills
+        write the cleared week.
+        """
+        report = self.run_load_test(
+            '--users', '1', '--requests', '10', '--day', '2024-09-02',
+            '--mix', 'student_schedule=0', '--mix', 'bulk_student_mark=1',
+            '--mix', 'fill_schedule=1'
+        )
+
+        self.assertEqual(
+            sum(
+                endpoint['requests']
+                for endpoint in report['endpoints'].values()
+            ),
+            10
+        )
+        for endpoint in report['endpoints'].values():
+            self.assertEqual(endpoint['errors'], 0)
+        self.assertTrue(
+            Schedule.objects.filter(date='2024-09-09').exists()
+        )
+
+    def test_asgi_concurrent_students(self):
+        """
+        Test that the ASGI application serves concurrent students from one
+        event loop.
+        """
+        report = self.run_load_test(
+            '--asgi', '--users', '3', '--requests', '5',
+            '--mix', 'bulk_student_mark=0', '--mix', 'fill_schedule=0'
+        )
+
+        self.assertEqual(report['server'], 'asgi')
+        endpoint = report['endpoints']['student_schedule']
+        self.assertEqual(endpoint['requests'], 15)
+        self.assertEqual(endpoint['errors'], 0)
+        self.assertNotIn('queries_mean', endpoint)
+
+    def test_asgi_tutor_writes(self):
+        """
+        Test that the ASGI clients send form posts passing the CSRF check.
+        """
+        report = self.run_load_test(
+            '--asgi', '--users', '1', '--requests', '2', '--day', '2024-09-02',
+            '--mix', 'student_schedule=0', '--mix', 'bulk_student_mark=0',
+            '--mix', 'fill_schedule=1'
+        )
+
+        self.assertEqual(report['endpoints']['fill_schedule']['errors'], 0)
+        self.assertTrue(
+            Schedule.objects.filter(date='2024-09-09').exists()
+        )
+
+    def test_unknown_endpoint(self):
+        """ Test that only the known endpoints can be weighted. """
+        with self.assertRaises(CommandError):
+            call_command('load_test', '--mix', 'admin=1', stdout=StringIO())
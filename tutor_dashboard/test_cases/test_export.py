@@ -0,0 +1,197 @@
+import csv
+import io
+import zipfile
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.contrib.messages import get_messages
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from dictionaries.export import get_csv_cell, get_xlsx_cell
+from dictionaries.models import (
+    Schedule,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term
+)
+
+
+class ExportViewTests(TestCase):
+    """ Test suite for the ExportView. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up lessons and marks of two study groups. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        cls.group_a = StudyGroup.objects.create(name="Group A")
+        cls.group_b = StudyGroup.objects.create(name="Group B")
+        cls.subject = Subject.objects.create(name="Math")
+        cls.tutor = User.objects.create_user(
+            username="tutor", password="password"
+        )
+        cls.tutor.groups.add(Group.objects.get(name="Tutor"))
+        cls.student = User.objects.create_user(
+            username="student",
+            password="password",
+            first_name="Anna",
+            last_name="Adams"
+        )
+        cls.student.groups.add(Group.objects.get(name="Student"))
+        cls.lesson_a = Schedule.objects.create(
+            study_group=cls.group_a,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=cls.subject,
+            homework='Read "Chapter 1", pages 1-10'
+        )
+        Schedule.objects.create(
+            study_group=cls.group_b,
+            date=date(2024, 9, 3),
+            order_number=2,
+            subject=cls.subject
+        )
+        # A lesson outside of the term
+        Schedule.objects.create(
+            study_group=cls.group_a,
+            date=date(2025, 1, 10),
+            order_number=1,
+            subject=cls.subject
+        )
+        StudentMark.objects.create(
+            schedule=cls.lesson_a, student=cls.student, mark=95
+        )
+        cls.url = reverse('tutor:export')
+
+    def setUp(self):
+        """ Logs in the tutor. """
+        self.client = Client()
+        self.client.login(username="tutor", password="password")
+
+    def get_csv(self, **params):
+        """ Requests a CSV export and returns the parsed rows. """
+        response = self.client.get(self.url, {'file_format': 'csv', **params})
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode()
+        return list(csv.reader(io.StringIO(content)))
+
+    def test_get_renders_form(self):
+        """ Test that the page without parameters renders the form. """
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'tutor_dashboard/export.html')
+
+    def test_schedule_csv_export(self):
+        """
+        Test that schedules of the term are exported with their homework.
+        """
+        rows = self.get_csv(dataset='schedules', term=self.term.pk)
+
+        self.assertEqual(
+            rows,
+            [
+                ['Date', 'Study group', 'Order number', 'Subject', 'Homework'],
+                [
+                    '2024-09-02', 'Group A', '1', 'Math',
+                    'Read "Chapter 1", pages 1-10'
+                ],
+                ['2024-09-03', 'Group B', '2', 'Math', ''],
+            ]
+        )
+
+    def test_export_filters_by_study_group_and_dates(self):
+        """ Test that the study group and the date range limit the rows. """
+        rows = self.get_csv(
+            dataset='schedules',
+            study_group=self.group_a.pk,
+            date_from='2024-09-01',
+            date_to='2025-01-31'
+        )
+
+        self.assertEqual(
+            [row[0] for row in rows[1:]], ['2024-09-02', '2025-01-10']
+        )
+
+    def test_student_mark_csv_export(self):
+        """ Test that student marks are exported with student names. """
+        with self.assertNumQueries(6):
+            # Session, user, two permission queries, the term and a single
+            # export query
+            rows = self.get_csv(dataset='student_marks', term=self.term.pk)
+
+        self.assertEqual(
+            rows[1],
+            [
+                '2024-09-02', 'Group A', '1', 'Math', 'Anna Adams',
+                'student', '95'
+            ]
+        )
+
+    def test_xlsx_export(self):
+        """ Test that the XLSX export is a workbook with the rows. """
+        response = self.client.get(self.url, {
+            'dataset': 'student_marks',
+            'file_format': 'xlsx',
+            'term': self.term.pk,
+        })
+        content = b''.join(response.streaming_content)
+
+        self.assertIn(
+            'filename="student_marks_2024-09-01_2024-12-31.xlsx"',
+            response['Content-Disposition']
+        )
+        with zipfile.ZipFile(io.BytesIO(content)) as workbook:
+            self.assertIsNone(workbook.testzip())
+            sheet = workbook.read('xl/worksheets/sheet1.xml').decode()
+        self.assertIn('<t xml:space="preserve">Anna Adams</t>', sheet)
+        self.assertIn('<c><v>95</v></c>', sheet)
+
+    def test_invalid_form_displays_errors(self):
+        """ Test that an export without a date range shows an error. """
+        response = self.client.get(
+            self.url, {'dataset': 'schedules', 'file_format': 'csv'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        messages = list(get_messages(response.wsgi_request))
+        self.assertIn(
+            "Select a term or specify the date range.", str(messages[0])
+        )
+
+    def test_student_cannot_export(self):
+        """ Test that a student is not allowed to export. """
+        self.client.login(username="student", password="password")
+        response = self.client.get(self.url, {
+            'dataset': 'student_marks',
+            'file_format': 'csv',
+            'term': self.term.pk,
+        })
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_xlsx_cell_escapes_text(self):
+        """
+        Test that text cells are escaped and stripped of control characters.
+        """
+        self.assertEqual(
+            get_xlsx_cell('a < b\x01'),
+            '<c t="inlineStr"><is><t xml:space="preserve">a &lt; b</t></is>'
+            '</c>'
+        )
+
+    def test_csv_cell_escapes_formulas(self):
+        """
+        Test that text cells starting a formula are prefixed with an
+        apostrophe and other values are written unchanged.
+        """
+        self.assertEqual(get_csv_cell('=SUM(A1:A9)'), "'=SUM(A1:A9)")
+        self.assertEqual(get_csv_cell('@cmd'), "'@cmd")
+        self.assertEqual(get_csv_cell('-1+1'), "'-1+1")
+        self.assertEqual(get_csv_cell('Read pages 1-10'), 'Read pages 1-10')
+        self.assertEqual(get_csv_cell(-5), -5)
@@ -0,0 +1,103 @@
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.contrib.messages import get_messages
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from dictionaries.models import ScheduleTemplate, StudyGroup, Subject, Term
+
+
+class ImportViewTests(TestCase):
+    """ Test suite for the ImportView. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a term, a study group, a subject and users. """
+        Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        StudyGroup.objects.create(name="Group A")
+        Subject.objects.create(name="Math")
+        tutor = User.objects.create_user(username="tutor", password="password")
+        tutor.groups.add(Group.objects.get(name="Tutor"))
+        student = User.objects.create_user(
+            username="student", password="password"
+        )
+        student.groups.add(Group.objects.get(name="Student"))
+        cls.url = reverse('tutor:import')
+
+    def setUp(self):
+        """ Sets up the test client. """
+        self.client = Client()
+
+    def upload(self, content):
+        """ Posts a schedule template CSV file to the view. """
+        return self.client.post(self.url, {
+            'dataset': 'schedule_templates',
+            'file': SimpleUploadedFile(
+                'templates.csv', content.encode(), content_type='text/csv'
+            ),
+        })
+
+    def test_get_renders_form(self):
+        """ Test that the page renders the upload form. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'tutor_dashboard/import.html')
+
+    def test_upload_imports_rows_and_reports_errors(self):
+        """
+        Test that valid rows are imported and rejected rows are listed.
+        """
+        self.client.login(username="tutor", password="password")
+        response = self.upload(
+            "\ufeffterm,study_group,weekday,order_number,subject\n"
+            "Term1,Group A,Monday,1,Math\n"
+            "Term1,Group A,Monday,2,History\n"
+        )
+
+        self.assertRedirects(response, self.url)
+        self.assertEqual(ScheduleTemplate.objects.count(), 1)
+        messages = [
+            str(message) for message in get_messages(response.wsgi_request)
+        ]
+        self.assertIn("Imported 1 rows, rejected 1 rows", messages[0])
+        self.assertEqual(messages[1], "Line 3: Unknown subject 'History'.")
+
+    def test_upload_reports_invalid_csv(self):
+        """
+        Test that a field over the size limit of the csv module is reported
+        and no rows are imported.
+        """
+        self.client.login(username="tutor", password="password")
+        response = self.upload(
+            "term,study_group,weekday,order_number,subject\n"
+            "Term1,Group A,Monday,1,Math\n"
+            f"Term1,Group A,Monday,2,{'M' * 200000}\n"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'tutor_dashboard/import.html')
+        self.assertFalse(ScheduleTemplate.objects.exists())
+        messages = [
+            str(message) for message in get_messages(response.wsgi_request)
+        ]
+        self.assertEqual(len(messages), 1)
+        self.assertIn("The file is not valid CSV: field larger", messages[0])
+
+    def test_student_cannot_import(self):
+        """ Test that a student is not allowed to import. """
+        self.client.login(username="student", password="password")
+        response = self.upload(
+            "term,study_group,weekday,order_number,subject\n"
+            "Term1,Group A,Monday,1,Math\n"
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(ScheduleTemplate.objects.exists())
@@ -0,0 +1,422 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User, Group
+from django.contrib.messages import get_messages
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+
+from dictionaries.models import (
+    Term,
+    StudyGroup,
+    Schedule,
+    Subject,
+    ScheduleTemplate,
+    StudentMark
+)
+from tutor_dashboard.materialization import (
+    materialize_schedule,
+    remove_template_lessons,
+    resync_template_lessons
+)
+
+
+class MaterializationTestMixin:
+    """ Creates terms, study groups and templates for the tests. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up two terms and two study groups with templates. """
+        cls.group_a = StudyGroup.objects.create(name="Group A", active=True)
+        cls.group_b = StudyGroup.objects.create(name="Group B", active=True)
+        cls.inactive_group = StudyGroup.objects.create(
+            name="Group C", active=False
+        )
+        cls.math = Subject.objects.create(name="Math", active=True)
+        cls.art = Subject.objects.create(name="Art", active=True)
+        cls.term1 = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 2),
+            date_to=date(2024, 9, 15),
+            active=True
+        )
+        cls.term2 = Term.objects.create(
+            name="Term2",
+            date_from=date(2024, 9, 16),
+            date_to=date(2024, 9, 29),
+            active=True
+        )
+        for term, subject in ((cls.term1, cls.math), (cls.term2, cls.art)):
+            for study_group in (cls.group_a, cls.group_b, cls.inactive_group):
+                for weekday in range(5):
+                    for order_number in (1, 2):
+                        ScheduleTemplate.objects.create(
+                            term=term,
+                            study_group=study_group,
+                            weekday=weekday,
+                            order_number=order_number,
+                            subject=subject
+                        )
+
+
+class MaterializeScheduleTests(MaterializationTestMixin, TestCase):
+    """ Test suite for the materialize_schedule engine. """
+
+    def test_materialize_date_range_for_active_groups(self):
+        """
+        Test that every weekday of the range is created for all active study
+        groups using the template of the matching term.
+        """
+        result = materialize_schedule(date(2024, 9, 2), date(2024, 9, 29))
+
+        # 4 weeks x 5 weekdays x 2 lessons x 2 active groups
+        self.assertEqual(result.created, 80)
+        self.assertEqual(Schedule.objects.count(), 80)
+        self.assertFalse(
+            Schedule.objects.filter(study_group=self.inactive_group).exists()
+        )
+        self.assertEqual(
+            Schedule.objects.get(
+                study_group=self.group_a,
+                date=date(2024, 9, 16),
+                order_number=1
+            ).subject,
+            self.art
+        )
+
+    def test_materialize_selected_groups(self):
+        """ Test that only the selected study groups are materialized. """
+        result = materialize_schedule(
+            date(2024, 9, 2), date(2024, 9, 8), study_groups=[self.group_b]
+        )
+
+        self.assertEqual(result.created, 10)
+        self.assertEqual(
+            set(Schedule.objects.values_list('study_group', flat=True)),
+            {self.group_b.pk}
+        )
+
+    def test_skip_existing_lessons(self):
+        """
+        Test that existing lessons are kept and only missing lessons are
+        created.
+        """
+        existing = Schedule.objects.create(
+            study_group=self.group_a,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=self.art,
+            homework='homework'
+        )
+        result = materialize_schedule(
+            date(2024, 9, 2), date(2024, 9, 8), study_groups=[self.group_a]
+        )
+
+        self.assertEqual(result.created, 9)
+        self.assertEqual(result.skipped, 1)
+        existing.refresh_from_db()
+        self.assertEqual(existing.subject, self.art)
+
+    def test_overwrite_existing_lessons(self):
+        """
+        Test that overwrite replaces the subject and keeps homework and
+        student marks.
+        """
+        existing = Schedule.objects.create(
+            study_group=self.group_a,
+            date=date(2024, 9, 2),
+            order_number=1,
+            subject=self.art,
+            homework='homework'
+        )
+        student = User.objects.create_user(username="student")
+        StudentMark.objects.create(schedule=existing, student=student, mark=5)
+
+        result = materialize_schedule(
+            date(2024, 9, 2),
+            date(2024, 9, 8),
+            study_groups=[self.group_a],
+            overwrite=True
+        )
+
+        self.assertEqual(result.created, 9)
+        self.assertEqual(result.updated, 1)
+        existing.refresh_from_db()
+        self.assertEqual(existing.subject, self.math)
+        self.assertEqual(existing.homework, 'homework')
+        self.assertTrue(StudentMark.objects.filter(schedule=existing).exists())
+
+    def test_query_count_does_not_depend_on_range(self):
+        """
+        Test that a whole range is materialized with a constant number of
+        queries.
+        """
+        with self.assertNumQueries(8):
+            materialize_schedule(
+                date(2024, 9, 2), date(2024, 9, 29), batch_size=1000
+            )
+
+    def test_no_terms(self):
+        """ Test that nothing is created outside of terms. """
+        result = materialize_schedule(date(2025, 1, 1), date(2025, 1, 31))
+        self.assertEqual(result.created, 0)
+        self.assertFalse(Schedule.objects.exists())
+
+
+class MaterializeScheduleCommandTests(MaterializationTestMixin, TestCase):
+    """ Test suite for the materialize_schedule management command. """
+
+    def test_command_materializes_term(self):
+        """ Test that the command materializes a whole term. """
+        out = StringIO()
+        call_command(
+            'materialize_schedule', '--term', str(self.term1.pk), stdout=out
+        )
+
+        self.assertEqual(Schedule.objects.count(), 40)
+        self.assertIn('Created 40', out.getvalue())
+        self.assertIn('rows/s', out.getvalue())
+
+    def test_command_requires_range(self):
+        """ Test that the command fails without a term or a date range. """
+        with self.assertRaises(CommandError):
+            call_command('materialize_schedule', stdout=StringIO())
+
+
+class MaterializeScheduleViewTests(MaterializationTestMixin, TestCase):
+    """ Test suite for MaterializeScheduleView. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up templates, a tutor and a student. """
+        super().setUpTestData()
+        cls.tutor_user = User.objects.create_user(
+            username="tutor",
+            password="password"
+        )
+        cls.student_user = User.objects.create_user(
+            username="student",
+            password="password"
+        )
+        cls.tutor_user.groups.add(Group.objects.get(name="Tutor"))
+        cls.student_user.groups.add(Group.objects.get(name="Student"))
+
+    def setUp(self):
+        """ Set up client and URL for the view under test. """
+        self.client = Client()
+        self.url = reverse('tutor:materialize_schedule')
+
+    def test_get_renders_form(self):
+        """ Test that a tutor can open the form. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(
+            response,
+            'tutor_dashboard/materialize_schedule.html'
+        )
+
+    def test_post_materializes_term(self):
+        """ Test that posting a term materializes it for the groups. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.post(self.url, {
+            'term': self.term2.pk,
+            'study_groups': [self.group_a.pk],
+        })
+
+        self.assertRedirects(response, self.url)
+        self.assertEqual(Schedule.objects.count(), 20)
+        messages = [m.message for m in get_messages(response.wsgi_request)]
+        self.assertTrue(messages[0].startswith('Schedule materialized.'))
+
+    def test_post_without_range_shows_error(self):
+        """ Test that posting without a term or dates shows an error. """
+        self.client.login(username="tutor", password="password")
+        response = self.client.post(self.url, {})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Schedule.objects.exists())
+        messages = [m.message for m in get_messages(response.wsgi_request)]
+        self.assertIn(
+            "Error in __all__: Select a term or specify the date range.",
+            messages
+        )
+
+    def test_student_cannot_materialize(self):
+        """ Test that a student cannot call POST method. """
+        self.client.login(username="student", password="password")
+        response = self.client.post(self.url, {'term': self.term1.pk})
+        self.assertEqual(response.status_code, 403)
+
+
+class TemplateResyncTests(MaterializationTestMixin, TestCase):
+    """
+    Test suite for propagating ScheduleTemplate changes to generated
+    lessons.
+    """
+
+    def setUp(self):
+        """ Materializes the first term for Group A. """
+        materialize_schedule(
+            date(2024, 9, 2), date(2024, 9, 15), study_groups=[self.group_a]
+        )
+        self.template = ScheduleTemplate.objects.get(
+            term=self.term1,
+            study_group=self.group_a,
+            weekday=0,
+            order_number=1
+        )
+
+    def get_monday_lessons(self):
+        """ Returns the first lessons on Mondays of the first term. """
+        return Schedule.objects.filter(
+            study_group=self.group_a,
+            order_number=1,
+            date__in=[date(2024, 9, 2), date(2024, 9, 9)]
+        ).order_by('date')
+
+    def test_resync_updates_future_lessons(self):
+        """
+        Test that only future lessons get the new subject and lessons with
+        homework or marks are preserved.
+        """
+        first_monday, second_monday = self.get_monday_lessons()
+        tuesday = Schedule.objects.get(
+            study_group=self.group_a, date=date(2024, 9, 10), order_number=1
+        )
+        old_subject_id = self.template.subject_id
+        self.template.subject = self.art
+        self.template.save()
+
+        updated = resync_template_lessons(
+            self.template, old_subject_id, date_from=date(2024, 9, 3)
+        )
+
+        self.assertEqual(updated, 1)
+        first_monday.refresh_from_db()
+        second_monday.refresh_from_db()
+        tuesday.refresh_from_db()
+        self.assertEqual(first_monday.subject, self.math)
+        self.assertEqual(second_monday.subject, self.art)
+        self.assertEqual(tuesday.subject, self.math)
+
+    def test_resync_preserves_lessons_with_homework_or_marks(self):
+        """ Test that lessons with homework or marks are not changed. """
+        first_monday, second_monday = self.get_monday_lessons()
+        first_monday.homework = 'homework'
+        first_monday.save()
+        student = User.objects.create_user(username="student")
+        StudentMark.objects.create(
+            schedule=second_monday, student=student, mark=5
+        )
+        old_subject_id = self.template.subject_id
+        self.template.subject = self.art
+        self.template.save()
+
+        updated = resync_template_lessons(
+            self.template, old_subject_id, date_from=date(2024, 9, 2)
+        )
+
+        self.assertEqual(updated, 0)
+        self.assertEqual(
+            list(self.get_monday_lessons().values_list('subject', flat=True)),
+            [self.math.pk, self.math.pk]
+        )
+
+    def test_resync_without_subject_change(self):
+        """ Test that nothing is queried when the subject is unchanged. """
+        with self.assertNumQueries(0):
+            updated = resync_template_lessons(
+                self.template, self.template.subject_id
+            )
+        self.assertEqual(updated, 0)
+
+    def test_remove_template_lessons(self):
+        """
+        Test that deleting a template removes its future lessons with one
+        bulk delete.
+        """
+        first_monday, second_monday = self.get_monday_lessons()
+        first_monday.homework = 'homework'
+        first_monday.save()
+
+        deleted = remove_template_lessons(
+            self.template, date_from=date(2024, 9, 2)
+        )
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(list(self.get_monday_lessons()), [first_monday])
+
+
+class TemplateResyncViewTests(TestCase):
+    """
+    Test suite for propagating changes made in the schedule template views.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a future term with a template and a generated lesson. """
+        today = timezone.localdate()
+        cls.lesson_date = today + timedelta(days=7 - today.weekday())
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.math = Subject.objects.create(name="Math")
+        cls.art = Subject.objects.create(name="Art")
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=cls.lesson_date,
+            date_to=cls.lesson_date + timedelta(days=30),
+        )
+        cls.template = ScheduleTemplate.objects.create(
+            term=cls.term,
+            study_group=cls.study_group,
+            weekday=0,
+            order_number=1,
+            subject=cls.math
+        )
+        cls.tutor_user = User.objects.create_user(
+            username="tutor",
+            password="password"
+        )
+        cls.tutor_user.groups.add(Group.objects.get(name="Tutor"))
+
+    def setUp(self):
+        """ Generates the lesson and logs the tutor in. """
+        self.lesson = Schedule.objects.create(
+            study_group=self.study_group,
+            date=self.lesson_date,
+            order_number=1,
+            subject=self.math
+        )
+        self.client = Client()
+        self.client.login(username="tutor", password="password")
+
+    def test_edit_template_updates_lessons(self):
+        """ Test that editing a template updates the generated lesson. """
+        response = self.client.post(
+            reverse('tutor:edit_schedule_template', args=[self.template.pk]),
+            {
+                'term': self.term.pk,
+                'study_group': self.study_group.pk,
+                'weekday': 0,
+                'order_number': 1,
+                'subject': self.art.pk
+            }
+        )
+
+        self.lesson.refresh_from_db()
+        self.assertEqual(self.lesson.subject, self.art)
+        messages = [m.message for m in get_messages(response.wsgi_request)]
+        self.assertIn(
+            '1 future lesson(s) updated from the template.', messages
+        )
+
+    def test_delete_template_removes_lessons(self):
+        """ Test that deleting a template removes the generated lesson. """
+        self.client.post(
+            reverse('tutor:delete_schedule_template', args=[self.template.pk])
+        )
+
+        self.assertFalse(Schedule.objects.filter(pk=self.lesson.pk).exists())
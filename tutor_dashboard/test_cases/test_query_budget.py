@@ -0,0 +1,536 @@
+from datetime import date, timedelta
+from itertools import count
+
+from django.contrib.auth.models import Group, User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from dictionaries.models import (
+    Schedule,
+    ScheduleTemplate,
+    StudentMark,
+    StudyGroup,
+    Subject,
+    Term
+)
+from users.models import UserProfile
+
+WEEK_START = date(2024, 9, 2)
+
+
+class QueryBudgetTests(TestCase):
+    """
+    Test suite checking that the number of queries of the dashboard pages
+    does not grow with the number of lessons, students and marks.
+
+    Every page is requested for a small and a large study group and both
+    requests must execute the budgeted number of queries. A first request
+    warms up the data cached per process, such as the role groups.
+    """
+
+    @classmethod
+    def create_group(cls, name, students, lessons_per_day):
+        """
+        Creates a study group with students, a week of lessons with marks
+        of every student and a schedule template.
+
+        Args:
+            name (str): The name of the study group.
+            students (int): The number of students.
+            lessons_per_day (int): The number of lessons per weekday.
+
+        Returns:
+            StudyGroup: The created study group.
+        """
+        study_group = StudyGroup.objects.create(name=name)
+        student_group = Group.objects.get(name="Student")
+        users = []
+        for number in range(students):
+            user = User.objects.create_user(
+                username=f"{name}-student-{number}",
+                first_name=f"First{number}",
+                last_name=f"Last{number}",
+                password="password"
+            )
+            user.groups.add(student_group)
+            UserProfile.objects.create(
+                user=user, study_group=study_group, checked=True
+            )
+            users.append(user)
+
+        subjects = list(Subject.objects.all())
+        lessons = Schedule.objects.bulk_create(
+            Schedule(
+                study_group=study_group,
+                date=WEEK_START + timedelta(days=weekday),
+                order_number=order_number,
+                subject=subjects[order_number % len(subjects)],
+                homework=f"Homework {order_number}"
+            )
+            for weekday in range(5)
+            for order_number in range(1, lessons_per_day + 1)
+        )
+        StudentMark.objects.bulk_create(
+            StudentMark(schedule=lesson, student=user, mark=70)
+            for lesson in lessons
+            for user in users
+        )
+        ScheduleTemplate.objects.bulk_create(
+            ScheduleTemplate(
+                term=cls.term,
+                study_group=study_group,
+                weekday=weekday,
+                order_number=order_number,
+                subject=subjects[order_number % len(subjects)]
+            )
+            for weekday in range(5)
+            for order_number in range(1, lessons_per_day + 1)
+        )
+        return study_group
+
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up a small and a large study group and a tutor. """
+        cls.term = Term.objects.create(
+            name="Term1",
+            date_from=date(2024, 9, 1),
+            date_to=date(2024, 12, 31)
+        )
+        for name in ("Math", "Art", "History", "Physics"):
+            Subject.objects.create(name=name)
+        cls.small_group = cls.create_group("Small", 1, 1)
+        cls.large_group = cls.create_group("Large", 20, 6)
+        cls.tutor = User.objects.create_user(
+            username="tutor", password="password"
+        )
+        cls.tutor.groups.add(Group.objects.get(name="Tutor"))
+
+    def setUp(self):
+        """ Sets up the test client. """
+        self.client = Client()
+
+    def request(self, url, params=None, method='get'):
+        """
+        Requests a page and reads the content of a streamed response, so
+        the queries of the stream are counted.
+
+        Args:
+            url (str): The URL of the page.
+            params (dict, optional): The GET or POST parameters.
+            method (str): The HTTP method.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        response = getattr(self.client, method)(url, params)
+        self.assertIn(response.status_code, (200, 302))
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def assertConstantQueries(
+        self, num_queries, url, get_params=None, method='get'
+    ):
+        """
+        Asserts that a page executes the budgeted number of queries for the
+        small and the large study group.
+
+        Args:
+            num_queries (int): The query budget of the page.
+            url (str or callable): The URL of the page or a callable
+            returning the URL of a study group.
+            get_params (callable, optional): Returns the GET or POST
+            parameters of a study group.
+            method (str): The HTTP method.
+        """
+        def get_request(study_group):
+            return (
+                url(study_group) if callable(url) else url,
+                get_params(study_group) if get_params else None,
+                method
+            )
+
+        self.request(*get_request(self.small_group))
+        for study_group in (self.small_group, self.large_group):
+            request = get_request(study_group)
+            with self.assertNumQueries(num_queries):
+                self.request(*request)
+
+    def get_lesson(self, study_group):
+        """ Returns the first lesson of a study group. """
+        return Schedule.objects.filter(
+            study_group=study_group
+        ).order_by('date', 'order_number').first()
+
+    def get_lesson_url(self, study_group):
+        """ Returns the URL of the edit page of the first lesson. """
+        return reverse(
+            'tutor:edit_schedule', args=[self.get_lesson(study_group).pk]
+        )
+
+    def get_template_url(self, study_group):
+        """ Returns the URL of the edit page of the first template. """
+        schedule_template = ScheduleTemplate.objects.filter(
+            study_group=study_group
+        ).order_by('weekday', 'order_number').first()
+        return reverse(
+            'tutor:edit_schedule_template', args=[schedule_template.pk]
+        )
+
+    def test_tutor_schedule(self):
+        """ Test the query budget of the tutor's weekly schedule. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            8,
+            reverse('tutor:schedule'),
+            lambda study_group: {
+                'date': WEEK_START, 'study_group': study_group.pk
+            }
+        )
+
+    def test_tutor_schedule_templates(self):
+        """ Test the query budget of the schedule template grid. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            8,
+            reverse('tutor:schedule_templates'),
+            lambda study_group: {
+                'term': self.term.pk, 'study_group': study_group.pk
+            }
+        )
+
+    def test_tutor_week_api(self):
+        """ Test the query budget of the JSON week grid. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            9,
+            reverse('tutor:api_schedule_week'),
+            lambda study_group: {
+                'date': WEEK_START, 'study_group': study_group.pk
+            }
+        )
+
+    def test_edit_schedule(self):
+        """
+        Test the query budget of the lesson page listing the marks of all
+        students.
+        """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(10, self.get_lesson_url)
+
+    def test_save_schedule(self):
+        """
+        Test the query budget of saving a lesson with the marks of all
+        students.
+        """
+        self.client.login(username="tutor", password="password")
+
+        def get_params(study_group):
+            lesson = self.get_lesson(study_group)
+            return {
+                'date': lesson.date,
+                'study_group': study_group.pk,
+                'order_number': lesson.order_number,
+                'subject': lesson.subject_id,
+                'homework': "Updated homework",
+            }
+
+        self.assertConstantQueries(
+            25, self.get_lesson_url, get_params, method='post'
+        )
+
+    def test_add_schedule(self):
+        """ Test the query budget of the page adding a lesson. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            7,
+            reverse('tutor:add_schedule'),
+            lambda study_group: {
+                'date': WEEK_START,
+                'study_group': study_group.pk,
+                'order_number': 10,
+            }
+        )
+
+    def test_add_schedule_template(self):
+        """ Test the query budget of the page adding a template. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            8,
+            reverse('tutor:add_schedule_template'),
+            lambda study_group: {
+                'term': self.term.pk,
+                'study_group': study_group.pk,
+                'weekday': 0,
+                'order_number': 10,
+            }
+        )
+
+    def test_edit_schedule_template(self):
+        """ Test the query budget of the page editing a template. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(9, self.get_template_url)
+
+    def test_save_schedule_template(self):
+        """
+        Test the query budget of saving a template with its future lessons.
+        """
+        self.client.login(username="tutor", password="password")
+        subject = Subject.objects.get(name="History")
+
+        def get_params(study_group):
+            schedule_template = ScheduleTemplate.objects.filter(
+                study_group=study_group
+            ).order_by('weekday', 'order_number').first()
+            return {
+                'term': self.term.pk,
+                'study_group': study_group.pk,
+                'weekday': schedule_template.weekday,
+                'order_number': schedule_template.order_number,
+                'subject': subject.pk,
+            }
+
+        self.assertConstantQueries(
+            15, self.get_template_url, get_params, method='post'
+        )
+
+    def test_materialize_schedule(self):
+        """ Test the query budget of materializing a week of lessons. """
+        self.client.login(username="tutor", password="password")
+        weeks = count(1)
+
+        def get_params(study_group):
+            # Every request creates the lessons of a new week
+            week_start = WEEK_START + timedelta(weeks=next(weeks))
+            return {
+                'date_from': week_start,
+                'date_to': week_start + timedelta(days=4),
+                'study_groups': [study_group.pk],
+            }
+
+        self.assertConstantQueries(
+            12,
+            reverse('tutor:materialize_schedule'),
+            get_params,
+            method='post'
+        )
+
+    def test_export(self):
+        """ Test the query budget of the streamed mark export. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            6,
+            reverse('tutor:export'),
+            lambda study_group: {
+                'dataset': 'student_marks',
+                'file_format': 'csv',
+                'date_from': WEEK_START,
+                'date_to': WEEK_START + timedelta(days=4),
+                'study_group': study_group.pk,
+            }
+        )
+
+    def test_import(self):
+        """ Test the query budget of importing the marks of a lesson. """
+        self.client.login(username="tutor", password="password")
+
+        def get_params(study_group):
+            lines = ["date,study_group,order_number,student,mark"]
+            lines += [
+                f"{mark.schedule.date},{study_group.name},"
+                f"{mark.schedule.order_number},{mark.student.username},80"
+                for mark in StudentMark.objects.filter(
+                    schedule=self.get_lesson(study_group)
+                ).select_related('schedule', 'student')
+            ]
+            csv_file = SimpleUploadedFile(
+                "marks.csv", "\n".join(lines).encode(), "text/csv"
+            )
+            return {'dataset': 'student_marks', 'file': csv_file}
+
+        self.assertConstantQueries(
+            17, reverse('tutor:import'), get_params, method='post'
+        )
+
+    def test_homework_search(self):
+        """ Test the query budget of the homework search. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            9,
+            reverse('student:homework_search'),
+            lambda study_group: {
+                'q': "homework", 'study_group': study_group.pk
+            }
+        )
+
+    def test_delete_schedule(self):
+        """ Test the query budget of deleting a lesson with marks. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            19,
+            lambda study_group: reverse(
+                'tutor:delete_schedule',
+                args=[self.get_lesson(study_group).pk]
+            ),
+            method='post'
+        )
+
+    def test_fill_schedule(self):
+        """ Test the query budget of filling a week from the templates. """
+        self.client.login(username="tutor", password="password")
+        weeks = count(1)
+
+        def get_params(study_group):
+            # Every request fills a new week
+            return {
+                'date': WEEK_START + timedelta(weeks=next(weeks)),
+                'study_group': study_group.pk,
+            }
+
+        self.assertConstantQueries(
+            11, reverse('tutor:fill_schedule'), get_params, method='post'
+        )
+
+    def test_delete_schedule_template(self):
+        """ Test the query budget of deleting a template. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            9,
+            lambda study_group: reverse(
+                'tutor:delete_schedule_template',
+                args=[ScheduleTemplate.objects.filter(
+                    study_group=study_group
+                ).order_by('weekday', 'order_number').first().pk]
+            ),
+            method='post'
+        )
+
+    def test_template_api(self):
+        """ Test the query budget of the JSON template grid. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            8,
+            reverse('tutor:api_schedule_templates'),
+            lambda study_group: {
+                'term': self.term.pk, 'study_group': study_group.pk
+            }
+        )
+
+    def get_mark(self, study_group):
+        """ Returns the first mark of a study group. """
+        return StudentMark.objects.filter(
+            schedule__study_group=study_group
+        ).order_by('pk').first()
+
+    def test_add_student_mark(self):
+        """ Test the query budget of adding a mark to a lesson. """
+        self.client.login(username="tutor", password="password")
+
+        def get_params(study_group):
+            # The mark of the student is added again
+            student_mark = StudentMark.objects.get(
+                schedule=self.get_lesson(study_group),
+                student__username=f"{study_group.name}-student-0"
+            )
+            student_mark.delete()
+            return {'student': student_mark.student_id, 'mark': 65}
+
+        self.assertConstantQueries(
+            19,
+            lambda study_group: reverse(
+                'tutor:add_student_mark',
+                args=[self.get_lesson(study_group).pk]
+            ),
+            get_params,
+            method='post'
+        )
+
+    def test_edit_student_mark(self):
+        """ Test the query budget of editing a mark. """
+        self.client.login(username="tutor", password="password")
+
+        def get_url(study_group):
+            student_mark = self.get_mark(study_group)
+            return reverse(
+                'tutor:edit_student_mark',
+                args=[student_mark.schedule_id, student_mark.pk]
+            )
+
+        self.assertConstantQueries(
+            19,
+            get_url,
+            lambda study_group: {
+                'student': self.get_mark(study_group).student_id, 'mark': 55
+            },
+            method='post'
+        )
+
+    def test_delete_student_mark(self):
+        """ Test the query budget of deleting a mark. """
+        self.client.login(username="tutor", password="password")
+
+        def get_url(study_group):
+            student_mark = self.get_mark(study_group)
+            return reverse(
+                'tutor:delete_student_mark',
+                args=[student_mark.schedule_id, student_mark.pk]
+            )
+
+        self.assertConstantQueries(15, get_url, method='post')
+
+    def test_bulk_student_mark(self):
+        """ Test the query budget of saving the marks of all students. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            16,
+            lambda study_group: reverse(
+                'tutor:bulk_student_mark',
+                args=[self.get_lesson(study_group).pk]
+            ),
+            lambda study_group: {
+                f'mark_{profile.user_id}': 60
+                for profile in UserProfile.objects.filter(
+                    study_group=study_group
+                )
+            },
+            method='post'
+        )
+
+    def test_request_timings(self):
+        """ Test the query budget of the request timings page. """
+        User.objects.create_user(
+            username="staff", password="password", is_staff=True
+        )
+        self.client.login(username="staff", password="password")
+        self.request(reverse('request_timings'))
+
+        with self.assertNumQueries(3):
+            self.request(reverse('request_timings'))
+
+    def test_student_dashboard(self):
+        """ Test the query budget of the student's weekly schedule. """
+        students = {
+            self.small_group: User.objects.get(username="Small-student-0"),
+            self.large_group: User.objects.get(username="Large-student-0"),
+        }
+        url = reverse('student:dashboard')
+        params = {'date': WEEK_START}
+
+        self.client.force_login(students[self.small_group])
+        self.request(url, params)
+        for student in students.values():
+            self.client.force_login(student)
+            with self.assertNumQueries(8):
+                self.request(url, params)
+
+    def test_gradebook(self):
+        """ Test the query budget of the gradebook. """
+        self.client.login(username="tutor", password="password")
+        self.assertConstantQueries(
+            10,
+            reverse('student:gradebook'),
+            lambda study_group: {
+                'term': self.term.pk, 'study_group': study_group.pk
+            }
+        )
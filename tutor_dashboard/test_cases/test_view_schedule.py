@@ -1,8 +1,10 @@
-from datetime import date
+from datetime import date, timedelta
 
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.contrib.messages import get_messages
 from django.contrib.auth.models import User, Group
+from django.db import connection
 from django.urls import reverse
 
 from dictionaries.models import (
@@ -15,7 +17,11 @@ from dictionaries.models import (
 )
 from dictionaries.forms import ScheduleFilterForm, ScheduleForm
 
-from tutor_dashboard.views import ScheduleView, ScheduleBaseView
+from tutor_dashboard.views import (
+    ScheduleView,
+    ScheduleBaseView,
+    FillScheduleView
+)
 
 from users.models import UserProfile
 
@@ -380,6 +386,101 @@ class ScheduleViewTests(TestCase):
                     self.assertEqual(details['marks'], 95)
 
 
+class ScheduleViewQueryCountTests(TestCase):
+    """
+    Test suite to ensure the number of queries of the ScheduleView does not
+    depend on the number of lessons in the week.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """ Sets up study group, subject, users and a week of lessons. """
+        cls.study_group = StudyGroup.objects.create(
+            name="Group A",
+            active=True
+        )
+        cls.subject = Subject.objects.create(name="Subject1", active=True)
+        cls.week_start = date(2024, 9, 2)
+        cls.tutor_user = User.objects.create_user(
+            username="tutor",
+            password="password"
+        )
+        cls.student_user = User.objects.create_user(
+            username="student",
+            password="password"
+        )
+        cls.tutor_user.groups.add(Group.objects.get(name="Tutor"))
+        cls.student_user.groups.add(Group.objects.get(name="Student"))
+        UserProfile.objects.create(
+            user=cls.student_user,
+            study_group=cls.study_group,
+            checked=True
+        )
+
+    def setUp(self):
+        """ Sets up a test client and the URL for the 'schedule' view. """
+        self.client = Client()
+        self.url = reverse('tutor:schedule')
+
+    def create_lessons(self, days, orders):
+        """ Creates lessons with a student mark for each of them. """
+        for day in range(days):
+            for order_number in range(1, orders + 1):
+                schedule = Schedule.objects.create(
+                    date=self.week_start + timedelta(days=day),
+                    study_group=self.study_group,
+                    order_number=order_number,
+                    subject=self.subject
+                )
+                StudentMark.objects.create(
+                    schedule=schedule,
+                    student=self.student_user,
+                    mark=order_number
+                )
+
+    def count_queries(self, data):
+        """ Returns the number of queries executed by a GET request. """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, data)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_tutor_query_count_is_constant(self):
+        """
+        Test that a tutor week with one lesson and a full week of lessons
+        costs the same number of queries.
+        """
+        self.client.login(username="tutor", password="password")
+        data = {'date': self.week_start, 'study_group': self.study_group.id}
+        self.create_lessons(1, 1)
+        single_lesson_queries = self.count_queries(data)
+
+        Schedule.objects.all().delete()
+        self.create_lessons(7, 10)
+        full_week_queries = self.count_queries(data)
+
+        self.assertEqual(single_lesson_queries, full_week_queries)
+        schedule = self.client.get(self.url, data).context['schedule']
+        self.assertEqual(schedule[6]['details'][10]['marks'], 1)
+
+    def test_student_query_count_is_constant(self):
+        """
+        Test that a student week with one lesson and a full week of lessons
+        costs the same number of queries.
+        """
+        self.client.login(username="student", password="password")
+        data = {'date': self.week_start}
+        self.create_lessons(1, 1)
+        single_lesson_queries = self.count_queries(data)
+
+        Schedule.objects.all().delete()
+        self.create_lessons(7, 10)
+        full_week_queries = self.count_queries(data)
+
+        self.assertEqual(single_lesson_queries, full_week_queries)
+        schedule = self.client.get(self.url, data).context['schedule']
+        self.assertEqual(schedule[6]['details'][10]['marks'], 10)
+
+
 class EditScheduleViewTests(TestCase):
     """ Test suite for EditScheduleView. """
 
@@ -860,6 +961,68 @@ class FillScheduleViewTests(TestCase):
         messages = [m.message for m in get_messages(response.wsgi_request)]
         self.assertIn('Study group and date are not specified.', messages)
 
+    def test_post_fill_full_week_with_bulk_insert(self):
+        """
+        Test that a full week is created from templates and the number of
+        queries does not depend on the number of templates.
+        """
+        self.client.login(username='tutor', password='password')
+        ScheduleTemplate.objects.all().delete()
+        ScheduleTemplate.objects.bulk_create([
+            ScheduleTemplate(
+                study_group=self.study_group,
+                weekday=weekday,
+                subject=self.subject,
+                order_number=order_number,
+                term=self.term
+            )
+            for weekday in range(7)
+            for order_number in range(1, 11)
+        ])
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(self.url, {
+                'study_group': self.study_group.id,
+                'date': self.date
+            })
+
+        inserts = [
+            query for query in context.captured_queries
+            if query['sql'].startswith('INSERT INTO "dictionaries_schedule"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertLess(len(context.captured_queries), 20)
+        self.assertEqual(
+            Schedule.objects.filter(
+                study_group=self.study_group,
+                date__range=(date(2024, 10, 14), date(2024, 10, 20))
+            ).count(),
+            70
+        )
+
+    def test_create_combinations_resolves_terms_in_memory(self):
+        """
+        Test that terms are resolved for every day of the week without
+        additional queries.
+        """
+        view = FillScheduleView()
+        next_term = Term.objects.create(
+            name='Term2',
+            date_from=date(2024, 11, 1),
+            date_to=date(2024, 11, 30),
+            active=True
+        )
+        start_of_week = date(2024, 10, 28)
+        terms = view.get_terms(start_of_week, start_of_week + timedelta(6))
+
+        with self.assertNumQueries(0):
+            combinations = view.create_combinations(start_of_week, terms)
+
+        self.assertEqual(
+            [combo['term'] for combo in combinations],
+            [self.term] * 4 + [next_term] * 3
+        )
+
     def test_get_student_cannot_fill_schedule(self):
         """ Test that a student cannot call POST method. """
         self.client.login(username="student", password="password")
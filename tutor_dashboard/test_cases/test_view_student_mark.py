@@ -4,8 +4,11 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth.models import User, Group
 from django.contrib.messages import get_messages
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 
 from dictionaries.models import StudyGroup, Subject, StudentMark, Schedule
+from users.models import UserProfile
 from dictionaries.forms import StudentMarkForm
 
 
@@ -54,6 +57,10 @@ class StudentMarkViewTests(TestCase):
         cls.tutor_user.groups.add(tutor_group)
         cls.student_user.groups.add(student_group)
         cls.student_user2.groups.add(student_group)
+        for student in (cls.student_user, cls.student_user2):
+            UserProfile.objects.create(
+                user=student, study_group=cls.study_group, checked=True
+            )
 
     def setUp(self):
         """
@@ -198,6 +205,10 @@ class AddStudentMarkView(TestCase):
         cls.tutor_user.groups.add(tutor_group)
         cls.student_user.groups.add(student_group)
         cls.student_user2.groups.add(student_group)
+        for student in (cls.student_user, cls.student_user2):
+            UserProfile.objects.create(
+                user=student, study_group=cls.study_group, checked=True
+            )
 
     def setUp(self):
         """
@@ -333,6 +344,10 @@ class DeleteStudentMarkView(TestCase):
         cls.tutor_user.groups.add(tutor_group)
         cls.student_user.groups.add(student_group)
         cls.student_user2.groups.add(student_group)
+        for student in (cls.student_user, cls.student_user2):
+            UserProfile.objects.create(
+                user=student, study_group=cls.study_group, checked=True
+            )
 
     def setUp(self):
         """
@@ -384,3 +399,125 @@ class DeleteStudentMarkView(TestCase):
             StudentMark.objects.filter(pk=self.student_mark.pk).exists()
         )
         self.assertEqual(response.status_code, 403)
+
+
+class BulkStudentMarkViewTests(TestCase):
+    """
+    Tests for the BulkStudentMarkView, which enters the marks of all students
+    of a schedule in one submission.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up a schedule, a tutor and a study group of thirty students.
+        """
+        cls.study_group = StudyGroup.objects.create(name="Group A")
+        cls.subject = Subject.objects.create(name="Subject1")
+        cls.schedule = Schedule.objects.create(
+            date=date(2024, 9, 3),
+            study_group=cls.study_group,
+            order_number=1,
+            subject=cls.subject
+        )
+        cls.tutor_user = User.objects.create_user(
+            username="tutor",
+            password="password"
+        )
+        cls.tutor_user.groups.add(Group.objects.get(name="Tutor"))
+        student_group = Group.objects.get(name="Student")
+        cls.students = []
+        for number in range(30):
+            student = User.objects.create_user(
+                username=f"student{number}",
+                password="password",
+                first_name=f"Student{number}"
+            )
+            student.groups.add(student_group)
+            UserProfile.objects.create(
+                user=student, study_group=cls.study_group, checked=True
+            )
+            cls.students.append(student)
+        cls.url = reverse('tutor:bulk_student_mark', args=[cls.schedule.pk])
+
+    def setUp(self):
+        """ Sets up the test client. """
+        self.client = Client()
+
+    def test_bulk_entry_upserts_marks_in_one_query(self):
+        """
+        Tests that the marks of the whole group are inserted or updated with
+        a single statement and that existing marks are updated in place.
+        """
+        existing = StudentMark.objects.create(
+            student=self.students[0], schedule=self.schedule, mark=10
+        )
+        data = {
+            f"mark_{student.pk}": 50 + number
+            for number, student in enumerate(self.students)
+        }
+        self.client.login(username='tutor', password='password')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data)
+        inserts = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith(
+                'INSERT INTO "dictionaries_studentmark"'
+            )
+        ]
+
+        self.assertEqual(len(inserts), 1)
+        self.assertRedirects(
+            response,
+            reverse('tutor:edit_schedule', args=[self.schedule.pk])
+        )
+        self.assertEqual(
+            StudentMark.objects.filter(schedule=self.schedule).count(), 30
+        )
+        existing.refresh_from_db()
+        self.assertEqual(existing.mark, 50)
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(str(messages[0]), "30 student mark(s) saved.")
+
+    def test_empty_fields_leave_marks_unchanged(self):
+        """ Tests that students without an entered mark are skipped. """
+        existing = StudentMark.objects.create(
+            student=self.students[1], schedule=self.schedule, mark=10
+        )
+        self.client.login(username='tutor', password='password')
+        self.client.post(self.url, {
+            f"mark_{self.students[0].pk}": 80,
+            f"mark_{self.students[1].pk}": '',
+        })
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.mark, 10)
+        self.assertEqual(
+            StudentMark.objects.filter(schedule=self.schedule).count(), 2
+        )
+
+    def test_invalid_mark_saves_nothing(self):
+        """
+        Tests that the marks are validated together and nothing is saved if
+        one of them is invalid.
+        """
+        self.client.login(username='tutor', password='password')
+        response = self.client.post(self.url, {
+            f"mark_{self.students[0].pk}": 80,
+            f"mark_{self.students[1].pk}": 101,
+        })
+
+        self.assertFalse(
+            StudentMark.objects.filter(schedule=self.schedule).exists()
+        )
+        messages = list(get_messages(response.wsgi_request))
+        self.assertIn("Error in Student1", str(messages[0]))
+
+    def test_bulk_entry_permission_denied(self):
+        """ Tests that a student cannot enter marks. """
+        self.client.login(username='student0', password='password')
+        response = self.client.post(
+            self.url, {f"mark_{self.students[0].pk}": 100}
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(StudentMark.objects.exists())
@@ -9,9 +9,15 @@ from .views import (
     AddScheduleView,
     DeleteScheduleView,
     FillScheduleView,
+    MaterializeScheduleView,
     EditStudentMarkView,
     AddStudentMarkView,
-    DeleteStudentMarkView
+    DeleteStudentMarkView,
+    BulkStudentMarkView,
+    ExportView,
+    ImportView,
+    ScheduleWeekApiView,
+    ScheduleTemplateApiView
     )
 
 app_name = 'tutor'
@@ -57,6 +63,23 @@ urlpatterns = [
         name='delete_schedule'
     ),
     path('schedules/fill/', FillScheduleView.as_view(), name='fill_schedule'),
+    path(
+        'schedules/materialize/',
+        MaterializeScheduleView.as_view(),
+        name='materialize_schedule'
+    ),
+    path('export/', ExportView.as_view(), name='export'),
+    path('import/', ImportView.as_view(), name='import'),
+    path(
+        'api/schedule/week/',
+        ScheduleWeekApiView.as_view(),
+        name='api_schedule_week'
+    ),
+    path(
+        'api/schedule_templates/',
+        ScheduleTemplateApiView.as_view(),
+        name='api_schedule_templates'
+    ),
     path(
         'schedule/<int:schedule_pk>/student_mark/<int:mark_pk>/edit/',
         EditStudentMarkView.as_view(),
@@ -72,4 +95,9 @@ urlpatterns = [
         DeleteStudentMarkView.as_view(),
         name='delete_student_mark'
     ),
+    path(
+        'schedule/<int:schedule_pk>/student_mark/bulk/',
+        BulkStudentMarkView.as_view(),
+        name='bulk_student_mark'
+    ),
 ]
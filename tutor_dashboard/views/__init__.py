@@ -12,11 +12,22 @@ from .schedule_views import (
     EditScheduleView,
     AddScheduleView,
     DeleteScheduleView,
-    FillScheduleView
+    FillScheduleView,
+    MaterializeScheduleView
 )
 
 from .student_mark_views import (
     EditStudentMarkView,
     AddStudentMarkView,
-    DeleteStudentMarkView
+    DeleteStudentMarkView,
+    BulkStudentMarkView
+)
+
+from .export_views import ExportView
+from .import_views import ImportView
+
+from .api_views import (
+    ConditionalJsonMixin,
+    ScheduleWeekApiView,
+    ScheduleTemplateApiView
 )
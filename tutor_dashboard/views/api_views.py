@@ -0,0 +1,240 @@
+import hashlib
+from datetime import timedelta
+
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.db.models import Count, Max
+from django.http import JsonResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers
+)
+from django.utils.http import http_date, quote_etag
+from django.views.generic import View
+
+from dictionaries.forms import ScheduleFilterForm, ScheduleTemplateFilterForm
+from dictionaries.models import Schedule, ScheduleTemplate, WeekdayChoices
+from dictionaries.schedule_cache import get_term_templates, get_week_schedules
+from users.roles import get_user_role
+from .schedule_views import ScheduleView
+
+
+class ConditionalJsonMixin:
+    """
+    Mixin for read-only JSON views answering conditional GET requests.
+
+    The version of the data is computed with one aggregate query before the
+    data is loaded. When it matches the client's If-None-Match or
+    If-Modified-Since header, a 304 response is returned without loading or
+    serializing the data.
+    """
+    http_method_names = ['get', 'head', 'options']
+
+    def get_version(self, form):
+        """
+        Returns the version of the requested data.
+
+        Parameters:
+        - form: The valid filter form.
+
+        Returns:
+        - A tuple with the aggregate values identifying the data and the
+        newest change time (datetime or None).
+        """
+        raise NotImplementedError
+
+    def get_data(self, form):
+        """
+        Returns the requested data.
+
+        Parameters:
+        - form: The valid filter form.
+
+        Returns:
+        - A JSON serializable dictionary.
+        """
+        raise NotImplementedError
+
+    def get_form(self, request):
+        """
+        Returns the bound filter form.
+
+        Parameters:
+        - request: The HTTP request object containing GET parameters.
+        """
+        raise NotImplementedError
+
+    def get(self, request):
+        """
+        Handles GET requests with conditional GET support.
+
+        Parameters:
+        - request: The HTTP request object containing GET parameters.
+
+        Returns:
+        - A JsonResponse with the data, a 304 response if the client's copy
+        is current, or a JsonResponse with the form errors and status 400.
+        """
+        form = self.get_form(request)
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=400)
+
+        version, updated_at = self.get_version(form)
+        # The payload depends on the user's role, so it is part of the ETag
+        etag = quote_etag(hashlib.md5(
+            f"{request.get_full_path()}:{request.user.pk}:{version}".encode()
+        ).hexdigest())
+        last_modified = int(updated_at.timestamp()) if updated_at else None
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = JsonResponse(self.get_data(form))
+        response.headers['ETag'] = etag
+        if last_modified:
+            response.headers['Last-Modified'] = http_date(last_modified)
+        # Let browsers keep the copy but revalidate it on every request
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Cookie'])
+        return response
+
+
+def get_newest(*values):
+    """ Returns the newest of the change times, ignoring empty values. """
+    values = [value for value in values if value]
+    return max(values) if values else None
+
+
+class ScheduleWeekApiView(ConditionalJsonMixin, ScheduleView):
+    """
+    Read-only JSON view of the schedule of a study group for one week.
+
+    Tutors receive the number of student marks per lesson, students receive
+    their own mark and always see their own study group.
+    """
+    permission_required = 'dictionaries.view_schedule'
+
+    def get_form(self, request):
+        """ Returns the week filter form, limited for students. """
+        user_role = get_user_role(request.user)
+        get_params = request.GET
+        if user_role.is_student:
+            get_params = request.GET.copy()
+            get_params['study_group'] = (
+                user_role.study_group.pk if user_role.study_group else ''
+            )
+        return ScheduleFilterForm(
+            get_params,
+            is_student=user_role.is_student,
+            user_study_group=user_role.study_group,
+        )
+
+    def get_version(self, form):
+        """
+        Returns the numbers and the newest change times of the week's lessons
+        and marks.
+        """
+        version = Schedule.objects.filter(
+            **form.get_filter_params()
+        ).aggregate(
+            lessons=Count('id', distinct=True),
+            lessons_updated=Max('updated_at'),
+            marks=Count('studentmark'),
+            marks_updated=Max('studentmark__updated_at'),
+        )
+        return (
+            tuple(version.values()),
+            get_newest(version['lessons_updated'], version['marks_updated'])
+        )
+
+    def get_data(self, form):
+        """ Returns the lessons of the week grouped by weekday. """
+        filter_params = form.get_filter_params()
+        user_role = get_user_role(self.request.user)
+        week_start, week_end = filter_params['date__range']
+        objects = get_week_schedules(
+            filter_params['study_group'].pk, week_start
+        )
+        marks = self.get_marks(
+            objects,
+            filter_params,
+            {'user': self.request.user, 'is_student': user_role.is_student}
+        )
+        days = {
+            value: {
+                'weekday': value,
+                'label': label,
+                'date': str(week_start + timedelta(days=value)),
+                'lessons': [],
+            }
+            for value, label in WeekdayChoices.choices
+        }
+        for object in sorted(objects, key=lambda item: item.order_number):
+            days[object.date.weekday()]['lessons'].append({
+                'id': object.id,
+                'order_number': object.order_number,
+                'subject': object.subject.name,
+                'homework': object.homework,
+                'marks': marks.get(object.id, 0),
+            })
+
+        study_group = filter_params['study_group']
+        return {
+            'study_group': {'id': study_group.pk, 'name': study_group.name},
+            'week_start': str(week_start),
+            'week_end': str(week_end),
+            'days': list(days.values()),
+        }
+
+
+class ScheduleTemplateApiView(
+    ConditionalJsonMixin, PermissionRequiredMixin, View
+):
+    """
+    Read-only JSON view of the schedule template grid of a study group for
+    a term.
+    """
+    permission_required = 'dictionaries.view_scheduletemplate'
+
+    def get_form(self, request):
+        """ Returns the term and study group filter form. """
+        return ScheduleTemplateFilterForm(request.GET)
+
+    def get_templates(self, form):
+        """ Returns the schedule templates of the term and study group. """
+        return ScheduleTemplate.objects.filter(
+            term=form.cleaned_data['term'],
+            study_group=form.cleaned_data['study_group']
+        )
+
+    def get_version(self, form):
+        """ Returns the number and the newest change time of templates. """
+        version = self.get_templates(form).aggregate(
+            templates=Count('id'), updated=Max('updated_at')
+        )
+        return tuple(version.values()), version['updated']
+
+    def get_data(self, form):
+        """ Returns the templates grouped by weekday. """
+        days = {
+            value: {'weekday': value, 'label': label, 'lessons': []}
+            for value, label in WeekdayChoices.choices
+        }
+        templates = get_term_templates(
+            form.cleaned_data['term'].pk, form.cleaned_data['study_group'].pk
+        )
+        for template in templates:
+            days[template.weekday]['lessons'].append({
+                'id': template.id,
+                'order_number': template.order_number,
+                'subject': template.subject.name,
+            })
+
+        term = form.cleaned_data['term']
+        study_group = form.cleaned_data['study_group']
+        return {
+            'term': {'id': term.pk, 'name': term.name},
+            'study_group': {'id': study_group.pk, 'name': study_group.name},
+            'days': list(days.values()),
+        }
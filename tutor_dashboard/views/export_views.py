@@ -0,0 +1,78 @@
+from django.contrib import messages
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.http import StreamingHttpResponse
+from django.shortcuts import render
+from django.views.generic import View
+
+from dictionaries.export import EXPORTS, FILE_FORMATS
+from dictionaries.forms import ExportForm
+
+
+class ExportView(PermissionRequiredMixin, View):
+    """
+    View to export schedules or student marks of every study group as CSV or
+    XLSX files.
+
+    The file is streamed row by row from a database iterator, so the memory
+    use does not depend on the size of the export.
+    """
+    template_name = 'tutor_dashboard/export.html'
+    permission_required = (
+        'dictionaries.change_schedule',
+        'dictionaries.change_studentmark'
+    )
+
+    def get(self, request):
+        """
+        Renders the export form or streams the export file.
+
+        Parameters:
+        - request: The HTTP request object containing GET parameters.
+
+        Returns:
+        - If no export is requested: Renders the `export.html` template with
+        the form.
+        - If the form is valid: A StreamingHttpResponse with the file.
+        - If the form is invalid: Reloads the form with error messages.
+        """
+        if 'dataset' not in request.GET:
+            return render(request, self.template_name, {'form': ExportForm()})
+
+        form = ExportForm(request.GET)
+        if form.is_valid():
+            return self.stream_export(form.cleaned_data)
+
+        # Form validation error message
+        for field, errors in form.errors.items():
+            messages.error(request, f"Error in {field}: {', '.join(errors)}")
+
+        return render(request, self.template_name, {'form': form})
+
+    def stream_export(self, data):
+        """
+        Builds the streaming response of the export.
+
+        Parameters:
+        - data: The cleaned data of the export form.
+
+        Returns:
+        - A StreamingHttpResponse with the file as an attachment.
+        """
+        header, get_rows = EXPORTS[data['dataset']]
+        stream, content_type = FILE_FORMATS[data['file_format']]
+        rows = get_rows(
+            data['date_from'],
+            data['date_to'],
+            study_group=data['study_group']
+        )
+        file_name = (
+            f"{data['dataset']}_{data['date_from']}_{data['date_to']}."
+            f"{data['file_format']}"
+        )
+        response = StreamingHttpResponse(
+            stream(header, rows), content_type=content_type
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{file_name}"'
+        )
+        return response
@@ -0,0 +1,89 @@
+import csv
+import io
+
+from django.contrib import messages
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.shortcuts import redirect, render
+from django.urls import reverse
+from django.views.generic import View
+
+from dictionaries.forms import ImportForm
+from dictionaries.importer import IMPORTERS
+
+# The number of rejected rows listed in messages
+MAX_ERROR_MESSAGES = 20
+
+
+class ImportView(PermissionRequiredMixin, View):
+    """
+    View to import schedule templates or student marks from an uploaded CSV
+    file.
+
+    Valid rows are written and invalid rows are reported line by line, so a
+    few bad rows do not reject the whole file.
+    """
+    template_name = 'tutor_dashboard/import.html'
+    permission_required = (
+        'dictionaries.add_scheduletemplate',
+        'dictionaries.add_studentmark'
+    )
+
+    def get(self, request):
+        """
+        Renders the upload form.
+
+        Parameters:
+        - request: The HTTP request object.
+
+        Returns:
+        - Renders the `import.html` template with the form.
+        """
+        return render(request, self.template_name, {'form': ImportForm()})
+
+    def post(self, request):
+        """
+        Imports the uploaded CSV file.
+
+        Parameters:
+        - request: The HTTP request object containing POST data and the file.
+
+        Returns:
+        - If the form is valid: Redirects to the same page with a message
+        reporting the result and the rejected rows.
+        - If the form is invalid: Reloads the form with error messages.
+        """
+        form = ImportForm(request.POST, request.FILES)
+
+        if form.is_valid():
+            importer = IMPORTERS[form.cleaned_data['dataset']]()
+            lines = io.TextIOWrapper(
+                form.cleaned_data['file'], encoding='utf-8-sig', newline=''
+            )
+            try:
+                result = importer.run(lines)
+            except UnicodeDecodeError:
+                messages.error(request, "The file must be UTF-8 encoded.")
+                return render(request, self.template_name, {'form': form})
+            except csv.Error as error:
+                messages.error(request, f"The file is not valid CSV: {error}.")
+                return render(request, self.template_name, {'form': form})
+
+            if result.imported:
+                messages.success(request, str(result))
+            else:
+                messages.warning(request, str(result))
+            for line, message in result.errors[:MAX_ERROR_MESSAGES]:
+                messages.error(request, f"Line {line}: {message}")
+            if len(result.errors) > MAX_ERROR_MESSAGES:
+                messages.error(
+                    request,
+                    f"... and {len(result.errors) - MAX_ERROR_MESSAGES} more "
+                    f"rejected rows."
+                )
+            return redirect(reverse('tutor:import'))
+
+        # Form validation error message
+        for field, errors in form.errors.items():
+            messages.error(request, f"Error in {field}: {', '.join(errors)}")
+
+        return render(request, self.template_name, {'form': form})
@@ -2,10 +2,16 @@ from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.views.generic import View
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.db import transaction
 from django.urls import reverse
 
 from dictionaries.models import ScheduleTemplate, WeekdayChoices
 from dictionaries.forms import ScheduleTemplateFilterForm, ScheduleTemplateForm
+from dictionaries.schedule_cache import get_term_templates
+from tutor_dashboard.materialization import (
+    remove_template_lessons,
+    resync_template_lessons
+)
 
 
 class ScheduleTemplateBaseView(PermissionRequiredMixin, View):
@@ -170,13 +176,10 @@ class ScheduleTemplateView(PermissionRequiredMixin, View):
             - bool: Indicates if the table is empty (no templates found).
         """
         if term_id and study_group_id:
-            templates = ScheduleTemplate.objects.filter(
-                term=term_id,
-                study_group=study_group_id
-            )
+            templates = get_term_templates(term_id, study_group_id)
             table_empty = False
         else:
-            templates = ScheduleTemplate.objects.none()
+            templates = []
             table_empty = True
 
         return self.get_full_week_schedule(templates), table_empty
@@ -186,8 +189,8 @@ class ScheduleTemplateView(PermissionRequiredMixin, View):
         Organizes schedule templates by weekday for display.
 
         Parameters:
-            templates (QuerySet): ScheduleTemplate queryset filtered by term
-            and study group.
+            templates (iterable): ScheduleTemplate instances of a term and
+            study group with their subjects loaded.
 
         Returns:
             dict: A dictionary organizing schedule templates by weekday, with
@@ -232,7 +235,10 @@ class EditScheduleTemplateView(ScheduleTemplateBaseView):
         Returns:
             HttpResponse: Rendered template with the form.
         """
-        schedule_template = get_object_or_404(ScheduleTemplate, pk=pk)
+        schedule_template = get_object_or_404(
+            ScheduleTemplate.objects.select_related('term', 'study_group'),
+            pk=pk
+        )
         form = ScheduleTemplateForm(instance=schedule_template)
         return render(request, self.template_name, {'form': form})
 
@@ -248,11 +254,19 @@ class EditScheduleTemplateView(ScheduleTemplateBaseView):
         Returns:
             HttpResponse: Redirects on success or renders form on failure.
         """
-        schedule_template = get_object_or_404(ScheduleTemplate, pk=pk)
+        schedule_template = get_object_or_404(
+            ScheduleTemplate.objects.select_related('term', 'study_group'),
+            pk=pk
+        )
+        old_subject_id = schedule_template.subject_id
         form = ScheduleTemplateForm(request.POST, instance=schedule_template)
 
         if form.is_valid():
-            form.save()
+            with transaction.atomic():
+                schedule_template = form.save()
+                updated = resync_template_lessons(
+                    schedule_template, old_subject_id
+                )
             data = {
                 'term': form.cleaned_data.get('term'),
                 'study_group': form.cleaned_data.get('study_group'),
@@ -261,6 +275,11 @@ class EditScheduleTemplateView(ScheduleTemplateBaseView):
                 request,
                 "Schedule template updated successfully."
             )
+            if updated:
+                messages.info(
+                    request,
+                    f"{updated} future lesson(s) updated from the template."
+                )
             return self.handle_redirect(data)
 
         # Form validation error message
@@ -357,11 +376,21 @@ class DeleteScheduleTemplateView(ScheduleTemplateBaseView):
             HttpResponse: Redirects to the schedule templates list after
             successful deletion.
         """
-        schedule_template = get_object_or_404(ScheduleTemplate, pk=pk)
+        schedule_template = get_object_or_404(
+            ScheduleTemplate.objects.select_related('term', 'study_group'),
+            pk=pk
+        )
         data = {
                 'term': schedule_template.term,
                 'study_group': schedule_template.study_group,
         }
-        schedule_template.delete()
+        with transaction.atomic():
+            deleted = remove_template_lessons(schedule_template)
+            schedule_template.delete()
         messages.success(request, "Schedule template deleted successfully.")
+        if deleted:
+            messages.info(
+                request,
+                f"{deleted} future lesson(s) removed with the template."
+            )
         return self.handle_redirect(data)
@@ -1,24 +1,41 @@
+from collections import defaultdict
 from datetime import timedelta, datetime
 
 from django.contrib import messages
 from django.contrib.auth.mixins import PermissionRequiredMixin
-from django.db.models import Q
+from django.db import transaction
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.views.generic import View
 
-from dictionaries.forms import ScheduleFilterForm, ScheduleForm
+from dictionaries.forms import (
+    BulkStudentMarkForm,
+    ScheduleFilterForm,
+    ScheduleForm,
+    ScheduleMaterializeForm
+)
 from dictionaries.models import (
     Schedule,
     WeekdayChoices,
-    ScheduleTemplate,
     StudyGroup,
-    Term,
     StudentMark
     )
 
+from dictionaries.mark_summary import (
+    get_summary_keys,
+    refresh_mark_summaries,
+    refresh_summary_keys
+)
+from dictionaries.schedule_cache import (
+    get_term_templates,
+    get_week_marks,
+    get_week_schedules,
+    invalidate_weeks
+)
+from dictionaries.term_index import TermIndex, get_term_index
+from tutor_dashboard.materialization import materialize_schedule
+from tutor_dashboard.views.student_mark_views import get_schedule_students
 from users.context_processors import user_profile_parameters
-from users.models import UserProfile
 
 
 class ScheduleBaseView(PermissionRequiredMixin, View):
@@ -237,10 +254,13 @@ class ScheduleView(PermissionRequiredMixin, View):
         found for the filters).
         """
         if filter_params['date__range'][0] and filter_params['study_group']:
-            objects = Schedule.objects.filter(**filter_params)
-            table_empty = not objects.exists()
+            objects = get_week_schedules(
+                filter_params['study_group'].pk,
+                filter_params['date__range'][0]
+            )
+            table_empty = not objects
         else:
-            objects = Schedule.objects.none()
+            objects = []
             table_empty = True
 
         return (
@@ -284,24 +304,41 @@ class ScheduleView(PermissionRequiredMixin, View):
             }
             for value, label in WeekdayChoices.choices
         }
+        marks = self.get_marks(objects, filter_params, context_var)
         for object in objects:
-            marks = 0
-            if context_var['is_student']:
-                student_marks = StudentMark.objects.filter(
-                    schedule=object, student=context_var['user'])
-                if student_marks.exists():
-                    marks = student_marks.first().mark
-            else:
-                marks = StudentMark.objects.filter(schedule=object).count()
-
             schedule[object.date.weekday()]['details'][object.order_number] = {
                 'id': object.id,
                 'subject': object.subject,
                 'homework': 'Tasks: ' + object.homework,
-                'marks': marks,
+                'marks': marks.get(object.id, 0),
             }
         return schedule
 
+    def get_marks(self, objects, filter_params, context_var):
+        """
+        Loads the marks for all schedule objects of the week in one query or
+        from the schedule cache.
+
+        Parameters:
+        - objects: Iterable of Schedule objects displayed in the week.
+        - filter_params: Dictionary of filter parameters, specifically date
+        range and study group.
+        - context_var: context processor variables (user, user_study_group...).
+
+        Returns:
+        - A dictionary keyed by schedule id. For students the value is the
+        student's own mark, for tutors it is the number of student marks.
+        """
+        if not objects:
+            return {}
+
+        return get_week_marks(
+            filter_params['study_group'].pk,
+            filter_params['date__range'][0],
+            objects,
+            student=context_var['user'] if context_var['is_student'] else None
+        )
+
 
 class EditScheduleView(ScheduleBaseView):
     """
@@ -325,17 +362,30 @@ class EditScheduleView(ScheduleBaseView):
         Returns:
         - Renders the `edit_schedule.html` template with:
         1. `schedule`: The form pre-filled with the current Schedule data.
-        2. `student_marks`: A queryset of StudentMark instances related to the
+        2. `student_marks`: A list of StudentMark instances related to the
         schedule.
-        3. `users`: A queryset of UserProfile instances in the study group for
-        the schedule.
+        3. `students`: The checked students of the study group for the
+        schedule.
+        4. `bulk_form`: The form to enter the marks of all students at once,
+        pre-filled with the current marks.
         """
-        schedule = Schedule.objects.get(pk=pk)
+        schedule = Schedule.objects.select_related(
+            'study_group', 'subject'
+        ).get(pk=pk)
         form = ScheduleForm(instance=schedule)
-        student_marks = StudentMark.objects.filter(schedule=schedule)
-        users = UserProfile.objects.filter(
-            study_group=schedule.study_group
-            ).select_related('user')
+        student_marks = list(
+            StudentMark.objects.filter(
+                schedule=schedule
+            ).select_related('student')
+        )
+        students = get_schedule_students(schedule)
+        bulk_form = BulkStudentMarkForm(
+            students=students,
+            student_marks={
+                student_mark.student_id: student_mark.mark
+                for student_mark in student_marks
+            }
+        )
 
         return render(
             request,
@@ -343,7 +393,8 @@ class EditScheduleView(ScheduleBaseView):
             {
                 'schedule': form,
                 'student_marks': student_marks,
-                'users': users,
+                'students': students,
+                'bulk_form': bulk_form,
             }
         )
 
@@ -361,11 +412,22 @@ class EditScheduleView(ScheduleBaseView):
         - If the form is invalid: Reloads the form with error messages
         displayed for each invalid field.
         """
-        schedule = get_object_or_404(Schedule, pk=pk)
+        schedule = get_object_or_404(
+            Schedule.objects.select_related('study_group'), pk=pk
+        )
         form = ScheduleForm(request.POST, instance=schedule)
 
         if form.is_valid():
-            form.save()
+            # The subject and date of the marks may change with the schedule
+            marks = list(
+                StudentMark.objects.filter(
+                    schedule=schedule
+                ).values_list('student_id', 'schedule_id')
+            )
+            with transaction.atomic():
+                previous_keys = get_summary_keys(marks)
+                form.save()
+                refresh_mark_summaries(marks, previous_keys)
             data = {
                 'date': form.cleaned_data.get('date'),
                 'study_group': form.cleaned_data.get('study_group'),
@@ -462,12 +524,21 @@ class DeleteScheduleView(ScheduleBaseView):
         - Redirects to the schedule list page with filter parameters for date
         and study group, if the deletion is successful.
         """
-        schedule = get_object_or_404(Schedule, pk=pk)
+        schedule = get_object_or_404(
+            Schedule.objects.select_related('study_group'), pk=pk
+        )
         data = {
                 'date': schedule.date,
                 'study_group': schedule.study_group,
         }
-        schedule.delete()
+        with transaction.atomic():
+            previous_keys = get_summary_keys(
+                StudentMark.objects.filter(
+                    schedule=schedule
+                ).values_list('student_id', 'schedule_id')
+            )
+            schedule.delete()
+            refresh_summary_keys(previous_keys)
         messages.success(request, "Schedule deleted successfully.")
         return self.handle_redirect(data)
 
@@ -481,6 +552,8 @@ class FillScheduleView(ScheduleBaseView):
     group within a specified week. It performs various validations, including
     checking for existing schedules, ensuring active terms are present, and
     verifying applicable templates before creating new Schedule entries.
+    The checks and the insert run in one transaction while the study group is
+    locked, so concurrent fills of the same week cannot create partial weeks.
     """
     permission_required = 'dictionaries.add_schedule'
 
@@ -503,36 +576,43 @@ class FillScheduleView(ScheduleBaseView):
             date_template = self.parse_date(date_request)
             start_of_week, end_of_week = self.get_week_range(date_template)
 
-            # Check if Schedule entries already exist
-            if self.schedule_exists(
-                study_group_request, start_of_week, end_of_week
-            ):
-                messages.error(
-                    request,
-                    'Schedule entries already exist for the specified study '
-                    'group and date range.'
-                    )
-                return self.handle_redirect(data)
-
-            terms = self.get_terms(start_of_week, end_of_week)
-            if not terms.exists():
-                messages.error(
-                    request,
-                    'No active terms found for the specified date range.'
-                    )
-                return self.handle_redirect(data)
-
-            combinations = self.create_combinations(start_of_week, terms)
-            query = self.build_query(study_group_request, combinations)
-            templates = ScheduleTemplate.objects.filter(query)
-            if not templates.exists():
-                messages.error(
-                    request,
-                    'No template found for the selected study group and terms.'
-                    )
-                return self.handle_redirect(data)
-
-            self.fill_schedule(templates, start_of_week)
+            with transaction.atomic():
+                # Lock the study group so concurrent fills of the same week
+                # run one after another
+                self.lock_study_group(study_group_request)
+
+                # Check if Schedule entries already exist
+                if self.schedule_exists(
+                    study_group_request, start_of_week, end_of_week
+                ):
+                    messages.error(
+                        request,
+                        'Schedule entries already exist for the specified '
+                        'study group and date range.'
+                        )
+                    return self.handle_redirect(data)
+
+                terms = self.get_terms(start_of_week, end_of_week)
+                if not terms:
+                    messages.error(
+                        request,
+                        'No active terms found for the specified date range.'
+                        )
+                    return self.handle_redirect(data)
+
+                combinations = self.create_combinations(start_of_week, terms)
+                templates = self.get_templates(
+                    study_group_request, combinations
+                )
+                if not templates:
+                    messages.error(
+                        request,
+                        'No template found for the selected study group and '
+                        'terms.'
+                        )
+                    return self.handle_redirect(data)
+
+                self.fill_schedule(templates, start_of_week)
             messages.success(
                 request,
                 'Schedule filled successfully from template.'
@@ -542,6 +622,19 @@ class FillScheduleView(ScheduleBaseView):
 
         return self.handle_redirect(data)
 
+    def lock_study_group(self, study_group_request):
+        """
+        Locks the study group row until the end of the current transaction.
+
+        Parameters:
+        - study_group_request: Study group identifier from the request.
+        """
+        list(
+            StudyGroup.objects.select_for_update().filter(
+                pk=study_group_request
+            ).values_list('pk', flat=True)
+        )
+
     def get_week_range(self, date_template):
         """
         Calculates the start and end dates of the week for the given date.
@@ -586,11 +679,9 @@ class FillScheduleView(ScheduleBaseView):
         - end_of_week: The end date of the week.
 
         Returns:
-        - A QuerySet of Term instances that are active within the date range.
+        - A list of Term instances that are active within the date range.
         """
-        return Term.objects.filter(
-            Q(date_from__lte=end_of_week) & Q(date_to__gte=start_of_week)
-        ).order_by('date_from')
+        return get_term_index().get_overlapping(start_of_week, end_of_week)
 
     def create_combinations(self, start_of_week, terms):
         """
@@ -599,60 +690,122 @@ class FillScheduleView(ScheduleBaseView):
 
         Parameters:
         - start_of_week: The start date of the week.
-        - terms: A QuerySet of active Term instances.
+        - terms: A list of active Term instances ordered by date_from.
 
         Returns:
         - A list of dictionaries, each containing a `weekday` and `term` for
         the dates in the specified week.
         """
+        week = [start_of_week + timedelta(days=i) for i in range(7)]
+        week_terms = TermIndex(terms).get_terms(week)
         combinations = []
-        for date_week in (start_of_week + timedelta(days=i) for i in range(7)):
-            term = terms.filter(
-                date_from__lte=date_week, date_to__gte=date_week
-                ).first()
+        for date_week in week:
+            term = week_terms[date_week]
             if term:
                 combinations.append(
                     {'weekday': date_week.weekday(), 'term': term}
                     )
         return combinations
 
-    def build_query(self, study_group_request, combinations):
+    def get_templates(self, study_group_request, combinations):
         """
-        Constructs a query for filtering ScheduleTemplate instances based on
-        study group and combinations of weekday and term.
+        Returns the ScheduleTemplate instances of the study group matching
+        the combinations of weekday and term, read from the schedule template
+        cache.
 
         Parameters:
         - study_group_request: The study group identifier.
         - combinations: List of dictionaries with weekday-term pairs.
 
         Returns:
-        - A Q object representing the query for matching ScheduleTemplates.
-        """
-        query = Q(
-            study_group=study_group_request,
-            weekday=combinations[0]['weekday'],
-            term=combinations[0]['term'])
-        for combo in combinations[1:]:
-            query |= Q(
-                study_group=study_group_request,
-                weekday=combo['weekday'],
-                term=combo['term'])
-        return query
+        - A list of the matching ScheduleTemplate instances.
+        """
+        weekdays = defaultdict(set)
+        for combo in combinations:
+            weekdays[combo['term'].pk].add(combo['weekday'])
+        return [
+            template
+            for term_id, term_weekdays in weekdays.items()
+            for template in get_term_templates(term_id, study_group_request)
+            if template.weekday in term_weekdays
+        ]
 
     def fill_schedule(self, templates, start_of_week):
         """
         Populates the Schedule by creating entries based on ScheduleTemplate
-        instances.
+        instances with a single bulk insert.
 
         Parameters:
-        - templates: QuerySet of ScheduleTemplate instances that match the
-        filter criteria.
+        - templates: ScheduleTemplate instances that match the filter
+        criteria.
         - start_of_week: The start date of the week being populated.
+
+        Returns:
+        - A list of the created Schedule instances.
         """
-        for template in templates:
-            Schedule.objects.create(
+        schedules = Schedule.objects.bulk_create([
+            Schedule(
                 date=start_of_week + timedelta(days=template.weekday),
-                study_group=template.study_group,
-                subject=template.subject,
+                study_group_id=template.study_group_id,
+                subject_id=template.subject_id,
                 order_number=template.order_number
             )
+            for template in templates
+        ])
+        # The bulk insert does not send signals
+        invalidate_weeks(
+            (schedule.study_group_id, schedule.date) for schedule in schedules
+        )
+        return schedules
+
+
+class MaterializeScheduleView(PermissionRequiredMixin, View):
+    """
+    View to materialize the Schedule from ScheduleTemplate entries for a date
+    range or a whole term and many study groups at once.
+    """
+    template_name = 'tutor_dashboard/materialize_schedule.html'
+    permission_required = 'dictionaries.add_schedule'
+
+    def get(self, request):
+        """
+        Renders the materialization form.
+
+        Parameters:
+        - request: The HTTP request object.
+
+        Returns:
+        - Renders the `materialize_schedule.html` template with the form.
+        """
+        form = ScheduleMaterializeForm()
+        return render(request, self.template_name, {'form': form})
+
+    def post(self, request):
+        """
+        Materializes the schedule for the selected range and study groups.
+
+        Parameters:
+        - request: The HTTP request object containing POST data.
+
+        Returns:
+        - If the form is valid: Redirects to the same page with a message
+        reporting the number of created rows and the throughput.
+        - If the form is invalid: Reloads the form with error messages.
+        """
+        form = ScheduleMaterializeForm(request.POST)
+
+        if form.is_valid():
+            result = materialize_schedule(
+                form.cleaned_data['date_from'],
+                form.cleaned_data['date_to'],
+                study_groups=form.cleaned_data['study_groups'],
+                overwrite=form.cleaned_data['overwrite'],
+            )
+            messages.success(request, f"Schedule materialized. {result}")
+            return redirect(reverse('tutor:materialize_schedule'))
+
+        # Form validation error message
+        for field, errors in form.errors.items():
+            messages.error(request, f"Error in {field}: {', '.join(errors)}")
+
+        return render(request, self.template_name, {'form': form})
@@ -1,12 +1,16 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.views.generic import View
 
-from dictionaries.forms import StudentMarkForm
+from dictionaries.forms import BulkStudentMarkForm, StudentMarkForm
+from dictionaries.mark_summary import refresh_mark_summaries
+from dictionaries.schedule_cache import invalidate_weeks
 from dictionaries.models import Schedule, StudentMark
+from users.roster import get_study_group_students
 
 
 class EditStudentMarkView(PermissionRequiredMixin, View):
@@ -35,8 +39,15 @@ class EditStudentMarkView(PermissionRequiredMixin, View):
         Returns:
         - Redirects to the edit schedule page with appropriate messages.
         """
-        student_mark = get_object_or_404(StudentMark, pk=mark_pk)
-        form = StudentMarkForm(request.POST, instance=student_mark)
+        student_mark = get_object_or_404(
+            StudentMark.objects.select_related('schedule'), pk=mark_pk
+        )
+        previous_mark = (student_mark.student_id, student_mark.schedule_id)
+        form = StudentMarkForm(
+            request.POST,
+            instance=student_mark,
+            students=get_schedule_students(student_mark.schedule)
+        )
         if form.is_valid():
             student = form.cleaned_data['student']
             mark = form.cleaned_data['mark']
@@ -53,7 +64,12 @@ class EditStudentMarkView(PermissionRequiredMixin, View):
                     f"this schedule.")
             else:
                 # Save and display success message
-                form.save()
+                with transaction.atomic():
+                    student_mark = form.save()
+                    refresh_mark_summaries([
+                        previous_mark,
+                        (student_mark.student_id, student_mark.schedule_id)
+                    ])
                 messages.success(request, "Student mark updated successfully.")
 
             return redirect(
@@ -91,7 +107,9 @@ class AddStudentMarkView(PermissionRequiredMixin, View):
         - Redirects to the edit schedule page with appropriate messages.
         """
         schedule = get_object_or_404(Schedule, pk=schedule_pk)
-        form = StudentMarkForm(request.POST)
+        form = StudentMarkForm(
+            request.POST, students=get_schedule_students(schedule)
+        )
 
         if form.is_valid():
             student = form.cleaned_data['student']
@@ -113,7 +131,11 @@ class AddStudentMarkView(PermissionRequiredMixin, View):
                 # Save the new mark and display success message
                 new_mark = form.save(commit=False)
                 new_mark.schedule = schedule
-                new_mark.save()
+                with transaction.atomic():
+                    new_mark.save()
+                    refresh_mark_summaries(
+                        [(new_mark.student_id, schedule.pk)]
+                    )
                 messages.success(request, "Student mark added successfully.")
 
         # Form validation error message
@@ -145,7 +167,86 @@ class DeleteStudentMarkView(PermissionRequiredMixin, View):
         Returns:
         - Redirects to the edit schedule page with a success message.
         """
-        student_mark = get_object_or_404(StudentMark, pk=mark_pk)
-        student_mark.delete()
+        student_mark = get_object_or_404(
+            StudentMark.objects.select_related('schedule'), pk=mark_pk
+        )
+        with transaction.atomic():
+            student_mark.delete()
+            refresh_mark_summaries(
+                [(student_mark.student_id, student_mark.schedule_id)]
+            )
         messages.success(request, "Student mark deleted successfully.")
         return redirect(reverse('tutor:edit_schedule', args=[schedule_pk]))
+
+
+def get_schedule_students(schedule):
+    """
+    Returns the checked students of the study group of a schedule from the
+    cached roster.
+
+    Parameters:
+    - schedule: The Schedule instance.
+
+    Returns:
+    - A list of User instances ordered by name.
+    """
+    return get_study_group_students(schedule.study_group_id)
+
+
+class BulkStudentMarkView(PermissionRequiredMixin, View):
+    """
+    View to enter the marks of all students of a schedule at once.
+
+    The marks are validated together and upserted with a single query keyed
+    on the `unique_student_mark_row` constraint, so existing marks are
+    updated and new ones are inserted.
+    """
+    permission_required = (
+        'dictionaries.add_studentmark',
+        'dictionaries.change_studentmark'
+    )
+
+    def post(self, request, schedule_pk):
+        """
+        Handles POST requests to save the marks of the schedule's students.
+
+        Parameters:
+        - request: The HTTP request object containing POST data.
+        - schedule_pk: Primary key of the schedule the marks belong to.
+
+        Returns:
+        - Redirects to the edit schedule page with appropriate messages.
+        """
+        schedule = get_object_or_404(Schedule, pk=schedule_pk)
+        form = BulkStudentMarkForm(
+            request.POST, students=get_schedule_students(schedule)
+        )
+
+        if form.is_valid():
+            student_marks = [
+                StudentMark(schedule=schedule, student=student, mark=mark)
+                for student, mark in form.get_marks()
+            ]
+            with transaction.atomic():
+                StudentMark.objects.bulk_create(
+                    student_marks,
+                    update_conflicts=True,
+                    unique_fields=['schedule', 'student'],
+                    update_fields=['mark', 'updated_at']
+                )
+                refresh_mark_summaries(
+                    (student_mark.student_id, schedule.pk)
+                    for student_mark in student_marks
+                )
+                invalidate_weeks([(schedule.study_group_id, schedule.date)])
+            messages.success(
+                request, f"{len(student_marks)} student mark(s) saved."
+            )
+
+        # Form validation error message
+        for field, errors in form.errors.items():
+            messages.error(
+                request, f"Error in {form[field].label}: {', '.join(errors)}"
+            )
+
+        return redirect(reverse('tutor:edit_schedule', args=[schedule_pk]))
@@ -2,6 +2,7 @@
 ASGI config for uni_flow project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+It is served by gunicorn with uvicorn workers, see gunicorn_asgi.py.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
@@ -0,0 +1,22 @@
+"""
+Optional gunicorn configuration serving the ASGI application with uvicorn
+workers. The Procfile serves the WSGI application by default.
+
+The views and the allauth middleware are sync, so Django runs every request
+in a thread and the ASGI mode does not serve more concurrent requests than
+the WSGI workers. Streamed exports are buffered in memory under ASGI.
+
+The database connections of a request are opened in the request's thread and
+cannot be reused by later requests, so this configuration turns persistent
+connections off unless CONN_MAX_AGE is set explicitly.
+
+Usage:
+    gunicorn uni_flow.asgi:application -c uni_flow/gunicorn_asgi.py
+"""
+import os
+
+worker_class = 'uvicorn.workers.UvicornWorker'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+if 'CONN_MAX_AGE' not in os.environ:
+    raw_env = ['CONN_MAX_AGE=0']
@@ -14,6 +14,7 @@ from pathlib import Path
 import os
 import sys
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 if os.path.isfile('env.py'):
     import env
 
@@ -73,11 +74,30 @@ MIDDLEWARE = [
     'allauth.account.middleware.AccountMiddleware',
 ]
 
+# Development-time N+1 query detection: statements repeated more often than
+# the threshold within a request are logged, and raised in tests
+N_PLUS_ONE_DETECTION = DEBUG or 'test' in sys.argv
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("N_PLUS_ONE_THRESHOLD", 5))
+N_PLUS_ONE_RAISE = 'test' in sys.argv
+if N_PLUS_ONE_DETECTION:
+    MIDDLEWARE.insert(0, 'main.middleware.NPlusOneQueryMiddleware')
+
+# Opt-in request instrumentation: Server-Timing headers, a JSON log line per
+# request and per-view percentiles on the staff timing page
+REQUEST_TIMING = os.environ.get("REQUEST_TIMING") == "True"
+REQUEST_TIMING_WINDOW = int(os.environ.get("REQUEST_TIMING_WINDOW", 500))
+REQUEST_TIMING_NAMESPACES = ('tutor', 'student')
+if REQUEST_TIMING:
+    MIDDLEWARE.insert(0, 'main.middleware.RequestTimingMiddleware')
+
 ROOT_URLCONF = 'uni_flow.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': (
+            'main.timing.TimedDjangoTemplates' if REQUEST_TIMING
+            else 'django.template.backends.django.DjangoTemplates'
+        ),
         'DIRS': [TEMPLATES_DIR],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -110,9 +130,69 @@ DATABASES = {
     'default': dj_database_url.parse(os.environ.get("DATABASE_URL"))
 }
 
+# Persistent connections: a connection is kept for CONN_MAX_AGE seconds
+# ("None" keeps it for the life of the worker) and, with CONN_HEALTH_CHECKS,
+# checked before a new request reuses it, so a restarted database server does
+# not fail the request. The WSGI workers of the Procfile reuse them; under the
+# optional ASGI server the connections belong to the thread of a request, so
+# gunicorn_asgi.py sets CONN_MAX_AGE to 0.
+try:
+    DATABASES['default']['CONN_MAX_AGE'] = (
+        None if os.environ.get("CONN_MAX_AGE") == "None"
+        else int(os.environ.get("CONN_MAX_AGE", 60))
+    )
+except ValueError:
+    raise ImproperlyConfigured(
+        "CONN_MAX_AGE must be a number of seconds or None."
+    )
+DATABASES['default']['CONN_HEALTH_CHECKS'] = (
+    os.environ.get("CONN_HEALTH_CHECKS", "True") == "True"
+)
+
+# Connection pooling: with DATABASE_POOLER=pgbouncer the application connects
+# to PgBouncer in transaction pooling mode, which shares server connections
+# between the transactions of all workers. Cursors cannot outlive a
+# transaction there, so server-side cursors are disabled.
+DATABASE_POOLER = os.environ.get("DATABASE_POOLER", "")
+if DATABASE_POOLER == "pgbouncer":
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
 if 'test' in sys.argv:
     DATABASES['default']['ENGINE'] = 'django.db.backends.sqlite3'
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# Local memory by default; set REDIS_URL to share the cache between the
+# processes (requires the redis package)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'uniflow',
+    }
+}
+if os.environ.get("REDIS_URL"):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get("REDIS_URL"),
+    }
+
+if 'test' in sys.argv:
+    # Cached data would outlive the rolled back test transactions
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+
+# Cache alias and lifetime in seconds of the weekly schedule grids
+SCHEDULE_CACHE_ALIAS = 'default'
+SCHEDULE_CACHE_TIMEOUT = 60 * 60
+
+# Number of web server processes (gunicorn reads the same variable). The
+# version counters of the schedule cache invalidate the cached data of every
+# process only when the cache is shared, so more than one worker should set
+# REDIS_URL (checked by main.checks).
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", 1))
+
 CSRF_TRUSTED_ORIGINS = [
     "https://*.codeinstitute-ide.net/",
     "https://*.herokuapp.com"
@@ -1,5 +1,10 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_migrate,
+    post_save
+)
 
 
 class UsersConfig(AppConfig):
@@ -7,6 +12,20 @@ class UsersConfig(AppConfig):
     name = "users"
 
     def ready(self):
+        from django.contrib.auth.models import Group, User
+        from users.models import UserProfile
         import users.signals
+        import users.roles
+        import users.roster
 
         post_migrate.connect(users.signals.create_groups, sender=self)
+        post_save.connect(users.roles.clear_group_ids, sender=Group)
+        post_delete.connect(users.roles.clear_group_ids, sender=Group)
+        post_init.connect(
+            users.roster.remember_profile_group, sender=UserProfile
+        )
+        post_save.connect(users.roster.invalidate_profile, sender=UserProfile)
+        post_delete.connect(
+            users.roster.invalidate_profile, sender=UserProfile
+        )
+        post_save.connect(users.roster.invalidate_user, sender=User)
@@ -1,11 +1,12 @@
-from django.contrib.auth.models import Group
-from users.models import UserProfile
+from users.roles import get_user_role
 
 
 def user_profile_parameters(request):
     """
     Context processor to provide user-specific profile data to the template.
 
+    The data is resolved once per request by `users.roles.get_user_role`.
+
     Args:
         request (HttpRequest): The HTTP request object containing the user
         details.
@@ -20,25 +21,13 @@ def user_profile_parameters(request):
             - 'user_checked': Boolean indicating if the user's profile is
             verified (checked).
     """
-    user_study_group = []
-    user_checked = False
-    if request.user.is_authenticated:
-        user_profile = UserProfile.objects.filter(
-            user=request.user
-        )
-        if user_profile.exists():
-            first_profile = user_profile.first()
-            user_study_group = first_profile.study_group
-            user_checked = first_profile.checked
-        tutor_group = Group.objects.get(name="Tutor")
-        student_group = Group.objects.get(name="Student")
-        user_groups = request.user.groups.all()
+    user_role = get_user_role(request.user)
 
     return {
-        'is_tutor': (tutor_group in user_groups)
-        if request.user.is_authenticated else False,
-        'is_student': (student_group in user_groups)
-        if request.user.is_authenticated else False,
-        'user_study_group': user_study_group,
-        'user_checked': user_checked
+        'is_tutor': user_role.is_tutor,
+        'is_student': user_role.is_student,
+        'user_study_group': (
+            user_role.study_group if user_role.profile else []
+        ),
+        'user_checked': user_role.checked
     }
@@ -0,0 +1,114 @@
+from django.contrib.auth.models import Group, User
+from django.db.models import Exists, OuterRef
+
+from users.models import UserProfile
+
+TUTOR_GROUP = 'Tutor'
+STUDENT_GROUP = 'Student'
+
+# Group IDs do not change while the process is running, so they are loaded
+# once and shared by every request.
+_group_ids = {}
+
+
+def get_group_ids():
+    """
+    Returns the IDs of the Tutor and Student groups, loading them from the
+    database only on the first call.
+
+    Returns:
+        dict: A dictionary mapping the group name to its ID.
+    """
+    if len(_group_ids) < 2:
+        _group_ids.update(
+            Group.objects.filter(
+                name__in=[TUTOR_GROUP, STUDENT_GROUP]
+            ).values_list('name', 'id')
+        )
+    return _group_ids
+
+
+def clear_group_ids(**kwargs):
+    """ Clears the cached group IDs (used as a signal receiver). """
+    _group_ids.clear()
+
+
+class UserRole:
+    """
+    The role and profile of a user resolved once per request.
+
+    Attributes:
+        is_tutor (bool): Indicates if the user belongs to the "Tutor" group.
+        is_student (bool): Indicates if the user belongs to the "Student"
+        group.
+        profile (UserProfile): The user's profile or None if it does not
+        exist.
+    """
+    def __init__(self, is_tutor=False, is_student=False, profile=None):
+        self.is_tutor = is_tutor
+        self.is_student = is_student
+        self.profile = profile
+
+    @property
+    def study_group(self):
+        """ Returns the study group of the user's profile, if available. """
+        return self.profile.study_group if self.profile else None
+
+    @property
+    def checked(self):
+        """ Returns True if the user's profile is verified (checked). """
+        return self.profile.checked if self.profile else False
+
+
+def resolve_user_role(user):
+    """
+    Resolves the role and profile of the user with a single query.
+
+    Args:
+        user (User): The user whose role is resolved.
+
+    Returns:
+        UserRole: The role and profile of the user.
+    """
+    if not user.is_authenticated:
+        return UserRole()
+
+    group_ids = get_group_ids()
+    memberships = User.groups.through.objects.filter(user=OuterRef('pk'))
+    user_data = User.objects.select_related(
+        'userprofile__study_group'
+    ).annotate(
+        is_tutor=Exists(
+            memberships.filter(group=group_ids.get(TUTOR_GROUP))
+        ),
+        is_student=Exists(
+            memberships.filter(group=group_ids.get(STUDENT_GROUP))
+        ),
+    ).get(pk=user.pk)
+
+    try:
+        profile = user_data.userprofile
+    except UserProfile.DoesNotExist:
+        profile = None
+
+    return UserRole(user_data.is_tutor, user_data.is_student, profile)
+
+
+def get_user_role(user):
+    """
+    Returns the role of the user, resolving it only once per user instance.
+
+    The user instance is loaded anew for every request, so the role is
+    computed once per request and shared by views and context processors.
+
+    Args:
+        user (User): The user whose role is requested.
+
+    Returns:
+        UserRole: The role and profile of the user.
+    """
+    try:
+        return user._user_role
+    except AttributeError:
+        user._user_role = resolve_user_role(user)
+        return user._user_role
@@ -0,0 +1,95 @@
+from django.contrib.auth.models import User
+
+from dictionaries.schedule_cache import (
+    bump_versions_on_commit,
+    get_cache,
+    get_timeout,
+    get_version
+)
+
+# The only fields shown for the students of a roster
+ROSTER_FIELDS = ('username', 'first_name', 'last_name')
+
+
+def get_roster_version_key(study_group_id):
+    """ Returns the cache key of the version counter of a roster. """
+    return f"roster:version:{study_group_id}"
+
+
+def get_study_group_students(study_group_id):
+    """
+    Returns the checked students of a study group.
+
+    The list is cached under the version of the study group's roster, which
+    changes whenever a profile joins or leaves the group or a student is
+    renamed.
+
+    Args:
+        study_group_id (int): The study group.
+
+    Returns:
+        list: User instances with the name fields only, ordered by name.
+    """
+    cache = get_cache()
+    version = get_version(get_roster_version_key(study_group_id))
+    key = f"roster:students:{study_group_id}:{version}"
+    students = cache.get(key)
+    if students is None:
+        students = list(
+            User.objects.filter(
+                userprofile__study_group=study_group_id,
+                userprofile__checked=True
+            ).only(*ROSTER_FIELDS).order_by(
+                'last_name', 'first_name', 'username'
+            )
+        )
+        cache.set(key, students, get_timeout())
+    return students
+
+
+def invalidate_rosters(study_group_ids):
+    """
+    Invalidates the cached rosters of study groups.
+
+    Args:
+        study_group_ids (iterable): The study groups. None values are
+        ignored.
+    """
+    bump_versions_on_commit({
+        get_roster_version_key(study_group_id)
+        for study_group_id in study_group_ids
+        if study_group_id is not None
+    })
+
+
+def remember_profile_group(sender, instance, **kwargs):
+    """
+    Stores the study group a profile was loaded with, so moving the student
+    invalidates the previous roster as well.
+    """
+    instance._loaded_study_group_id = instance.__dict__.get('study_group_id')
+
+
+def invalidate_profile(sender, instance, **kwargs):
+    """ Invalidates the rosters of a saved or deleted profile. """
+    invalidate_rosters({
+        instance.__dict__.get('study_group_id'),
+        getattr(instance, '_loaded_study_group_id', None)
+    })
+    remember_profile_group(sender, instance)
+
+
+def invalidate_user(sender, instance, update_fields=None, **kwargs):
+    """
+    Invalidates the roster of a saved student, as the name may have changed.
+    Saves updating other fields only, e.g. the last login, are ignored.
+    """
+    if update_fields is not None and not set(update_fields) & set(
+        ROSTER_FIELDS
+    ):
+        return
+    invalidate_rosters(
+        User.objects.filter(pk=instance.pk).values_list(
+            'userprofile__study_group', flat=True
+        )
+    )
@@ -4,6 +4,7 @@ from django.contrib.auth.models import User, Group
 from dictionaries.models import StudyGroup
 from users.models import UserProfile
 from users.context_processors import user_profile_parameters
+from users.roles import get_group_ids
 
 
 class ContextProcessorsTests(TestCase):
@@ -55,3 +56,39 @@ class ContextProcessorsTests(TestCase):
 
         self.assertIn('user_checked', context)
         self.assertTrue(context['user_checked'])
+
+    def test_user_profile_parameters_are_resolved_once(self):
+        """
+        Tests that the profile and groups are resolved with a single query
+        and reused for the rest of the request.
+        """
+        get_group_ids()
+        request = self.factory.get('/')
+        request.user = User.objects.get(pk=self.student_user.pk)
+
+        with self.assertNumQueries(1):
+            user_profile_parameters(request)
+
+        with self.assertNumQueries(0):
+            context = user_profile_parameters(request)
+
+        self.assertTrue(context['is_student'])
+        self.assertEqual(context['user_study_group'], self.study_group)
+
+    def test_user_without_profile(self):
+        """
+        Tests that a tutor without a profile gets empty profile data.
+        """
+        tutor_user = User.objects.create_user(
+            username='tutor@email.com',
+            password='Password123!'
+        )
+        tutor_user.groups.add(Group.objects.get(name='Tutor'))
+        request = self.factory.get('/')
+        request.user = tutor_user
+        context = user_profile_parameters(request)
+
+        self.assertTrue(context['is_tutor'])
+        self.assertFalse(context['is_student'])
+        self.assertEqual(context['user_study_group'], [])
+        self.assertFalse(context['user_checked'])
@@ -0,0 +1,143 @@
+from datetime import date
+
+from django.contrib.auth.models import Group, User
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from dictionaries.forms import StudentMarkForm
+from dictionaries.models import Schedule, StudyGroup, Subject
+from dictionaries.schedule_cache import get_cache
+from users.models import UserProfile
+from users.roster import get_study_group_students
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'roster-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RosterTests(TestCase):
+    """ Test suite for the cached rosters of the study groups. """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up two study groups, two checked students and an unchecked
+        student of the first group.
+        """
+        cls.group_a = StudyGroup.objects.create(name="Group A")
+        cls.group_b = StudyGroup.objects.create(name="Group B")
+        cls.anna = User.objects.create_user(
+            username="anna", first_name="Anna", last_name="Adams"
+        )
+        cls.bob = User.objects.create_user(
+            username="bob", first_name="Bob", last_name="Brown"
+        )
+        cls.carl = User.objects.create_user(username="carl")
+        UserProfile.objects.create(
+            user=cls.anna, study_group=cls.group_a, checked=True
+        )
+        UserProfile.objects.create(
+            user=cls.bob, study_group=cls.group_a, checked=True
+        )
+        UserProfile.objects.create(user=cls.carl, study_group=cls.group_a)
+
+    def setUp(self):
+        """ Starts every test with an empty cache. """
+        get_cache().clear()
+
+    def test_roster_lists_checked_students_by_name(self):
+        """
+        Test that the roster holds the checked students of the group ordered
+        by name and is served from the cache.
+        """
+        self.assertEqual(
+            get_study_group_students(self.group_a.pk), [self.anna, self.bob]
+        )
+        with self.assertNumQueries(0):
+            students = get_study_group_students(self.group_a.pk)
+            names = [student.get_full_name() for student in students]
+
+        self.assertEqual(names, ["Anna Adams", "Bob Brown"])
+
+    def test_moved_profile_invalidates_both_rosters(self):
+        """ Test that moving a student refreshes both study groups. """
+        get_study_group_students(self.group_a.pk)
+        get_study_group_students(self.group_b.pk)
+        profile = UserProfile.objects.get(user=self.bob)
+        profile.study_group = self.group_b
+        profile.save()
+
+        self.assertEqual(
+            get_study_group_students(self.group_a.pk), [self.anna]
+        )
+        self.assertEqual(get_study_group_students(self.group_b.pk), [self.bob])
+
+    def test_checked_and_deleted_profiles_invalidate_roster(self):
+        """ Test that checking or deleting a profile refreshes the roster. """
+        get_study_group_students(self.group_a.pk)
+        UserProfile.objects.filter(user=self.carl).get().delete()
+        profile = UserProfile.objects.get(user=self.bob)
+        profile.checked = False
+        profile.save()
+
+        self.assertEqual(
+            get_study_group_students(self.group_a.pk), [self.anna]
+        )
+
+    def test_renamed_student_invalidates_roster(self):
+        """
+        Test that renaming a student refreshes the roster while a login
+        keeps it.
+        """
+        get_study_group_students(self.group_a.pk)
+        self.bob.save(update_fields=['last_login'])
+        with self.assertNumQueries(0):
+            get_study_group_students(self.group_a.pk)
+
+        self.bob.last_name = "Baker"
+        self.bob.save()
+
+        self.assertEqual(
+            get_study_group_students(self.group_a.pk)[1].last_name, "Baker"
+        )
+
+    def test_mark_form_accepts_roster_students_only(self):
+        """ Test that the mark form rejects students outside the roster. """
+        students = get_study_group_students(self.group_a.pk)
+
+        form = StudentMarkForm(
+            data={'student': self.anna.pk, 'mark': 80}, students=students
+        )
+        self.assertTrue(form.is_valid())
+
+        form = StudentMarkForm(
+            data={'student': self.carl.pk, 'mark': 80}, students=students
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn('student', form.errors)
+
+    def test_edit_schedule_lists_roster(self):
+        """
+        Test that the student choices of the lesson page are the roster of
+        the lesson's study group.
+        """
+        tutor = User.objects.create_user(username="tutor")
+        tutor.groups.add(Group.objects.get(name="Tutor"))
+        schedule = Schedule.objects.create(
+            study_group=self.group_a,
+            date=date(2024, 9, 3),
+            order_number=1,
+            subject=Subject.objects.create(name="Math")
+        )
+        client = Client()
+        client.force_login(tutor)
+
+        response = client.get(
+            reverse('tutor:edit_schedule', args=[schedule.pk])
+        )
+
+        self.assertEqual(response.context['students'], [self.anna, self.bob])
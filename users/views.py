@@ -2,14 +2,17 @@ from django.contrib.auth import login
 from django.shortcuts import redirect
 from allauth.account.views import LoginView, SignupView
 
+from users.roles import get_user_role
+
 
 class CustomAuthMixin:
     """ Mixin to handle redirection based on the user's group. """
     def redirect_based_on_group(self, user):
         """Redirects user based on group membership."""
-        if user.groups.filter(name='Student').exists():
+        user_role = get_user_role(user)
+        if user_role.is_student:
             return redirect('student:dashboard')
-        elif user.groups.filter(name='Tutor').exists():
+        elif user_role.is_tutor:
             return redirect('tutor:schedule')
 
         return redirect('home')  # Default redirect